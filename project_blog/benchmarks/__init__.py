@@ -0,0 +1,33 @@
+"""
+Package that contains benchmark scripts, run them from the project directory, e.g.:-
+    python -m benchmarks.login_throttle
+
+Each script runs against a throw-away test database, the same way the test runner does,
+so it never touches db.sqlite3.
+"""
+from contextlib import contextmanager
+from typing import Iterator
+import os
+
+import django
+
+
+def setup() -> None:
+    """Function used to configure Django for a benchmark script"""
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "project_blog.settings")
+    django.setup()
+
+
+@contextmanager
+def test_database() -> Iterator[None]:
+    """Context manager that creates a test database and destroys it on exit"""
+    from django.db import connection
+    from django.test.utils import setup_test_environment, teardown_test_environment
+
+    setup_test_environment()
+    old_name: str = connection.creation.create_test_db(verbosity=0)
+    try:
+        yield
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+        teardown_test_environment()
@@ -0,0 +1,120 @@
+"""
+Benchmark of the post list under concurrent readers, WSGI vs ASGI:-
+    Sends the same page request from concurrent readers through
+        - wsgi: PostsListView behind the WSGI handler, one thread per reader.
+        - asgi-sync: PostsListView behind the ASGI handler, every request hops to a thread.
+        - asgi-async: AsyncPostsListView behind the ASGI handler, served on the event loop.
+    and reports requests per second & latency percentiles.
+
+Usage:
+    python -m benchmarks.asgi_posts [--posts 200] [--requests 400] [--concurrency 16] [--cache]
+
+Notes:
+    - Requests are sent in process through the Django test clients, there is no network or server,\
+        the numbers compare the handler & view overhead, not a deployment.
+    - The post list cache is disabled unless --cache is passed, so every request reaches the database.
+"""
+from benchmarks import setup, test_database
+from concurrent.futures import ThreadPoolExecutor
+import argparse
+import asyncio
+import statistics
+import time
+
+
+def summarize(latencies: list[float], wall: float) -> dict:
+    """Function that turns request latencies into throughput & percentiles"""
+    latencies = sorted(latencies)
+    return {
+        "rps": len(latencies) / wall,
+        "p50": statistics.median(latencies) * 1000,
+        "p95": latencies[int(len(latencies) * 0.95) - 1] * 1000,
+    }
+
+
+def run_wsgi(url: str, requests: int, concurrency: int) -> dict:
+    """Function used to send requests through the WSGI handler from a pool of threads"""
+    from django.db import connection
+    from django.test import Client
+
+    def read(_: int) -> float:
+        started: float = time.perf_counter()
+        response = Client().get(url)
+        assert response.status_code == 200, response.status_code
+        return time.perf_counter() - started
+
+    def read_and_close(index: int) -> float:
+        try:
+            return read(index)
+        finally:
+            connection.close()
+
+    started: float = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        latencies: list[float] = list(executor.map(read_and_close, range(requests)))
+    return summarize(latencies, time.perf_counter() - started)
+
+
+async def run_asgi(url: str, requests: int, concurrency: int) -> dict:
+    """Function used to send requests through the ASGI handler from concurrent tasks"""
+    from django.test import AsyncClient
+
+    semaphore: asyncio.Semaphore = asyncio.Semaphore(concurrency)
+    client: AsyncClient = AsyncClient()
+
+    async def read() -> float:
+        async with semaphore:
+            started: float = time.perf_counter()
+            response = await client.get(url)
+            assert response.status_code == 200, response.status_code
+            return time.perf_counter() - started
+
+    started: float = time.perf_counter()
+    latencies: list[float] = await asyncio.gather(*(read() for _ in range(requests)))
+    return summarize(latencies, time.perf_counter() - started)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--posts", type=int, default=200)
+    parser.add_argument("--requests", type=int, default=400)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--page-size", type=int, default=20)
+    parser.add_argument("--cache", action="store_true", help="Keep the post list cache enabled.")
+    args = parser.parse_args()
+    setup()
+
+    from django.test.utils import override_settings
+    from django.urls import reverse
+    from user_authentication.models import User
+    from blog.models import Post
+
+    caches: dict | None = None if args.cache else {
+        "default": {"BACKEND": "django.core.cache.backends.dummy.DummyCache"}
+    }
+    with test_database(), override_settings(**({"CACHES": caches} if caches else {})):
+        author: User = User.objects.create_user(username="author", email="author@example.com", password="x")
+        Post.objects.bulk_create(
+            Post(title=f"Post {number}", slug=f"post-{number}", content="content " * 50, author=author)
+            for number in range(args.posts)
+        )
+        query: str = f"?page_size={args.page_size}"
+        results: dict[str, dict] = {
+            "wsgi": run_wsgi(reverse("list-posts") + query, args.requests, args.concurrency),
+            "asgi-sync": asyncio.run(run_asgi(reverse("list-posts") + query, args.requests, args.concurrency)),
+            "asgi-async": asyncio.run(
+                run_asgi(reverse("async-list-posts") + query, args.requests, args.concurrency)
+            ),
+        }
+
+    print(
+        f"{args.requests} page reads ({args.page_size} of {args.posts} posts) by {args.concurrency} "
+        f"concurrent readers, cache {'on' if args.cache else 'off'}"
+    )
+    print(f"{'mode':<12} {'req/s':>8} {'p50 ms':>8} {'p95 ms':>8}")
+    for mode, result in results.items():
+        print(f"{mode:<12} {result['rps']:>8.1f} {result['p50']:>8.2f} {result['p95']:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
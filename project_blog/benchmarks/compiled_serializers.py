@@ -0,0 +1,68 @@
+"""
+Benchmark of post serialization, DRF vs compiled serializers:-
+    Serializes every post with its author through
+        - drf: PostSerializer(PostSerializer.setup_queryset(posts), many=True).data
+        - compiled: compile_serializer(PostSerializer).serialize(posts), values_list rows & a generated function.
+    and reports rows per second, the database read included.
+
+Usage:
+    python -m benchmarks.compiled_serializers [--posts 10000 100000] [--repeat 3]
+
+Notes:
+    - Each size is filled on top of the previous one, the best of --repeat runs is reported.
+"""
+from benchmarks import setup, test_database
+import argparse
+import time
+
+
+def best_rate(function, rows: int, repeat: int) -> float:
+    """Function that returns the best rows per second out of repeated calls"""
+    best: float = float("inf")
+    for _ in range(repeat):
+        started: float = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - started)
+    return rows / best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--posts", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    setup()
+
+    from user_authentication.models import User
+    from blog.compiled import compile_serializer
+    from blog.models import Post
+    from blog.serializer import PostSerializer
+
+    with test_database():
+        authors: list[User] = [
+            User.objects.create_user(
+                username=f"author_{number}", email=f"author{number}@example.com", password="x",
+                first_name="Joe", last_name="Doe",
+            )
+            for number in range(50)
+        ]
+        compiled = compile_serializer(PostSerializer)
+        print(f"{'posts':>8} {'drf rows/s':>12} {'compiled rows/s':>16} {'speedup':>8}")
+        for size in sorted(args.posts):
+            existing: int = Post.objects.count()
+            Post.objects.bulk_create(
+                (
+                    Post(title=f"Post {number}", slug=f"post-{number}", content="content " * 50,
+                         author=authors[number % len(authors)])
+                    for number in range(existing, size)
+                ),
+                batch_size=5000,
+            )
+            posts = PostSerializer.setup_queryset(Post.objects.order_by("-created_at", "-id"))
+            drf: float = best_rate(lambda: PostSerializer(posts.all(), many=True).data, size, args.repeat)
+            fast: float = best_rate(lambda: compiled.serialize(posts.all()), size, args.repeat)
+            print(f"{size:>8} {drf:>12.0f} {fast:>16.0f} {fast / drf:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
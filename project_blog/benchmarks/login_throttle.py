@@ -0,0 +1,78 @@
+"""
+Benchmark of LoginView under a hostile request rate:-
+    Sends a flood of failed login attempts for one email from one address, with and without
+    LoginRateThrottle, and reports the CPU time spent and the password hashes that ran.
+
+Usage:
+    python -m benchmarks.login_throttle [--requests 300]
+"""
+from benchmarks import setup, test_database
+import argparse
+import logging
+import time
+
+
+def flood(client, url: str, requests: int) -> dict:
+    """Function used to send failed login attempts and measure the CPU they cost"""
+    from django.contrib.auth import base_user
+
+    hashes: list[int] = [0]
+    check_password = base_user.check_password
+
+    def counting_check_password(*args, **kwargs):
+        hashes[0] += 1
+        return check_password(*args, **kwargs)
+
+    statuses: dict[int, int] = {}
+    base_user.check_password = counting_check_password
+    try:
+        cpu_start: float = time.process_time()
+        wall_start: float = time.perf_counter()
+        for _ in range(requests):
+            response = client.post(url, {"email": "victim@example.com", "password": "not-the-password1"})
+            statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+        cpu: float = time.process_time() - cpu_start
+        wall: float = time.perf_counter() - wall_start
+    finally:
+        base_user.check_password = check_password
+    return {"cpu": cpu, "wall": wall, "hashes": hashes[0], "statuses": statuses}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=300)
+    args = parser.parse_args()
+    setup()
+    # Every rejected attempt would be logged as a warning
+    logging.getLogger("django.request").setLevel(logging.ERROR)
+
+    from django.test import Client
+    from django.urls import reverse
+    from user_authentication.models import User
+    from user_authentication.throttling import login_throttle_backend
+    from user_authentication.views import LoginView
+
+    with test_database():
+        User.objects.create_user(username="victim", email="victim@example.com", password="1234!Example.")
+        url: str = reverse("login-reset-view")
+        results: dict[str, dict] = {}
+        # Without throttling every attempt costs a full PBKDF2 verification
+        LoginView.login_throttle_class, throttle_class = None, LoginView.login_throttle_class
+        try:
+            results["unthrottled"] = flood(Client(), url, args.requests)
+        finally:
+            LoginView.login_throttle_class = throttle_class
+        login_throttle_backend.reset()
+        results["throttled"] = flood(Client(), url, args.requests)
+
+    print(f"{args.requests} failed login attempts for one email from one address")
+    print(f"{'mode':<12} {'cpu s':>8} {'wall s':>8} {'cpu ms/req':>11} {'hashes':>7}  statuses")
+    for mode, result in results.items():
+        print(
+            f"{mode:<12} {result['cpu']:>8.3f} {result['wall']:>8.3f} "
+            f"{result['cpu'] * 1000 / args.requests:>11.2f} {result['hashes']:>7}  {result['statuses']}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Benchmark of post search, FTS5 index vs icontains scans:-
+    Fills the posts table with generated text, then looks up common & rare words with
+        - fts: blog.search.search_posts, first page ranked by bm25 with snippets.
+        - icontains: Post.objects.filter(Q(title__icontains=word) | Q(content__icontains=word)), first page.
+    and reports the average time per search.
+
+Usage:
+    python -m benchmarks.post_search [--posts 100000] [--repeat 5]
+    python -m benchmarks.post_search --posts 1000000
+
+Notes:
+    - The index is filled by the triggers of migration blog 0002_post_fts while the posts are inserted.
+    - icontains stops as soon as a page is found, common words are cheap for it, rare words scan the table.\
+        FTS5 ranks every match, its cost follows the number of matches instead of the table size.
+"""
+from benchmarks import setup, test_database
+import argparse
+import itertools
+import random
+import time
+
+
+def words(count: int, rng: random.Random) -> list[str]:
+    """Function that returns a vocabulary of generated words"""
+    letters: str = "abcdefghijklmnopqrstuvwxyz"
+    return ["".join(rng.choice(letters) for _ in range(rng.randint(4, 9))) for _ in range(count)]
+
+
+def timed(function, repeat: int) -> float:
+    """Function that returns the average milliseconds a call takes"""
+    started: float = time.perf_counter()
+    for _ in range(repeat):
+        function()
+    return (time.perf_counter() - started) * 1000 / repeat
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--posts", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--page-size", type=int, default=20)
+    args = parser.parse_args()
+    setup()
+
+    from django.db.models import Q
+    from user_authentication.models import User
+    from blog.models import Post
+    from blog.search import build_match_query, search_posts
+
+    rng: random.Random = random.Random(42)
+    vocabulary: list[str] = words(20_000, rng)
+    # Zipf like frequencies, the first words are common & the last ones are rare
+    weights: list[float] = list(itertools.accumulate(1 / (rank + 1) for rank in range(len(vocabulary))))
+
+    with test_database():
+        author: User = User.objects.create_user(username="author", email="author@example.com", password="x")
+        started: float = time.perf_counter()
+        batch: list[Post] = []
+        for number in range(args.posts):
+            title: str = " ".join(rng.choices(vocabulary, cum_weights=weights, k=5))
+            content: str = " ".join(rng.choices(vocabulary, cum_weights=weights, k=80))
+            batch.append(Post(title=title, slug=f"post-{number}", content=content, author=author))
+            if len(batch) == 5000:
+                Post.objects.bulk_create(batch)
+                batch = []
+        Post.objects.bulk_create(batch)
+        print(f"Inserted & indexed {args.posts} posts in {time.perf_counter() - started:.1f}s")
+
+        print(f"{'word':<12} {'kind':<7} {'fts ms':>9} {'icontains ms':>13}")
+        for kind, word in (("common", vocabulary[0]), ("medium", vocabulary[500]), ("rare", vocabulary[-1])):
+            query: str = build_match_query(word)
+            fts: float = timed(lambda: search_posts(query, args.page_size + 1), args.repeat)
+            scan: float = timed(
+                lambda: list(
+                    Post.objects.filter(Q(title__icontains=word) | Q(content__icontains=word))
+                    .order_by("-created_at", "-id")[:args.page_size + 1]
+                ),
+                args.repeat,
+            )
+            print(f"{word:<12} {kind:<7} {fts:>9.2f} {scan:>13.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,228 @@
+"""
+File that contains Functions used to cache Post representations:-
+    - post_etag (function): Builds a strong ETag out of a post id & its last update time.
+    - post_detail_cache_key (function): Builds the cache key of a serialized post.
+    - get_post_detail (function): Returns serialized post from the cache or serializes it on a miss.
+    - get_posts_generation (function): Returns the current posts generation used as list cache version.
+    - bump_posts_generation (function): Moves every cached post list to a stale version in O(1).
+    - bump_posts_generation_on_commit (function): Bumps the posts generation once the current transaction commits.
+    - bulk_posts_write (function): Context manager that bumps the posts generation once for a whole bulk write.
+    - get_cached_posts_list (function): Returns a cached post list response body if any.
+    - set_cached_posts_list (function): Caches a post list response body.
+    - aget_cached_posts_list & aset_cached_posts_list (functions): Same as above for async views.
+    - get_posts_list_cache_stats (function): Returns hit & miss counters of the post list cache.
+
+Notes:
+    - A cached post is keyed by its id and updated_at, so saving a post makes a new key and the old entry\
+        is never read again and expires on its own, there is nothing to invalidate.
+    - Changes to the author profile are not part of the key, they show once the post changes\
+        or once the entry expires after BLOG_POST_CACHE_TIMEOUT seconds.
+    - Post lists are cached with the posts generation as cache version, any write to posts bumps the\
+        generation (see blog.signals) so readers never see stale lists and no key has to be scanned.
+    - Writes bump the generation after their transaction commits, a list read from the database before\
+        the commit is cached under the old generation that is never read again.
+    - Inside bulk_posts_write the per row bumps of the signal receivers are muted, e.g. a batch of 500 deletes\
+        bumps the generation once instead of 500 times.
+"""
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from rest_framework.serializers import Serializer
+from .models import Post
+from django.http import QueryDict
+from contextvars import ContextVar
+from datetime import datetime
+from typing import Iterator
+import contextlib
+import hashlib
+import time
+import uuid
+
+# Seconds a serialized post stays in the cache.
+POST_CACHE_TIMEOUT: int = getattr(settings, "BLOG_POST_CACHE_TIMEOUT", 60 * 60)
+# Seconds a post list stays in the cache.
+POSTS_LIST_CACHE_TIMEOUT: int = getattr(settings, "BLOG_POSTS_LIST_CACHE_TIMEOUT", 5 * 60)
+# True while a bulk write runs, the per row bumps are left to bulk_posts_write.
+_bulk_write: ContextVar[bool] = ContextVar("blog_posts_bulk_write", default=False)
+# Cache keys of the post list cache.
+POSTS_GENERATION_KEY: str = "blog:posts:generation"
+POSTS_LIST_HITS_KEY: str = "blog:posts:list:hits"
+POSTS_LIST_MISSES_KEY: str = "blog:posts:list:misses"
+
+
+def _version(updated_at: datetime) -> int:
+    """Function that turns updated_at into an integer version with microsecond precision"""
+    return int(updated_at.timestamp() * 1_000_000)
+
+
+def post_etag(post_id: uuid.UUID, updated_at: datetime) -> str:
+    """
+    Function used to build a strong ETag for a post.
+
+    Args:
+        - post_id (uuid): ID of the post.
+        - updated_at (datetime): Last time the post has been updated.
+
+    Returns:
+        - Quoted ETag string.
+    """
+    return f'"{post_id.hex}-{_version(updated_at)}"'
+
+
+def post_detail_cache_key(post_id: uuid.UUID, updated_at: datetime) -> str:
+    """Function used to build the cache key of a serialized post"""
+    return f"blog:post:{post_id.hex}:{_version(updated_at)}"
+
+
+def get_post_detail(post_id: uuid.UUID, updated_at: datetime, serializer_class: type[Serializer]) -> dict | None:
+    """
+    Function used to get the serialized representation of a post.
+
+    Args:
+        - post_id (uuid): ID of the post.
+        - updated_at (datetime): Last time the post has been updated.
+        - serializer_class (Serializer): Serializer used on a cache miss, must provide setup_queryset.
+
+    Returns:
+        - Serialized post or None in case the post was deleted meanwhile.
+    """
+    key: str = post_detail_cache_key(post_id, updated_at)
+    data: dict | None = cache.get(key)
+    if data is not None:
+        return data
+    # Cache miss, serialize the post
+    post: Post = serializer_class.setup_queryset(Post.objects.filter(id=post_id)).first()
+    if post is None:
+        return None
+    data = serializer_class(post).data
+    # Store under the version that has been read from the database
+    cache.set(post_detail_cache_key(post_id, post.updated_at), data, POST_CACHE_TIMEOUT)
+    return data
+
+
+def get_posts_generation() -> int:
+    """
+    Function used to read the current posts generation.
+
+    Returns:
+        - Generation number, starts from the current time in nanoseconds so a generation evicted\
+            from the cache never comes back with a value that has been used before.
+    """
+    generation: int | None = cache.get(POSTS_GENERATION_KEY)
+    if generation is None:
+        cache.add(POSTS_GENERATION_KEY, time.time_ns(), None)
+        generation = cache.get(POSTS_GENERATION_KEY, time.time_ns())
+    return generation
+
+
+async def aget_posts_generation() -> int:
+    """Function used to read the current posts generation from async code, see get_posts_generation"""
+    generation: int | None = await cache.aget(POSTS_GENERATION_KEY)
+    if generation is None:
+        await cache.aadd(POSTS_GENERATION_KEY, time.time_ns(), None)
+        generation = await cache.aget(POSTS_GENERATION_KEY, time.time_ns())
+    return generation
+
+
+def bump_posts_generation() -> None:
+    """Function used to invalidate every cached post list"""
+    try:
+        cache.incr(POSTS_GENERATION_KEY)
+    except ValueError:
+        # Generation is missing, start a new one
+        cache.set(POSTS_GENERATION_KEY, time.time_ns(), None)
+
+
+def bump_posts_generation_on_commit() -> None:
+    """Function used to invalidate every cached post list once the current transaction commits"""
+    if not _bulk_write.get():
+        transaction.on_commit(bump_posts_generation)
+
+
+@contextlib.contextmanager
+def bulk_posts_write() -> Iterator[None]:
+    """
+    Context manager used around bulk writes to posts, e.g. a batch of deletes sending post_delete per row.
+    Bumps made inside are muted, the generation is bumped once the block succeeded & its transaction commits.
+    """
+    token = _bulk_write.set(True)
+    try:
+        yield
+    finally:
+        _bulk_write.reset(token)
+    bump_posts_generation_on_commit()
+
+
+def _count(key: str) -> None:
+    """Function used to increment a counter in the cache"""
+    cache.add(key, 0, None)
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, 1, None)
+
+
+async def _acount(key: str) -> None:
+    """Function used to increment a counter in the cache from async code"""
+    await cache.aadd(key, 0, None)
+    try:
+        await cache.aincr(key)
+    except ValueError:
+        await cache.aset(key, 1, None)
+
+
+def posts_list_cache_key(params: QueryDict) -> str:
+    """Function used to build the cache key of a post list out of the query parameters"""
+    query: str = "&".join(f"{key}={value}" for key, value in sorted(params.lists()))
+    return f"blog:posts:list:{hashlib.md5(query.encode()).hexdigest()}"
+
+
+def get_cached_posts_list(params: QueryDict) -> tuple[object | None, int]:
+    """
+    Function used to look up a cached post list.
+
+    Args:
+        - params (QueryDict): Query parameters of the list request (page, filters).
+
+    Returns:
+        - Tuple of the cached body or None on a miss, and the generation that has been used,\
+            a miss should be stored with this generation with set_cached_posts_list.
+    """
+    generation: int = get_posts_generation()
+    data: object | None = cache.get(posts_list_cache_key(params), version=generation)
+    _count(POSTS_LIST_MISSES_KEY if data is None else POSTS_LIST_HITS_KEY)
+    return data, generation
+
+
+def set_cached_posts_list(params: QueryDict, generation: int, data: object) -> None:
+    """
+    Function used to cache a post list.
+
+    Args:
+        - params (QueryDict): Query parameters of the list request (page, filters).
+        - generation (int): Generation read before the list was fetched from the database.
+        - data (object): Response body.
+    """
+    cache.set(posts_list_cache_key(params), data, POSTS_LIST_CACHE_TIMEOUT, version=generation)
+
+
+async def aget_cached_posts_list(params: QueryDict) -> tuple[object | None, int]:
+    """Function used to look up a cached post list from async code, see get_cached_posts_list"""
+    generation: int = await aget_posts_generation()
+    data: object | None = await cache.aget(posts_list_cache_key(params), version=generation)
+    await _acount(POSTS_LIST_MISSES_KEY if data is None else POSTS_LIST_HITS_KEY)
+    return data, generation
+
+
+async def aset_cached_posts_list(params: QueryDict, generation: int, data: object) -> None:
+    """Function used to cache a post list from async code, see set_cached_posts_list"""
+    await cache.aset(posts_list_cache_key(params), data, POSTS_LIST_CACHE_TIMEOUT, version=generation)
+
+
+def get_posts_list_cache_stats() -> dict[str, int]:
+    """Function that returns hit & miss counters of the post list cache"""
+    counters: dict = cache.get_many([POSTS_LIST_HITS_KEY, POSTS_LIST_MISSES_KEY])
+    return {
+        "hits": counters.get(POSTS_LIST_HITS_KEY, 0),
+        "misses": counters.get(POSTS_LIST_MISSES_KEY, 0),
+    }
@@ -0,0 +1,183 @@
+"""
+File that contains the compiled representation layer of model serializers:-
+    - CompiledSerializer: Class that turns values_list rows into the dictionaries a ModelSerializer would build.
+    - compile_serializer (function): Returns the compiled serializer of a serializer class, compiled once\
+            & kept in a bounded LRU cache.
+
+Notes:
+    - The declared fields of the serializer are read once, then the source of a single function is generated\
+        that builds the whole dictionary, nested serializers included, out of a row tuple. Rows are fetched with\
+        QuerySet.values_list so no model instance, bound field or OrderedDict is created per row.
+    - Char, email, slug, text & integer fields are copied as is, UUIDs & ISO 8601 datetimes are formatted inline,\
+        every other field goes through the to_representation of the DRF field.
+    - The active timezone is resolved once per call of get_representation instead of once per datetime.
+    - Only plain model fields & nested model serializers can be compiled, SerializerMethodField,\
+        dotted sources & many=True serializers raise TypeError.
+"""
+from django.conf import settings
+from django.db.models import QuerySet
+from django.utils import timezone
+from rest_framework import fields, serializers, ISO_8601
+from rest_framework.settings import api_settings
+from typing import Callable, Self
+import datetime
+import functools
+
+# DRF fields whose representation of a database value is the value itself
+IDENTITY_FIELDS: tuple[type] = (fields.CharField, fields.IntegerField)
+# Number of compiled serializers kept, fieldsets come from the client so the cache must be bounded
+COMPILED_SERIALIZERS_CACHE_SIZE: int = getattr(settings, "BLOG_COMPILED_SERIALIZERS_CACHE_SIZE", 128)
+
+
+def iso_datetime(value: datetime.datetime, field_timezone: datetime.tzinfo | None) -> str:
+    """Function that formats a datetime the way DRF DateTimeField does with the ISO 8601 format"""
+    if field_timezone is not None:
+        value = value.astimezone(field_timezone) if timezone.is_aware(value) else \
+            timezone.make_aware(value, field_timezone)
+    elif timezone.is_aware(value):
+        value = timezone.make_naive(value, datetime.timezone.utc)
+    text: str = value.isoformat()
+    return text[:-6] + "Z" if text.endswith("+00:00") else text
+
+
+class CompiledSerializer:
+    """
+    Class used to serialize rows of a queryset with a generated function.
+
+    Attributes:
+        - value_fields (tuple): Lookups passed to QuerySet.values_list, in the order the function reads them.
+        - source (str): Generated source, useful when debugging.
+    """
+
+    def __init__(
+            self: Self,
+            serializer_class: type[serializers.ModelSerializer],
+            fields: tuple[str] | None = None,
+        ) -> None:
+        """
+        Compile a serializer class.
+
+        Args:
+            - serializer_class (ModelSerializer): Serializer class to compile.
+            - fields (tuple): Sparse fieldset passed to the serializer as fields=..., all fields if None.
+
+        Raises:
+            - TypeError: In case a declared field can not be compiled.
+        """
+        self.serializer_class: type[serializers.ModelSerializer] = serializer_class
+        self.value_fields: list[str] = []
+        self.namespace: dict[str, Callable] = {"iso_datetime": iso_datetime}
+        serializer: serializers.ModelSerializer = serializer_class() if fields is None else \
+            serializer_class(fields=fields)
+        body: str = self.compile_fields(serializer, "")
+        # The outer function binds the timezone, the inner one is called per row
+        self.source: str = (
+            "def build(timezone):\n"
+            "    def to_representation(row):\n"
+            f"        return {body}\n"
+            "    return to_representation\n"
+        )
+        exec(compile(self.source, f"<compiled {serializer_class.__name__}>", "exec"), self.namespace)
+        self.value_fields: tuple[str] = tuple(self.value_fields)
+        self.build: Callable[[datetime.tzinfo | None], Callable[[tuple], dict]] = self.namespace["build"]
+
+    def read(self: Self, lookup: str) -> str:
+        """Method that adds a lookup to the values_list & returns the expression reading it from the row"""
+        self.value_fields.append(lookup)
+        return f"row[{len(self.value_fields) - 1}]"
+
+    def compile_fields(self: Self, serializer: serializers.ModelSerializer, prefix: str) -> str:
+        """
+        Method used to generate the dictionary expression of a serializer.
+
+        Args:
+            - serializer (ModelSerializer): Serializer instance, its fields are built by DRF.
+            - prefix (str): Lookup of the relation the serializer is nested under, e.g. "author__".
+
+        Raises:
+            - TypeError: In case a field can not be compiled.
+
+        Returns:
+            - Source of a dictionary expression.
+        """
+        model = serializer.Meta.model
+        items: list[str] = []
+        for name, field in serializer.fields.items():
+            if field.write_only:
+                continue
+            source: str = field.source
+            if isinstance(field, serializers.SerializerMethodField) or "." in source or source == "*":
+                raise TypeError(f"{serializer.__class__.__name__}.{name} can not be compiled.")
+            model_field = model._meta.get_field(source)
+            if isinstance(field, serializers.ModelSerializer):
+                # Nested serializer, None in case the relation is empty
+                expression: str = self.compile_fields(field, f"{prefix}{source}__")
+                if model_field.null:
+                    expression = f"None if {self.read(prefix + source)} is None else {expression}"
+            elif isinstance(field, serializers.BaseSerializer):
+                raise TypeError(f"{serializer.__class__.__name__}.{name} can not be compiled.")
+            else:
+                value: str = self.read(prefix + source)
+                expression: str = self.compile_field(field, value)
+                if model_field.null and expression != value:
+                    expression = f"None if {value} is None else {expression}"
+            items.append(f"{name!r}: {expression}")
+        return "{" + ", ".join(items) + "}"
+
+    def compile_field(self: Self, field: fields.Field, value: str) -> str:
+        """Method that returns the expression representing a value read from the row"""
+        if isinstance(field, IDENTITY_FIELDS):
+            return value
+        if isinstance(field, fields.UUIDField) and field.uuid_format == "hex_verbose":
+            return f"str({value})"
+        if isinstance(field, fields.DateTimeField) and not hasattr(field, "timezone") and \
+                str(getattr(field, "format", api_settings.DATETIME_FORMAT)).lower() == ISO_8601:
+            return f"iso_datetime({value}, timezone)"
+        # Fall back to the DRF field
+        name: str = f"field_{len(self.namespace)}"
+        self.namespace[name] = field.to_representation
+        return f"{name}({value})"
+
+    def get_representation(self: Self) -> Callable[[tuple], dict]:
+        """Method that returns the function turning a row into a dictionary for the active timezone"""
+        return self.build(timezone.get_current_timezone() if settings.USE_TZ else None)
+
+    def rows(self: Self, queryset: QuerySet) -> QuerySet:
+        """Method that returns the queryset as the row tuples to_representation reads"""
+        return queryset.values_list(*self.value_fields)
+
+    def serialize(self: Self, queryset: QuerySet) -> list[dict]:
+        """
+        Method used to serialize a queryset.
+
+        Args:
+            - queryset (QuerySet): Rows to serialize, filters & ordering are kept.
+
+        Returns:
+            - List of dictionaries equal to the data of serializer_class(queryset, many=True).
+        """
+        to_representation: Callable[[tuple], dict] = self.get_representation()
+        return [to_representation(row) for row in self.rows(queryset)]
+
+    async def aserialize(self: Self, queryset: QuerySet) -> list[dict]:
+        """Method used to serialize a queryset from async code, see serialize"""
+        to_representation: Callable[[tuple], dict] = self.get_representation()
+        return [to_representation(row) async for row in self.rows(queryset)]
+
+
+@functools.lru_cache(maxsize=COMPILED_SERIALIZERS_CACHE_SIZE)
+def compile_serializer(
+        serializer_class: type[serializers.ModelSerializer],
+        fields: tuple[str] | None = None,
+    ) -> CompiledSerializer:
+    """
+    Function that returns the compiled serializer of a serializer class, compiled on first use.
+
+    Args:
+        - serializer_class (ModelSerializer): Serializer class to compile.
+        - fields (tuple): Sparse fieldset, each fieldset is compiled once while it stays in the cache.
+
+    Returns:
+        - CompiledSerializer instance.
+    """
+    return CompiledSerializer(serializer_class, fields)
@@ -0,0 +1,29 @@
+"""
+File that contains Functions used to load objects once per request:-
+    - get_request_post (function): Loads a post by id and keeps it on the request for the permission,\
+            serializer and view that handle the same request.
+"""
+from rest_framework.request import Request
+from .models import Post
+import uuid
+
+
+def get_request_post(request: Request, pk: uuid.UUID | str) -> Post | None:
+    """
+    Function used to load a post once per request.
+
+    Args:
+        - request (Request): Request the post is loaded for, the post is kept in request.loaded_posts.
+        - pk (uuid): ID of the post.
+
+    Returns:
+        - Post instance or None in case the post does not exist.
+    """
+    # Posts already loaded during this request
+    loaded: dict = getattr(request, "loaded_posts", None)
+    if loaded is None:
+        loaded = request.loaded_posts = {}
+    key: str = str(pk)
+    if key not in loaded:
+        loaded[key] = Post.objects.filter(id=pk).first()
+    return loaded[key]
@@ -0,0 +1,59 @@
+"""
+File that contains the backfill_post_summaries management command:-
+    - Command (BaseCommand): Computes excerpt, word count & reading time of posts saved before they existed.
+
+Usage:
+    python manage.py backfill_post_summaries --batch-size 1000
+    python manage.py backfill_post_summaries --all
+
+Notes:
+    - Posts are read by primary key in batches with only their id & content, one transaction per batch,\
+        the command can be stopped & started again.
+    - Only the summary columns are written, updated_at is kept & the search index triggers do not fire.
+"""
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.db import transaction
+from blog.cache import bump_posts_generation
+from blog.models import Post, SUMMARY_FIELDS
+from typing import Self
+import time
+
+
+class Command(BaseCommand):
+    """Command used to fill the summary columns of existing posts"""
+    help = "Computes excerpt, word count & reading time of posts that have none, in batches."
+
+    def add_arguments(self: Self, parser: CommandParser) -> None:
+        """Method that adds the command arguments"""
+        parser.add_argument("--batch-size", type=int, default=1000, help="Posts updated per batch.")
+        parser.add_argument("--all", action="store_true", help="Recompute every post, not only the empty ones.")
+
+    def handle(self: Self, *args, **options) -> None:
+        """Method that runs the command"""
+        batch_size: int = options["batch_size"]
+        if batch_size < 1:
+            raise CommandError("--batch-size must be a positive integer.")
+        posts: Post = Post.objects.order_by("id").only("id", "content")
+        if not options["all"]:
+            posts = posts.filter(word_count=0)
+        started_at: float = time.monotonic()
+        updated: int = 0
+        last_id = None
+        while True:
+            batch: list[Post] = list((posts if last_id is None else posts.filter(id__gt=last_id))[:batch_size])
+            if not batch:
+                break
+            for post in batch:
+                post.set_summary()
+            with transaction.atomic():
+                Post.objects.bulk_update(batch, SUMMARY_FIELDS)
+            updated += len(batch)
+            last_id = batch[-1].id
+            if options["verbosity"] >= 2:
+                self.stdout.write(f"{updated} posts updated")
+        # bulk_update sends no signal, drop the cached lists
+        if updated:
+            bump_posts_generation()
+        self.stdout.write(self.style.SUCCESS(
+            f"Updated {updated} posts in {time.monotonic() - started_at:.2f}s."
+        ))
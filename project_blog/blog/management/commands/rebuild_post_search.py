@@ -0,0 +1,26 @@
+"""
+File that contains the rebuild_post_search management command:-
+    - Command (BaseCommand): Rebuilds the full-text search index of posts out of the posts table.
+
+Usage:
+    python manage.py rebuild_post_search
+"""
+from django.core.management.base import BaseCommand, CommandError
+from blog.search import is_search_available, rebuild_search_index
+from typing import Self
+import time
+
+
+class Command(BaseCommand):
+    """Command used to rebuild the full-text search index of posts"""
+    help = "Rebuilds the post_fts full-text search index out of the posts table."
+
+    def handle(self: Self, *args, **options) -> None:
+        """Method that runs the command"""
+        if not is_search_available():
+            raise CommandError("Full-text search needs the SQLite FTS5 index.")
+        started_at: float = time.monotonic()
+        indexed: int = rebuild_search_index()
+        self.stdout.write(self.style.SUCCESS(
+            f"Indexed {indexed} posts in {time.monotonic() - started_at:.2f}s."
+        ))
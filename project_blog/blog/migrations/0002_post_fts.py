@@ -0,0 +1,76 @@
+# Full-text search index of posts, SQLite FTS5 only.
+
+from django.db import migrations
+
+# post_fts keeps its own copy of title & content, its rowid is the docid handed out by post_fts_map.
+# The rowid of blog_post itself is not used since VACUUM may renumber it.
+# Triggers keep the index in sync for every write, bulk_create & QuerySet.update included.
+# SQLite drops them whenever a migration rebuilds blog_post, such migrations create them again.
+TRIGGERS_SQL: list[str] = [
+    """
+    CREATE TRIGGER post_fts_after_insert AFTER INSERT ON blog_post BEGIN
+        INSERT INTO post_fts_map (post_id) VALUES (new.id);
+        INSERT INTO post_fts (rowid, title, content) VALUES (last_insert_rowid(), new.title, new.content);
+    END
+    """,
+    """
+    CREATE TRIGGER post_fts_after_delete AFTER DELETE ON blog_post BEGIN
+        DELETE FROM post_fts WHERE rowid = (SELECT docid FROM post_fts_map WHERE post_id = old.id);
+        DELETE FROM post_fts_map WHERE post_id = old.id;
+    END
+    """,
+    """
+    CREATE TRIGGER post_fts_after_update AFTER UPDATE OF title, content ON blog_post
+    WHEN old.title IS NOT new.title OR old.content IS NOT new.content BEGIN
+        UPDATE post_fts SET title = new.title, content = new.content
+        WHERE rowid = (SELECT docid FROM post_fts_map WHERE post_id = new.id);
+    END
+    """,
+]
+
+CREATE_SQL: list[str] = [
+    "CREATE VIRTUAL TABLE post_fts USING fts5(title, content, tokenize = 'unicode61 remove_diacritics 2')",
+    "CREATE TABLE post_fts_map (docid INTEGER PRIMARY KEY, post_id char(32) NOT NULL UNIQUE)",
+    *TRIGGERS_SQL,
+]
+
+DROP_SQL: list[str] = [
+    "DROP TRIGGER IF EXISTS post_fts_after_update",
+    "DROP TRIGGER IF EXISTS post_fts_after_delete",
+    "DROP TRIGGER IF EXISTS post_fts_after_insert",
+    "DROP TABLE IF EXISTS post_fts_map",
+    "DROP TABLE IF EXISTS post_fts",
+]
+
+
+def run(statements: list[str]):
+    """Function that returns a migration function running statements on SQLite only"""
+    def migrate(apps, schema_editor) -> None:
+        if schema_editor.connection.vendor != "sqlite":
+            return
+        for statement in statements:
+            schema_editor.execute(statement)
+    return migrate
+
+
+def index_existing_posts(apps, schema_editor) -> None:
+    """Function that indexes posts created before this migration"""
+    if schema_editor.connection.vendor != "sqlite":
+        return
+    schema_editor.execute("INSERT INTO post_fts_map (post_id) SELECT id FROM blog_post")
+    schema_editor.execute(
+        "INSERT INTO post_fts (rowid, title, content) "
+        "SELECT m.docid, p.title, p.content FROM post_fts_map m JOIN blog_post p ON p.id = m.post_id"
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("blog", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.RunPython(run(CREATE_SQL), run(DROP_SQL)),
+        migrations.RunPython(index_existing_posts, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,47 @@
+# Generated by Django 4.1.13 on 2026-10-18 03:31
+# Excerpt, word count & reading time of posts, filled for existing posts by `manage.py backfill_post_summaries`.
+
+from django.db import migrations, models
+import importlib
+
+post_fts = importlib.import_module("blog.migrations.0002_post_fts")
+
+
+def restore_search_triggers(apps, schema_editor) -> None:
+    """Function that creates the search triggers again, SQLite drops them when blog_post is rebuilt"""
+    if schema_editor.connection.vendor != "sqlite":
+        return
+    for statement in post_fts.DROP_SQL[:3] + post_fts.TRIGGERS_SQL:
+        schema_editor.execute(statement)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0002_post_fts'),
+    ]
+
+    operations = [
+        # Runs last when unapplied
+        migrations.RunPython(migrations.RunPython.noop, restore_search_triggers),
+        migrations.AddField(
+            model_name='post',
+            name='excerpt',
+            field=models.CharField(blank=True, default='', max_length=200),
+        ),
+        migrations.AddField(
+            model_name='post',
+            name='reading_time',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='post',
+            name='word_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddIndex(
+            model_name='post',
+            index=models.Index(fields=['reading_time'], name='post_reading_time_idx'),
+        ),
+        migrations.RunPython(restore_search_triggers, migrations.RunPython.noop),
+    ]
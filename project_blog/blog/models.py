@@ -1,31 +1,187 @@
 """
 File that contains Model classes for the API:-
+    - summarize_content (function): Computes the excerpt, word count & reading time of a post content.
+    - PostQuerySet (models.QuerySet): QuerySet Class with shortcuts to fetch posts efficiently.
     - Post (models.Model): Model Class that represents Post and it's attributes\
             Post contains foreign key with user related_name "posts".
+
+Notes:
+    - Post remembers the values it has been loaded with, Post.save only writes the fields changed since\
+        (see Post.get_dirty_fields) and skips the UPDATE together with post_save when nothing changed.\
+        Loading only keeps a reference to the database row, the values are read on the first save, so\
+        posts that are only read (lists, streams, exports) pay nothing for the tracking.
+    - excerpt, word_count & reading_time are computed out of the content whenever it is written, so lists\
+        can show post cards without reading the content, see the backfill_post_summaries command for old rows.
 """
 from django.db import models
 from django.utils.text import slugify
 from django.utils import timezone
 from user_authentication.models import User
+import math
 import uuid
 
+# Number of characters of a post excerpt.
+EXCERPT_LENGTH: int = 200
+# Reading speed used for the reading time.
+WORDS_PER_MINUTE: int = 200
+# Fields computed out of the content.
+SUMMARY_FIELDS: tuple[str] = ("excerpt", "word_count", "reading_time")
+
+
+def summarize_content(content: str) -> dict:
+    """
+    Function used to compute the fields summarizing a post content.
+
+    Args:
+        - content (str): Content of the post.
+
+    Returns:
+        - Dictionary with the excerpt cut on a word boundary, the word count & the reading time in minutes.
+    """
+    words: list[str] = content.split()
+    # A word has at least one character, the excerpt never needs more words than characters
+    excerpt: str = " ".join(words[:EXCERPT_LENGTH])
+    if len(excerpt) > EXCERPT_LENGTH:
+        # Cut on the last space that leaves room for the ellipsis
+        cut: int = excerpt.rfind(" ", 0, EXCERPT_LENGTH)
+        excerpt = excerpt[:cut if cut > 0 else EXCERPT_LENGTH - 1] + "…"
+    return {
+        "excerpt": excerpt,
+        "word_count": len(words),
+        "reading_time": math.ceil(len(words) / WORDS_PER_MINUTE),
+    }
+
+
+class PostQuerySet(models.QuerySet):
+    """QuerySet Class for posts"""
+
+    def with_author(self, *author_fields: str) -> "PostQuerySet":
+        """
+        Method used to fetch the author of each post within the same query.
+
+        Args:
+            - author_fields (str): Names of the author columns to load, if empty all author columns are loaded.
+
+        Returns:
+            - QuerySet that joins the author table.
+        """
+        queryset: PostQuerySet = self.select_related("author")
+        if not author_fields:
+            return queryset
+        # Load every post column but only the requested author columns
+        post_fields: list[str] = [field.name for field in self.model._meta.concrete_fields]
+        return queryset.only(*post_fields, *(f"author__{field}" for field in author_fields))
+
+
 # Create your models here.
 class Post(models.Model):
     id: models.UUIDField  = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     title: models.CharField = models.CharField(max_length=255)
     content: models.TextField = models.TextField(blank=False, null=False)
-    author: User = models.ForeignKey(User, on_delete=models.CASCADE, related_name="posts")
+    # Indexed by the (author, -created_at) index declared in Meta.
+    author: User = models.ForeignKey(User, on_delete=models.CASCADE, related_name="posts", db_index=False)
     created_at: models.DateTimeField = models.DateTimeField(auto_now_add=True)
     updated_at: models.DateTimeField = models.DateTimeField(auto_now=True)
-    slug = models.SlugField(max_length=255, blank=True)
+    # Indexed by the named slug index declared in Meta.
+    slug = models.SlugField(max_length=255, blank=True, db_index=False)
+    # Computed out of the content by Post.save, see summarize_content.
+    excerpt: models.CharField = models.CharField(max_length=EXCERPT_LENGTH, blank=True, default="")
+    word_count: models.PositiveIntegerField = models.PositiveIntegerField(default=0)
+    # Minutes, indexed by the named reading time index declared in Meta.
+    reading_time: models.PositiveIntegerField = models.PositiveIntegerField(default=0)
+
+    objects: PostQuerySet = PostQuerySet.as_manager()
+
+    class Meta:
+        indexes: list[models.Index] = [
+            # Posts of an author newest first.
+            models.Index(fields=["author", "-created_at"], name="post_author_created_idx"),
+            # All posts newest first, used by cursor pagination & exports.
+            models.Index(fields=["-created_at", "-id"], name="post_created_id_idx"),
+            # Post lookup by slug.
+            models.Index(fields=["slug"], name="post_slug_idx"),
+            # Posts filtered or sorted by reading time.
+            models.Index(fields=["reading_time"], name="post_reading_time_idx"),
+        ]
 
     def __str__(self) -> str:
         """String representation of Post instance"""
         return f"{self.title} by {self.author} {self.id}"
     
+    @classmethod
+    def from_db(cls, db: str, field_names: list[str], values: list) -> "Post":
+        """Method that keeps the loaded row to find out the fields changed before saving"""
+        instance: Post = super().from_db(db, field_names, values)
+        # Attribute names & values of the loaded columns, turned into a dictionary by get_loaded_values
+        instance._loaded_row = (field_names, values)
+        return instance
+
+    def get_loaded_values(self) -> dict | None:
+        """Method that returns the values the post has been loaded or last saved with, None for a new post"""
+        if "_loaded_row" in self.__dict__:
+            field_names, values = self.__dict__.pop("_loaded_row")
+            self._loaded_values = dict(zip(field_names, values))
+        return self.__dict__.get("_loaded_values")
+
+    def get_tracked_values(self) -> dict:
+        """Method that returns the loaded value of every concrete field, deferred fields are skipped"""
+        return {
+            field.attname: self.__dict__[field.attname]
+            for field in self._meta.concrete_fields if field.attname in self.__dict__
+        }
+
+    def get_dirty_fields(self) -> list[str]:
+        """
+        Method used to find the fields changed since the post has been loaded or saved.
+
+        Returns:
+            - Names of the changed fields, a deferred field that has been assigned counts as changed.
+        """
+        loaded: dict = self.get_loaded_values() or {}
+        return [
+            field.name for field in self._meta.concrete_fields
+            if field.attname in self.__dict__
+            and (field.attname not in loaded or loaded[field.attname] != self.__dict__[field.attname])
+        ]
+
+    def refresh_from_db(self, using: str | None = None, fields: list[str] | None = None) -> None:
+        """Method that reloads fields from the database & remembers their values"""
+        super().refresh_from_db(using, fields)
+        refreshed: dict = self.get_tracked_values()
+        if fields is not None:
+            attnames: set[str] = {self._meta.get_field(name).attname for name in fields}
+            refreshed = {attname: value for attname, value in refreshed.items() if attname in attnames}
+        self._loaded_values = {**(self.get_loaded_values() or {}), **refreshed}
+
+    def set_summary(self) -> None:
+        """Method that computes the excerpt, word count & reading time out of the content"""
+        for name, value in summarize_content(self.content).items():
+            setattr(self, name, value)
+
     def save(self, *args, **kwargs):
+        update_fields: list[str] | None = kwargs.get("update_fields")
+        # Existing post loaded from the database, only write what changed.
+        if not self._state.adding and update_fields is None and self.get_loaded_values() is not None:
+            update_fields = self.get_dirty_fields()
+            # Nothing changed, skip the UPDATE
+            if not update_fields:
+                return
+            kwargs["update_fields"] = update_fields
         # Create A slug if does not exist or when user updates it incase if changes slug.
-        self.slug = slugify(self.title)
+        if update_fields is None or "title" in update_fields:
+            self.slug = slugify(self.title)
+            if update_fields is not None:
+                update_fields = kwargs["update_fields"] = {*update_fields, "slug"}
+        # Summarize the content when it is written
+        if update_fields is None or "content" in update_fields:
+            self.set_summary()
+            if update_fields is not None:
+                update_fields = kwargs["update_fields"] = {*update_fields, *SUMMARY_FIELDS}
         # update
         self.updated_at = timezone.now()
-        super().save(*args, **kwargs)
\ No newline at end of file
+        if update_fields is not None:
+            kwargs["update_fields"] = {*update_fields, "updated_at"}
+        super().save(*args, **kwargs)
+        # Saved values are the new baseline
+        self.__dict__.pop("_loaded_row", None)
+        self._loaded_values = self.get_tracked_values()
@@ -0,0 +1,246 @@
+"""
+File that contains Pagination Classes for the API:-
+    - PostCursorPaginator: Class that paginates posts with an opaque keyset cursor on (created_at, id).
+    - PostSearchPaginator (PostCursorPaginator): Class that paginates search results with a cursor on (rank, docid).
+
+Notes:
+    - Keyset pagination filters on the last seen (created_at, id) pair instead of using OFFSET,
+        so fetching page N costs the same as fetching page 1.
+    - Posts are ordered newest first and ties on created_at are broken by id, so the order is stable.
+"""
+from rest_framework.exceptions import ValidationError
+from rest_framework.request import Request
+from django.db.models import Q, QuerySet
+from django.http import HttpRequest, QueryDict
+from django.utils.dateparse import parse_datetime
+from .models import Post
+from typing import Self
+import base64
+import binascii
+import json
+import uuid
+
+
+class PostCursorPaginator:
+    """
+    Class used to paginate a queryset of posts using a cursor.
+
+    Attributes:
+        - default_page_size (int): Page size used when the client does not send one.
+        - max_page_size (int): Upper bound of the page size a client can ask for.
+        - cursor_query_param (str): Query parameter that holds the cursor.
+        - page_size_query_param (str): Query parameter that holds the page size.
+    """
+    default_page_size: int = 20
+    max_page_size: int = 100
+    cursor_query_param: str = "cursor"
+    page_size_query_param: str = "page_size"
+
+    def __init__(self: Self, request: Request | HttpRequest) -> None:
+        """
+        Initiate paginator for a request.
+
+        Args:
+            - request (Request): Request that carries the cursor & page size query parameters.
+        """
+        self.request: Request = request
+        self.query_params: QueryDict = self.get_query_params(request)
+        self.page_size: int = self.get_page_size()
+        self.cursor: dict | None = self.decode_cursor(self.query_params.get(self.cursor_query_param))
+        self.next_cursor: str | None = None
+        self.previous_cursor: str | None = None
+
+    @staticmethod
+    def get_query_params(request: Request | HttpRequest) -> QueryDict:
+        """Method that returns the query parameters of a Django Rest Framework or a plain Django request"""
+        return getattr(request, "query_params", request.GET)
+
+    @classmethod
+    def is_requested(cls: "PostCursorPaginator", request: Request | HttpRequest) -> bool:
+        """Method to check if the request asks for a paginated response"""
+        params: QueryDict = cls.get_query_params(request)
+        return cls.cursor_query_param in params or cls.page_size_query_param in params
+
+    def get_page_size(self: Self) -> int:
+        """
+        Method used to read the page size from the request.
+
+        Raises:
+            - ValidationError: In case the page size is not a positive integer.
+
+        Returns:
+            - Page size bounded by max_page_size.
+        """
+        value: str | None = self.query_params.get(self.page_size_query_param)
+        # Use the default page size
+        if not value:
+            return self.default_page_size
+        # Check page size format
+        try:
+            page_size: int = int(value)
+        except ValueError:
+            raise ValidationError({self.page_size_query_param: "Page size must be an integer."})
+        if page_size < 1:
+            raise ValidationError({self.page_size_query_param: "Page size must be a positive integer."})
+        # Bound page size
+        return min(page_size, self.max_page_size)
+
+    @staticmethod
+    def encode_cursor(post: Post, reverse: bool = False) -> str:
+        """
+        Method used to build an opaque cursor out of a post position.
+
+        Args:
+            - post (Post): Post that marks the position of the cursor.
+            - reverse (bool): True if the cursor points to the previous page.
+
+        Returns:
+            - URL safe base64 string.
+        """
+        position: dict = {"c": post.created_at.isoformat(), "i": str(post.id), "r": reverse}
+        encoded: bytes = base64.urlsafe_b64encode(json.dumps(position).encode())
+        return encoded.decode()
+
+    def decode_cursor(self: Self, cursor: str | None) -> dict | None:
+        """
+        Method used to decode a cursor sent by the client.
+
+        Raises:
+            - ValidationError: In case the cursor has been tampered with.
+
+        Returns:
+            - Dictionary with created_at, id and reverse keys or None if there is no cursor.
+        """
+        if not cursor:
+            return None
+        try:
+            position: dict = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+            created_at = parse_datetime(position["c"])
+            post_id: uuid.UUID = uuid.UUID(position["i"])
+            reverse: bool = bool(position.get("r", False))
+        except (binascii.Error, ValueError, KeyError, TypeError, AttributeError):
+            raise ValidationError({self.cursor_query_param: "Invalid cursor."})
+        if created_at is None:
+            raise ValidationError({self.cursor_query_param: "Invalid cursor."})
+        return {"created_at": created_at, "id": post_id, "reverse": reverse}
+
+    def page_queryset(self: Self, queryset: QuerySet) -> QuerySet:
+        """
+        Method used to build the query of a single page.
+
+        Args:
+            - queryset (QuerySet): Posts queryset, any ordering on it is replaced.
+
+        Returns:
+            - QuerySet of the page and one extra post used to know if there is another page.
+        """
+        cursor: dict | None = self.cursor
+        reverse: bool = bool(cursor and cursor["reverse"])
+        if cursor is not None:
+            created_at, post_id = cursor["created_at"], cursor["id"]
+            # The range condition on created_at comes first so the database can seek
+            # the (created_at, id) index instead of scanning it from the start.
+            if reverse:
+                # Posts newer than the cursor position
+                queryset = queryset.filter(
+                    Q(created_at__gte=created_at), Q(created_at__gt=created_at) | Q(id__gt=post_id)
+                )
+            else:
+                # Posts older than the cursor position
+                queryset = queryset.filter(
+                    Q(created_at__lte=created_at), Q(created_at__lt=created_at) | Q(id__lt=post_id)
+                )
+        ordering: tuple[str] = ("created_at", "id") if reverse else ("-created_at", "-id")
+        # Fetch an extra row to know if there is another page
+        return queryset.order_by(*ordering)[:self.page_size + 1]
+
+    def build_page(self: Self, posts: list[Post]) -> list[Post]:
+        """
+        Method used to turn the posts fetched by page_queryset into a page & set the cursors.
+
+        Returns:
+            - List of posts ordered newest first.
+        """
+        cursor: dict | None = self.cursor
+        reverse: bool = bool(cursor and cursor["reverse"])
+        has_more: bool = len(posts) > self.page_size
+        posts = posts[:self.page_size]
+        if reverse:
+            posts.reverse()
+        if not posts:
+            return posts
+        # Build cursors
+        if reverse:
+            self.previous_cursor = self.encode_cursor(posts[0], reverse=True) if has_more else None
+            self.next_cursor = self.encode_cursor(posts[-1])
+        else:
+            self.next_cursor = self.encode_cursor(posts[-1]) if has_more else None
+            self.previous_cursor = self.encode_cursor(posts[0], reverse=True) if cursor else None
+        return posts
+
+    def paginate_queryset(self: Self, queryset: QuerySet) -> list[Post]:
+        """
+        Method used to fetch a single page of posts.
+
+        Args:
+            - queryset (QuerySet): Posts queryset, any ordering on it is replaced.
+
+        Returns:
+            - List of posts ordered newest first.
+        """
+        return self.build_page(list(self.page_queryset(queryset)))
+
+    async def apaginate_queryset(self: Self, queryset: QuerySet) -> list[Post]:
+        """Method used to fetch a single page of posts from async code, see paginate_queryset"""
+        return self.build_page([post async for post in self.page_queryset(queryset)])
+
+    def get_paginated_data(self: Self, data: list) -> dict:
+        """Method that wraps serialized page with next/previous cursors"""
+        return {
+            "next": self.next_cursor,
+            "previous": self.previous_cursor,
+            "results": data,
+        }
+
+
+class PostSearchPaginator(PostCursorPaginator):
+    """
+    Class used to paginate search results forward with a cursor on their (rank, docid) position.
+    """
+
+    @staticmethod
+    def encode_position(rank: float, docid: int) -> str:
+        """Method used to build an opaque cursor out of the position of a search result"""
+        encoded: bytes = base64.urlsafe_b64encode(json.dumps({"r": rank, "d": docid}).encode())
+        return encoded.decode()
+
+    def decode_cursor(self: Self, cursor: str | None) -> tuple[float, int] | None:
+        """
+        Method used to decode a cursor sent by the client.
+
+        Raises:
+            - ValidationError: In case the cursor has been tampered with.
+
+        Returns:
+            - Tuple of rank & docid or None if there is no cursor.
+        """
+        if not cursor:
+            return None
+        try:
+            position: dict = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+            return float(position["r"]), int(position["d"])
+        except (binascii.Error, ValueError, KeyError, TypeError, AttributeError):
+            raise ValidationError({self.cursor_query_param: "Invalid cursor."})
+
+    def build_results_page(self: Self, results: list[dict]) -> list[dict]:
+        """
+        Method used to turn results fetched with page_size + 1 as limit into a page & set the next cursor.
+
+        Returns:
+            - Results of the page.
+        """
+        has_more: bool = len(results) > self.page_size
+        results = results[:self.page_size]
+        if has_more:
+            self.next_cursor = self.encode_position(results[-1]["rank"], results[-1]["docid"])
+        return results
@@ -3,10 +3,12 @@ File that contains Permission classess for this API:-
     - IsAuthor (BasePermission) - Is a Permission Class to check if request sender is author of the post\
                 If the sender is not the actual author of the post Unallowed
                 If the post does not exist with this ID unallowed.
+                The loaded post is kept on the request, see blog.loaders.get_request_post.
 """
 from rest_framework.permissions import BasePermission
 from typing import Self
 from .models import Post
+from .loaders import get_request_post
 
 class IsAuthor(BasePermission):
     def has_permission(self: Self, request: object, view) -> bool:
@@ -16,10 +18,10 @@ class IsAuthor(BasePermission):
         # incase ID is none
         if pk is None:
             return False
-        # Get the post
-        post: Post = Post.objects.filter(id=pk).first()
+        # Get the post, it is kept on the request for the serializer & the view
+        post: Post = get_request_post(request, pk)
         # No post
         if post is None:
             return False
-        # Check if the requesting user is author of the post
-        return request.user == post.author
\ No newline at end of file
+        # Check if the requesting user is author of the post without loading the author
+        return request.user.pk == post.author_id
\ No newline at end of file
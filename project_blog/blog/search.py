@@ -0,0 +1,128 @@
+"""
+File that contains Functions used to search posts through the SQLite FTS5 index:-
+    - is_search_available (function): Checks if the database provides the post_fts index.
+    - build_match_query (function): Turns user input into a safe FTS5 query.
+    - search_posts (function): Returns a page of post ids ranked by bm25 with highlighted title & snippet.
+    - escape_highlights (function): Escapes a highlighted text & turns the match markers into <mark> tags.
+    - rebuild_search_index (function): Rebuilds the index out of the posts table.
+
+Notes:
+    - The post_fts table & the triggers keeping it in sync are created by migration blog 0002_post_fts,\
+        every write to blog_post updates the index, bulk_create & QuerySet.update included.
+    - Ranking computes bm25 for every match, the keyset cursor on (rank, docid) saves fetching & serializing\
+        the skipped rows, it does not make the ranking cheaper.
+    - highlight() & snippet() return the stored title & content as is, matches are marked with control\
+        characters, the text is HTML escaped before the markers become <mark> tags.
+"""
+from django.db import connection, transaction
+import html
+import re
+
+# Weight of a title match compared to a content match for bm25.
+TITLE_WEIGHT: float = 10.0
+CONTENT_WEIGHT: float = 1.0
+# Markers FTS5 puts around matched terms, then the tags they are replaced with after escaping.
+MATCH_START: str = "\x02"
+MATCH_END: str = "\x03"
+HIGHLIGHT_START: str = "<mark>"
+HIGHLIGHT_END: str = "</mark>"
+# Number of tokens in a snippet.
+SNIPPET_TOKENS: int = 16
+
+SEARCH_SQL: str = f"""
+    SELECT * FROM (
+        SELECT m.post_id, m.docid,
+            bm25(post_fts, {TITLE_WEIGHT}, {CONTENT_WEIGHT}) AS rank,
+            highlight(post_fts, 0, %s, %s) AS title,
+            snippet(post_fts, 1, %s, %s, '…', {SNIPPET_TOKENS}) AS snippet
+        FROM post_fts JOIN post_fts_map m ON m.docid = post_fts.rowid
+        WHERE post_fts MATCH %s
+    )
+    WHERE %s OR rank > %s OR (rank = %s AND docid > %s)
+    ORDER BY rank, docid
+    LIMIT %s
+"""
+
+
+def is_search_available() -> bool:
+    """Function that returns True in case the database provides the post_fts index"""
+    return connection.vendor == "sqlite"
+
+
+def build_match_query(query: str) -> str:
+    """
+    Function used to turn user input into an FTS5 query where every word must match.
+
+    Args:
+        - query (str): Raw search input.
+
+    Returns:
+        - FTS5 query where each word is quoted so operators & punctuation are never interpreted,\
+            empty in case the input has no word.
+    """
+    words: list[str] = re.findall(r"\w+", query)
+    return " ".join(f'"{word}"' for word in words)
+
+
+def escape_highlights(text: str | None) -> str | None:
+    """
+    Function used to make a highlighted title or snippet safe to render as HTML.
+
+    Args:
+        - text (str): Text returned by highlight() or snippet() with MATCH_START & MATCH_END markers.
+
+    Returns:
+        - HTML escaped text where only the <mark> tags around the matches are markup.
+    """
+    if text is None:
+        return None
+    # A marker stored in the post itself can only add a <mark> tag, never any other markup
+    return html.escape(text).replace(MATCH_START, HIGHLIGHT_START).replace(MATCH_END, HIGHLIGHT_END)
+
+
+def search_posts(query: str, limit: int, after: tuple[float, int] | None = None) -> list[dict]:
+    """
+    Function used to search posts.
+
+    Args:
+        - query (str): FTS5 query built by build_match_query.
+        - limit (int): Maximum number of results.
+        - after (tuple): (rank, docid) of the last result of the previous page, None for the first page.
+
+    Returns:
+        - List of dictionaries with post_id, docid, rank, HTML escaped highlighted title & snippet,\
+            best match first.
+    """
+    rank, docid = after if after is not None else (0.0, 0)
+    with connection.cursor() as cursor:
+        cursor.execute(SEARCH_SQL, [
+            MATCH_START, MATCH_END, MATCH_START, MATCH_END, query,
+            after is None, rank, rank, docid, limit,
+        ])
+        columns: list[str] = [column[0] for column in cursor.description]
+        results: list[dict] = [dict(zip(columns, row)) for row in cursor.fetchall()]
+    for result in results:
+        result["title"] = escape_highlights(result["title"])
+        result["snippet"] = escape_highlights(result["snippet"])
+    return results
+
+
+def rebuild_search_index() -> int:
+    """
+    Function used to rebuild the search index out of the posts table, e.g. after a restore.
+
+    Returns:
+        - Number of indexed posts.
+    """
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute("DELETE FROM post_fts")
+        cursor.execute("DELETE FROM post_fts_map")
+        cursor.execute("INSERT INTO post_fts_map (post_id) SELECT id FROM blog_post")
+        cursor.execute(
+            "INSERT INTO post_fts (rowid, title, content) "
+            "SELECT m.docid, p.title, p.content FROM post_fts_map m JOIN blog_post p ON p.id = m.post_id"
+        )
+        # Merge the index segments
+        cursor.execute("INSERT INTO post_fts (post_fts) VALUES ('optimize')")
+        cursor.execute("SELECT COUNT(*) FROM post_fts_map")
+        return cursor.fetchone()[0]
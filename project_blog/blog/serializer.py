@@ -2,13 +2,21 @@
 File Contains Serialization Classes:
 
     - PostSerializer (serializer.ModelSerializer): Class to serialize model posts
+            use PostSerializer.setup_queryset to fetch the nested author within the same query,\
+            pass fields to serialize & load only some of the fields (see PostSerializer.parse_fields).
+    - PostSearchSerializer (serializer.ModelSerializer): Class to serialize a search result without the post content.
     - PostCreateSerializer (serializer.Serializer): Class used to act serializer form for creating Post.
     - PostModificationSerializer (serializer.Serializer): Class acts as a serializer form to update or delete post.
+    - PostPatchSerializer (PostModificationSerializer): Class acts as a serializer form to update some fields of a post.
     - PostListSerializer (serializer.Serializer): Class acts as a serializer form Validator.
+    - PostBulkDeleteSerializer (serializer.Serializer): Class acts as a serializer form to delete posts in bulk.
 """
 from rest_framework import serializers
+from django.db import DatabaseError
+from django.utils.text import slugify
+from django.utils import timezone
 from user_authentication.serializer import UserSerializer
-from .models import Post
+from .models import Post, PostQuerySet, summarize_content
 from user_authentication.models import User
 from typing import Self
 
@@ -20,6 +28,105 @@ class PostSerializer(serializers.ModelSerializer):
         model = Post
         fields: str = "__all__"
 
+    # Columns always loaded by setup_queryset, used for ordering & pagination cursors
+    required_fields: tuple[str] = ("id", "created_at")
+    # Named sparse fieldsets, a card is shown without reading the content
+    fieldsets: dict[str, tuple[str]] = {
+        "card": ("id", "title", "slug", "author", "created_at", "excerpt", "word_count", "reading_time"),
+    }
+
+    def __init__(self: Self, *args, fields: tuple[str] | None = None, **kwargs) -> None:
+        """
+        Initiate serializer.
+
+        Args:
+            - fields (tuple): Names of the fields to serialize, all fields if None.
+        """
+        super().__init__(*args, **kwargs)
+        if fields is not None:
+            for name in set(self.fields) - set(fields):
+                self.fields.pop(name)
+
+    @classmethod
+    def parse_fields(cls: "PostSerializer", value: str | None) -> tuple[str] | None:
+        """
+        Method used to read a sparse fieldset, e.g. the 'fields' query parameter "title,slug,author".
+
+        Args:
+            - value (str): Comma separated field names or the name of a fieldset e.g. "card".
+
+        Raises:
+            - ValidationError: In case a field does not exist.
+
+        Returns:
+            - Tuple of field names in declared order, so every ordering of the same fields compiles once,\
+                or None in case every field is requested.
+        """
+        if not value:
+            return None
+        if value in cls.fieldsets:
+            return cls.fieldsets[value]
+        requested: set[str] = {name.strip() for name in value.split(",") if name.strip()}
+        declared: list[str] = list(cls().fields)
+        unknown: list[str] = sorted(requested.difference(declared))
+        if unknown:
+            raise serializers.ValidationError({"fields": f"Unknown fields: {', '.join(unknown)}."})
+        return tuple(name for name in declared if name in requested) or None
+
+    @classmethod
+    def setup_queryset(cls: "PostSerializer", queryset: PostQuerySet, fields: tuple[str] | None = None) -> PostQuerySet:
+        """
+        Method used to prepare a queryset for serialization to avoid a query per post for the author.
+
+        Args:
+            - queryset (PostQuerySet): Posts to serialize.
+            - fields (tuple): Names of the serialized fields, all fields if None.
+
+        Returns:
+            - QuerySet that loads the author columns used by UserSerializer in the same query,\
+                with fields only the columns of these fields are read, the author is joined only if requested.
+        """
+        if fields is None:
+            return queryset.with_author(*UserSerializer.Meta.fields)
+        columns: list[str] = list(dict.fromkeys(cls.required_fields + fields))
+        if "author" in fields:
+            queryset = queryset.select_related("author")
+            columns += [f"author__{field}" for field in UserSerializer.Meta.fields]
+        return queryset.only(*columns)
+
+
+class PostSearchSerializer(serializers.ModelSerializer):
+    """
+    Serializer of a search result, context["matches"] maps post ids to their search result\
+        (see blog.search.search_posts) to add the HTML escaped highlighted title & snippet, and the rank.
+    """
+    author = UserSerializer()
+    highlighted_title = serializers.SerializerMethodField()
+    snippet = serializers.SerializerMethodField()
+    rank = serializers.SerializerMethodField()
+
+    class Meta:
+        model = Post
+        fields: tuple[str] = ("id", "title", "slug", "author", "created_at", "highlighted_title", "snippet", "rank")
+
+    @staticmethod
+    def setup_queryset(queryset: PostQuerySet) -> PostQuerySet:
+        """Method used to prepare a queryset for serialization, the content is never read"""
+        return queryset.with_author(*UserSerializer.Meta.fields).defer("content")
+
+    def get_match(self: Self, post: Post) -> dict:
+        """Method that returns the search result of a post"""
+        return self.context["matches"][post.id.hex]
+
+    def get_highlighted_title(self: Self, post: Post) -> str:
+        return self.get_match(post)["title"]
+
+    def get_snippet(self: Self, post: Post) -> str:
+        return self.get_match(post)["snippet"]
+
+    def get_rank(self: Self, post: Post) -> float:
+        return self.get_match(post)["rank"]
+
 
 # Create Form Serializers.
 class PostCreateSerializer(serializers.Serializer):
@@ -78,17 +185,40 @@ class PostCreateSerializer(serializers.Serializer):
         # Return Post
         return post
 
+    def build(self: Self) -> Post:
+        """
+        Method used to build an unsaved post out of the validated data for Post.objects.bulk_create.
+
+        Returns:
+            - Post instance with its slug & summary set, bulk_create does not call Post.save.
+        """
+        post: Post = Post(**self.validated_data, author=self.context.get("author"))
+        post.slug = slugify(post.title)
+        post.set_summary()
+        return post
+
 class PostModificationSerializer(serializers.Serializer):
     id = serializers.UUIDField(required=True)
     title = serializers.CharField(max_length=200, required=True)
     content = serializers.CharField(required=True)
     author = serializers.DictField(required=True)
 
+    def get_post(self: Self, uuid: str) -> Post | None:
+        """
+        Method used to get the post, it reuses the post loaded by the view passed as context["post"]\
+            and fetches it only once otherwise.
+        """
+        post: Post | None = self.context.get("post")
+        if post is None or str(post.id) != str(uuid):
+            post = Post.objects.filter(id=uuid).first()
+            self.context["post"] = post
+        return post
+
     # We will add another layer of protection incase if some one remove IsAuthor Permission in permission_classess
     def validate_id(self: Self, value: str) -> str:
         """Method to validate existance of post by id"""
         # Check if post exists
-        if not Post.objects.filter(id= value).first():
+        if not self.get_post(value):
             raise serializers.ValidationError("Post does not exist.!")
         # For detecting malicious actions
         uuid: str = self.context.get("post_id")
@@ -148,11 +278,11 @@ class PostModificationSerializer(serializers.Serializer):
         if not uuid:
             raise serializers.ValidationError("ID for post was not provided")
         # Get Post
-        post: Post = Post.objects.filter(id= uuid).first()
+        post: Post = self.get_post(uuid)
         if not post:
             raise serializers.ValidationError("Post Does not exist")
         # Compare user of the post to that of request sender.
-        if not post.author == user:
+        if not post.author_id == user.pk:
             # Unauthorized action can add user in blacklist
             raise serializers.ValidationError("Unauthorized action detected.")
         # assign post to self.instance
@@ -164,6 +294,78 @@ class PostModificationSerializer(serializers.Serializer):
         # Update instance
         instance.title = validated_data.get("title", instance.title)
         instance.content = validated_data.get("content", instance.content)
-        instance.save()
+        try:
+            instance.save()
+        except DatabaseError as error:
+            # Django raises a bare DatabaseError when the UPDATE of the changed fields matched no row,
+            # the post has been deleted meanwhile. Backend failures are raised as its subclasses.
+            if type(error) is not DatabaseError:
+                raise
+            raise Post.DoesNotExist("Post does not exist") from error
         return instance
 
+
+class PostPatchSerializer(PostModificationSerializer):
+    """
+    Serializer of a partial update, only the fields sent are validated with the rules of PostModificationSerializer.
+    The post & its author are checked by the UPDATE itself, see PostModificationView.patch.
+    """
+    id = None
+    author = None
+    title = serializers.CharField(max_length=200, required=False)
+    content = serializers.CharField(required=False)
+
+    def validate(self: Self, attr: dict) -> dict:
+        """Method used to check at least one field is modified"""
+        if not attr:
+            raise serializers.ValidationError("Provide at least one of 'title' or 'content'.")
+        return attr
+
+    def get_update_values(self: Self) -> dict:
+        """
+        Method that returns the columns to write for the validated fields.
+
+        Returns:
+            - Dictionary for QuerySet.update with the slug when the title changes, the summary when\
+                the content changes & updated_at.
+        """
+        values: dict = dict(self.validated_data)
+        if "title" in values:
+            values["slug"] = slugify(values["title"])
+        if "content" in values:
+            values.update(summarize_content(values["content"]))
+        values["updated_at"] = timezone.now()
+        return values
+
+
+class PostBulkDeleteSerializer(serializers.Serializer):
+    ids = serializers.ListField(child=serializers.UUIDField(), required=False, allow_empty=False, max_length=10_000)
+    created_after = serializers.DateTimeField(required=False)
+    created_before = serializers.DateTimeField(required=False)
+
+    def validate(self: Self, attr: dict) -> dict:
+        """Method used to check the posts are selected either by ids or by a date range"""
+        has_range: bool = "created_after" in attr or "created_before" in attr
+        if ("ids" in attr) == has_range:
+            raise serializers.ValidationError("Provide either 'ids' or 'created_after'/'created_before'.")
+        if has_range and attr.get("created_after") and attr.get("created_before"):
+            if attr["created_after"] >= attr["created_before"]:
+                raise serializers.ValidationError("'created_after' must be before 'created_before'.")
+        return attr
+
+    def get_queryset(self: Self, author: User) -> PostQuerySet:
+        """
+        Method that returns the posts of the author selected by the validated date range.
+
+        Args:
+            - author (User): Owner of the posts.
+
+        Returns:
+            - QuerySet served by the (author, -created_at) index.
+        """
+        posts: PostQuerySet = Post.objects.filter(author=author)
+        if "created_after" in self.validated_data:
+            posts = posts.filter(created_at__gte=self.validated_data["created_after"])
+        if "created_before" in self.validated_data:
+            posts = posts.filter(created_at__lt=self.validated_data["created_before"])
+        return posts
@@ -0,0 +1,31 @@
+"""
+File that contains Signal receivers for the API:-
+    - invalidate_posts_lists (function): Bumps the posts generation whenever a post is saved or deleted.
+    - invalidate_posts_lists_on_author_change (function): Bumps the posts generation when an author changes.
+
+Notes:
+    - post_delete is sent for every post removed by a cascade, e.g. when the author is deleted.
+    - QuerySet.update() & bulk_create() do not send signals, code using them bumps the generation itself.
+    - Receivers run inside the writing transaction, the generation is bumped once it commits.
+    - Bulk writes wrapped in blog.cache.bulk_posts_write mute the receivers & bump the generation once.
+"""
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from user_authentication.models import User
+from .models import Post
+from .cache import bump_posts_generation_on_commit
+
+
+@receiver(post_save, sender=Post, dispatch_uid="blog_post_saved")
+@receiver(post_delete, sender=Post, dispatch_uid="blog_post_deleted")
+def invalidate_posts_lists(sender: type[Post], instance: Post, **kwargs) -> None:
+    """Receiver that invalidates cached post lists"""
+    bump_posts_generation_on_commit()
+
+
+@receiver(post_save, sender=User, dispatch_uid="blog_author_saved")
+def invalidate_posts_lists_on_author_change(sender: type[User], instance: User, created: bool, **kwargs) -> None:
+    """Receiver that invalidates cached post lists since they embed the author details"""
+    # A new user has no posts yet
+    if not created:
+        bump_posts_generation_on_commit()
@@ -0,0 +1,81 @@
+"""
+File that contains Functions used to stream large JSON responses:-
+    - stream_json_array (function): Generator that encodes rows one by one as a JSON array.
+    - streaming_json_response (function): Builds a StreamingHttpResponse out of a queryset & a serializer.
+
+Notes:
+    - The queryset is read in chunks using .iterator(chunk_size=...) so Django never caches the full result,\
+        and each row is serialized only when the response is being written, memory stays flat.
+    - With compiled=True rows are read as values_list tuples & serialized by blog.compiled.
+"""
+from django.db.models import QuerySet
+from django.http import StreamingHttpResponse
+from rest_framework.serializers import Serializer
+from rest_framework.utils.encoders import JSONEncoder
+from .compiled import CompiledSerializer, compile_serializer
+from typing import Callable, Iterable, Iterator
+import json
+
+
+def stream_json_array(rows: Iterable, to_representation: Callable[[object], dict]) -> Iterator[str]:
+    """
+    Generator that writes rows as a JSON array, one element at a time.
+
+    Args:
+        - rows (Iterable): Rows to encode, read lazily.
+        - to_representation (Callable): Function that turns a row into a JSON serializable dict.
+
+    Yields:
+        - Pieces of the JSON document.
+    """
+    yield "["
+    separator: str = ""
+    for row in rows:
+        yield separator + json.dumps(
+            to_representation(row),
+            cls=JSONEncoder,
+            ensure_ascii=False,
+            separators=(",", ":"),
+        )
+        separator = ","
+    yield "]"
+
+
+def streaming_json_response(
+        queryset: QuerySet,
+        serializer_class: type[Serializer],
+        chunk_size: int = 2000,
+        filename: str | None = None,
+        compiled: bool = False,
+        fields: tuple[str] | None = None,
+    ) -> StreamingHttpResponse:
+    """
+    Function used to stream a queryset as a JSON array.
+
+    Args:
+        - queryset (QuerySet): Rows to stream.
+        - serializer_class (Serializer): Serializer class used to represent each row.
+        - chunk_size (int): Number of rows fetched from the database per round trip.
+        - filename (str): If provided the response is sent as an attachment.
+        - compiled (bool): If True rows are serialized by the compiled serializer of serializer_class.
+        - fields (tuple): Sparse fieldset passed to the serializer as fields=..., all fields if None.
+
+    Returns:
+        - StreamingHttpResponse with content type application/json.
+    """
+    if compiled:
+        compiled_serializer: CompiledSerializer = compile_serializer(serializer_class, fields)
+        queryset = compiled_serializer.rows(queryset)
+        to_representation: Callable[[tuple], dict] = compiled_serializer.get_representation()
+    else:
+        # A single serializer instance is reused for every row
+        serializer: Serializer = serializer_class() if fields is None else serializer_class(fields=fields)
+        to_representation: Callable[[object], dict] = serializer.to_representation
+    rows: Iterator = queryset.iterator(chunk_size=chunk_size)
+    response: StreamingHttpResponse = StreamingHttpResponse(
+        stream_json_array(rows, to_representation),
+        content_type="application/json",
+    )
+    if filename:
+        response["Content-Disposition"] = f'attachment; filename="{filename}"'
+    return response
@@ -1,4 +1,154 @@
 """
 File that contains Test Classes for API Models:-
-    
-"""
\ No newline at end of file
+    - PostIndexTests (TestCase): Class to check each Post access path is served by an index.
+    - PostDirtyFieldTests (TestCase): Class to check Post.save only writes changed fields.
+    - PostSummaryTests (TestCase): Class to check the excerpt, word count & reading time of posts.
+"""
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from user_authentication.models import User
+from django.db import connection
+from django.db.models import Q
+from django.utils import timezone
+from blog.models import Post, summarize_content, EXCERPT_LENGTH
+from typing import Self
+import unittest
+import uuid
+
+
+@unittest.skipUnless(connection.vendor == "sqlite", "EXPLAIN QUERY PLAN output is SQLite specific.")
+class PostIndexTests(TestCase):
+    """Test Class for the query plans of Post access paths"""
+
+    def assertUsesIndex(self: Self, queryset, index: str) -> None:
+        """Method used to assert that the query plan searches or scans the given index"""
+        plan: str = queryset.explain()
+        self.assertIn(f"USING INDEX {index}", plan)
+        # A plain table scan means the index is not used
+        self.assertNotIn("SCAN blog_post\n", plan + "\n")
+
+    def test_author_posts_newest_first(self: Self) -> None:
+        """Test posts of an author ordered by date use (author, -created_at)"""
+        queryset = Post.objects.filter(author__username="test_user").order_by("-created_at")[:20]
+        self.assertUsesIndex(queryset, "post_author_created_idx")
+        self.assertNotIn("TEMP B-TREE FOR ORDER BY", queryset.explain())
+
+    def test_posts_newest_first(self: Self) -> None:
+        """Test the list ordering uses (-created_at, -id) without sorting"""
+        queryset = Post.objects.order_by("-created_at", "-id")[:20]
+        self.assertUsesIndex(queryset, "post_created_id_idx")
+        self.assertNotIn("TEMP B-TREE", queryset.explain())
+
+    def test_cursor_seeks_index(self: Self) -> None:
+        """Test a cursor page seeks (-created_at, -id) instead of scanning it"""
+        now = timezone.now()
+        queryset = Post.objects.filter(
+            Q(created_at__lte=now), Q(created_at__lt=now) | Q(id__lt=uuid.uuid4())
+        ).order_by("-created_at", "-id")[:20]
+        self.assertIn("SEARCH blog_post USING INDEX post_created_id_idx (created_at<?)", queryset.explain())
+
+    def test_slug_lookup(self: Self) -> None:
+        """Test looking up a post by slug uses the slug index"""
+        self.assertUsesIndex(Post.objects.filter(slug="hello-world"), "post_slug_idx")
+
+    def test_reading_time_lookup(self: Self) -> None:
+        """Test filtering posts by reading time uses the reading time index"""
+        self.assertUsesIndex(Post.objects.filter(reading_time__lte=5), "post_reading_time_idx")
+
+
+class PostDirtyFieldTests(TestCase):
+    """Test Class for the dirty field tracking of Post"""
+
+    def setUp(self: Self) -> None:
+        """Set Up a post loaded from the database"""
+        user: User = User.objects.create_user(username="joe", email="joe@example.com", password="x")
+        Post.objects.create(title="Hello World", content="content", author=user)
+        self.post: Post = Post.objects.get()
+
+    def save(self: Self) -> str:
+        """Method that saves the post & returns the SQL that has been run"""
+        with CaptureQueriesContext(connection) as queries:
+            self.post.save()
+        return "\n".join(query["sql"] for query in queries.captured_queries)
+
+    def test_no_op_save(self: Self) -> None:
+        """Test saving an unchanged post runs no query & keeps updated_at"""
+        updated_at = self.post.updated_at
+        self.post.title = "Hello World"
+        self.assertEqual(self.save(), "")
+        self.assertEqual(self.post.updated_at, updated_at)
+
+    def test_content_change(self: Self) -> None:
+        """Test changing the content writes the content only"""
+        self.post.content = "new content"
+        sql: str = self.save()
+        self.assertIn('"content"', sql)
+        self.assertIn('"updated_at"', sql)
+        self.assertIn('"excerpt"', sql)
+        self.assertNotIn('"title"', sql)
+        self.assertNotIn('"slug"', sql)
+        self.assertEqual(Post.objects.get().content, "new content")
+        # The saved values are the new baseline
+        self.assertEqual(self.save(), "")
+
+    def test_title_change(self: Self) -> None:
+        """Test changing the title recomputes the slug without writing the content"""
+        self.post.title = "Changed Title"
+        sql: str = self.save()
+        self.assertIn('"slug"', sql)
+        self.assertNotIn('"content"', sql)
+        self.assertNotIn('"excerpt"', sql)
+        self.assertEqual(Post.objects.get().slug, "changed-title")
+
+    def test_deferred_field(self: Self) -> None:
+        """Test an assigned deferred field is written"""
+        self.post = Post.objects.defer("content").get()
+        self.post.content = "new content"
+        self.assertIn('"content"', self.save())
+        self.assertEqual(Post.objects.get().content, "new content")
+
+    def test_lazy_tracking(self: Self) -> None:
+        """Test loading a post only keeps its row, the values are built on the first save"""
+        self.assertNotIn("_loaded_values", self.post.__dict__)
+        posts: list[Post] = list(Post.objects.iterator())
+        self.assertNotIn("_loaded_values", posts[0].__dict__)
+        self.assertEqual(self.save(), "")
+        self.assertEqual(self.post.get_loaded_values()["title"], "Hello World")
+
+    def test_refresh_from_db(self: Self) -> None:
+        """Test values reloaded from the database become the baseline"""
+        Post.objects.update(title="Changed elsewhere")
+        self.post.refresh_from_db()
+        self.post.title = "Hello World"
+        self.assertIn('"title"', self.save())
+        self.assertEqual(Post.objects.get().title, "Hello World")
+
+
+class PostSummaryTests(TestCase):
+    """Test Class for the summary columns of Post"""
+
+    def test_summarize_content(self: Self) -> None:
+        """Test the excerpt is cut on a word boundary & the reading time is rounded up"""
+        content: str = "word " * 450
+        summary: dict = summarize_content(content)
+        self.assertEqual(summary["word_count"], 450)
+        self.assertEqual(summary["reading_time"], 3)
+        self.assertLessEqual(len(summary["excerpt"]), EXCERPT_LENGTH)
+        self.assertTrue(summary["excerpt"].endswith("word…"))
+        # Short content is kept whole with its whitespace collapsed
+        self.assertEqual(
+            summarize_content("Hello \n\n World"), {"excerpt": "Hello World", "word_count": 2, "reading_time": 1}
+        )
+        # A single long word is cut
+        self.assertEqual(len(summarize_content("x" * 500)["excerpt"]), EXCERPT_LENGTH)
+
+    def test_save(self: Self) -> None:
+        """Test creating & updating a post computes its summary"""
+        user: User = User.objects.create_user(username="joe", email="joe@example.com", password="x")
+        post: Post = Post.objects.create(title="Hello World", content="one two three", author=user)
+        self.assertEqual((post.excerpt, post.word_count, post.reading_time), ("one two three", 3, 1))
+        post = Post.objects.get()
+        post.content = "one " * 201
+        post.save()
+        post = Post.objects.get()
+        self.assertEqual((post.word_count, post.reading_time), (201, 2))
@@ -1,4 +1,953 @@
 """
 File that contains Test Classes for API Views:-
-    
-"""
\ No newline at end of file
+    - PostListPaginationTests (APITestCase): Class to test cursor pagination of PostsListView.
+    - PostStreamingTests (APITestCase): Class to test streaming mode of PostsListView & PostsExportView.
+    - PostListQueryCountTests (APITestCase): Class to test listing posts does not query per author.
+    - PostLookupTests (APITestCase): Class to test the author filter & PostSlugDetailView.
+    - PostDetailTests (APITestCase): Class to test reading a post with ETag & conditional requests.
+    - PostListCacheTests (APITestCase): Class to test the versioned post list cache.
+    - PostModificationTests (APITestCase): Class to test updating & deleting a post within a query budget.
+    - AsyncPostViewsTests (TestCase): Class to test the async list, create, update & delete views.
+    - PostBulkCreationTests (APITestCase): Class to test creating posts in bulk.
+    - PostBulkDeletionTests (APITestCase): Class to test deleting posts in bulk.
+    - PostSearchTests (APITestCase): Class to test full-text search over posts.
+    - CompiledSerializerTests (APITestCase): Class to test the compiled serializers match DRF.
+    - PostSparseFieldsetTests (APITestCase): Class to test the 'fields' parameter of the post list.
+"""
+from rest_framework.test import APITestCase
+from rest_framework import status
+from django.http import HttpResponse
+from django.urls import reverse
+from django.db import connection
+from django.test import TestCase
+from django.core.management import call_command
+from io import StringIO
+import unittest
+from django.test.utils import CaptureQueriesContext, override_settings
+from django.core.cache import cache
+from django.utils import timezone
+from user_authentication.models import User
+from blog.models import Post
+from blog.cache import bump_posts_generation, get_posts_generation, get_posts_list_cache_stats
+from blog.compiled import compile_serializer
+from blog.serializer import PostModificationSerializer, PostSearchSerializer, PostSerializer
+from user_authentication.serializer import UserSerializer
+from user_authentication.refresh_token import get_tokens_for_user
+from typing import Self
+from unittest import mock
+import json
+import uuid
+
+
+class PostListPaginationTests(APITestCase):
+    """Test Class for cursor pagination of list posts API"""
+    # String that represents name of API for reverse
+    API: str = "list-posts"
+    data: dict[str, str] = {
+        'username': 'test_user',
+        'email': 'test@example.com',
+        'password': '1234!Example.',
+        "first_name": "Joe",
+        'last_name': "Doe",
+    }
+
+    def setUp(self: Self) -> None:
+        """
+        Set Up 7 posts where the last 3 share the same created_at.
+        """
+        cache.clear()
+        self.user: User = User.objects.create_user(**self.data)
+        for number in range(7):
+            Post.objects.create(title=f"Post {number}", content="content", author=self.user)
+        # Force a tie on created_at to check ordering by id
+        Post.objects.filter(title__in=["Post 4", "Post 5", "Post 6"]).update(created_at=timezone.now())
+        # Expected order newest first
+        self.expected: list[str] = [
+            str(post_id) for post_id in
+            Post.objects.order_by("-created_at", "-id").values_list("id", flat=True)
+        ]
+
+    def get_page(self: Self, **params) -> dict:
+        """Method used to request a page and return the decoded content"""
+        response: HttpResponse = self.client.get(reverse(self.API), params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return json.loads(response.content)
+
+    def test_unpaginated_list(self: Self) -> None:
+        """Test that without pagination parameters all posts are listed"""
+        response: HttpResponse = self.client.get(reverse(self.API))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(json.loads(response.content)), 7)
+
+    def test_walk_forward_and_backward(self: Self) -> None:
+        """Test walking every page forward then back using the cursors"""
+        seen: list[str] = []
+        pages: list[dict] = []
+        page: dict = self.get_page(page_size=3)
+        self.assertIsNone(page["previous"])
+        while True:
+            pages.append(page)
+            seen += [post["id"] for post in page["results"]]
+            if page["next"] is None:
+                break
+            page = self.get_page(page_size=3, cursor=page["next"])
+        # Pages are stable and cover every post once
+        self.assertEqual(seen, self.expected)
+        self.assertEqual([len(page["results"]) for page in pages], [3, 3, 1])
+        # Walk back from the last page
+        previous: dict = self.get_page(page_size=3, cursor=pages[-1]["previous"])
+        self.assertEqual(previous["results"], pages[1]["results"])
+        first: dict = self.get_page(page_size=3, cursor=previous["previous"])
+        self.assertEqual(first["results"], pages[0]["results"])
+        self.assertIsNone(first["previous"])
+
+    def test_page_size_is_bounded(self: Self) -> None:
+        """Test page size can not go over the maximum page size"""
+        page: dict = self.get_page(page_size=100000)
+        self.assertEqual(len(page["results"]), 7)
+        self.assertIsNone(page["next"])
+
+    def test_invalid_parameters(self: Self) -> None:
+        """Test invalid cursor & page size return 400 Bad request"""
+        for params in ({"cursor": "not-a-cursor"}, {"page_size": "ten"}, {"page_size": 0}):
+            response: HttpResponse = self.client.get(reverse(self.API), params)
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class PostStreamingTests(APITestCase):
+    """Test Class for streamed post lists"""
+    data: dict[str, str] = {
+        'username': 'test_user',
+        'email': 'test@example.com',
+        'password': '1234!Example.',
+        "first_name": "Joe",
+        'last_name': "Doe",
+    }
+
+    def setUp(self: Self) -> None:
+        """Set Up user with 5 posts"""
+        cache.clear()
+        self.user: User = User.objects.create_user(**self.data)
+        for number in range(5):
+            Post.objects.create(title=f"Post {number}", content="content", author=self.user)
+
+    def read_stream(self: Self, response: HttpResponse) -> list:
+        """Method used to consume a streamed response and decode it"""
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.streaming)
+        self.assertEqual(response["Content-Type"], "application/json")
+        return json.loads(b"".join(response.streaming_content))
+
+    def test_stream_matches_list(self: Self) -> None:
+        """Test streaming mode returns the same posts as the regular list"""
+        streamed: list = self.read_stream(self.client.get(reverse("list-posts"), {"stream": "true"}))
+        listed: list = json.loads(self.client.get(reverse("list-posts")).content)
+        self.assertEqual(len(streamed), 5)
+        self.assertEqual(
+            sorted(streamed, key=lambda post: post["id"]),
+            sorted(listed, key=lambda post: post["id"]),
+        )
+
+    def test_export(self: Self) -> None:
+        """Test export streams every post as an attachment newest first"""
+        response: HttpResponse = self.client.get(reverse("export-posts"))
+        self.assertIn("attachment", response["Content-Disposition"])
+        exported: list = self.read_stream(response)
+        self.assertEqual([post["title"] for post in exported], [f"Post {n}" for n in range(4, -1, -1)])
+
+    def test_empty_stream(self: Self) -> None:
+        """Test streaming an empty table returns an empty JSON array"""
+        Post.objects.all().delete()
+        self.assertEqual(self.read_stream(self.client.get(reverse("export-posts"))), [])
+
+
+class PostListQueryCountTests(APITestCase):
+    """Test Class for the number of queries used to list posts"""
+
+    def setUp(self: Self) -> None:
+        """Set Up an empty cache"""
+        cache.clear()
+
+    def create_posts(self: Self, count: int) -> None:
+        """Method used to create posts each one by a different author"""
+        for _ in range(count):
+            number: int = User.objects.count()
+            user: User = User.objects.create_user(
+                username=f"user_{number}",
+                email=f"user{number}@example.com",
+                password="1234!Example.",
+            )
+            Post.objects.create(title=f"Post {number}", content="content", author=user)
+
+    def count_queries(self: Self, **params) -> int:
+        """Method used to count queries run by a list request"""
+        with CaptureQueriesContext(connection) as context:
+            response: HttpResponse = self.client.get(reverse("list-posts"), params)
+            if response.streaming:
+                b"".join(response.streaming_content)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return len(context.captured_queries)
+
+    def test_constant_queries(self: Self) -> None:
+        """Test listing 1 or 10 posts by different authors costs the same number of queries"""
+        for params in ({}, {"page_size": 50}, {"stream": "true"}):
+            with self.captureOnCommitCallbacks(execute=True):
+                Post.objects.all().delete()
+                self.create_posts(1)
+            single: int = self.count_queries(**params)
+            with self.captureOnCommitCallbacks(execute=True):
+                self.create_posts(9)
+            self.assertEqual(self.count_queries(**params), single)
+            self.assertEqual(single, 1)
+
+    def test_author_is_serialized(self: Self) -> None:
+        """Test the nested author still holds the fields of UserSerializer"""
+        self.create_posts(1)
+        post: dict = json.loads(self.client.get(reverse("list-posts")).content)[0]
+        self.assertEqual(set(post["author"]), {"email", "first_name", "last_name", "username"})
+
+
+class PostLookupTests(APITestCase):
+    """Test Class for reading posts by author & slug"""
+
+    def setUp(self: Self) -> None:
+        """Set Up two authors, one of them wrote two posts with the same title"""
+        cache.clear()
+        self.joe: User = User.objects.create_user(username="joe", email="joe@example.com", password="1234!Example.")
+        self.jane: User = User.objects.create_user(username="jane", email="jane@example.com", password="1234!Example.")
+        self.old: Post = Post.objects.create(title="Hello World", content="old", author=self.joe)
+        self.new: Post = Post.objects.create(title="Hello World", content="new", author=self.joe)
+        Post.objects.create(title="Other", content="content", author=self.jane)
+
+    def test_filter_by_author(self: Self) -> None:
+        """Test listing posts of a single author"""
+        response: HttpResponse = self.client.get(reverse("list-posts"), {"author": "joe", "page_size": 10})
+        results: list = json.loads(response.content)["results"]
+        self.assertEqual([post["id"] for post in results], [str(self.new.id), str(self.old.id)])
+
+    def test_slug_detail(self: Self) -> None:
+        """Test reading a post by slug returns the newest post with the slug"""
+        response: HttpResponse = self.client.get(reverse("post-slug-detail", args=["hello-world"]))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(json.loads(response.content)["id"], str(self.new.id))
+
+    def test_slug_not_found(self: Self) -> None:
+        """Test unknown slug returns 404 Not found"""
+        response: HttpResponse = self.client.get(reverse("post-slug-detail", args=["missing"]))
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+
+class PostDetailTests(APITestCase):
+    """Test Class for reading a single post"""
+    # String that represents name of API for reverse
+    API: str = "update-delete-post"
+
+    def setUp(self: Self) -> None:
+        """Set Up a post and an empty cache"""
+        cache.clear()
+        self.user: User = User.objects.create_user(username="joe", email="joe@example.com", password="1234!Example.")
+        self.post: Post = Post.objects.create(title="Hello World", content="content", author=self.user)
+        self.url: str = reverse(self.API, args=[self.post.id])
+
+    def test_read_post(self: Self) -> None:
+        """Test reading a post without credentials returns it with validators"""
+        response: HttpResponse = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(json.loads(response.content)["title"], "Hello World")
+        self.assertTrue(response["ETag"].startswith('"'))
+        self.assertIn("Last-Modified", response)
+
+    def test_not_found(self: Self) -> None:
+        """Test reading a missing post returns 404 Not found"""
+        response: HttpResponse = self.client.get(reverse(self.API, args=[uuid.uuid4()]))
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_if_none_match(self: Self) -> None:
+        """Test a matching ETag returns 304 without running the serializer"""
+        etag: str = self.client.get(self.url)["ETag"]
+        with mock.patch("blog.serializer.PostSerializer.to_representation") as representation:
+            with self.assertNumQueries(1):
+                response: HttpResponse = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+            representation.assert_not_called()
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_if_modified_since(self: Self) -> None:
+        """Test an up to date Last-Modified returns 304"""
+        last_modified: str = self.client.get(self.url)["Last-Modified"]
+        response: HttpResponse = self.client.get(self.url, HTTP_IF_MODIFIED_SINCE=last_modified)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_cache_hit(self: Self) -> None:
+        """Test the second read is served from the cache with a single query"""
+        first: HttpResponse = self.client.get(self.url)
+        with self.assertNumQueries(1):
+            second: HttpResponse = self.client.get(self.url)
+        self.assertEqual(first.content, second.content)
+
+    def test_update_changes_etag(self: Self) -> None:
+        """Test saving the post makes a new ETag and a fresh representation"""
+        first: HttpResponse = self.client.get(self.url)
+        self.post.title = "Changed"
+        self.post.save()
+        response: HttpResponse = self.client.get(self.url, HTTP_IF_NONE_MATCH=first["ETag"])
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response["ETag"], first["ETag"])
+        self.assertEqual(json.loads(response.content)["title"], "Changed")
+
+
+class PostListCacheTests(APITestCase):
+    """Test Class for the post list cache"""
+    # String that represents name of API for reverse
+    API: str = "list-posts"
+
+    def setUp(self: Self) -> None:
+        """Set Up an empty cache & a post"""
+        cache.clear()
+        self.user: User = User.objects.create_user(username="joe", email="joe@example.com", password="1234!Example.")
+        self.post: Post = Post.objects.create(title="Hello World", content="content", author=self.user)
+
+    def get_titles(self: Self, **params) -> list[str]:
+        """Method used to list the titles of posts"""
+        response: HttpResponse = self.client.get(reverse(self.API), params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [post["title"] for post in json.loads(response.content)]
+
+    def test_hit_and_miss(self: Self) -> None:
+        """Test the second identical request is a hit served without queries"""
+        self.get_titles()
+        with self.assertNumQueries(0):
+            self.assertEqual(self.get_titles(), ["Hello World"])
+        # Different parameters are cached apart
+        self.get_titles(author="joe")
+        self.assertEqual(get_posts_list_cache_stats(), {"hits": 1, "misses": 2})
+
+    def test_save_invalidates(self: Self) -> None:
+        """Test saving or creating a post invalidates cached lists"""
+        self.get_titles()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.post.title = "Changed"
+            self.post.save()
+        self.assertEqual(self.get_titles(), ["Changed"])
+        with self.captureOnCommitCallbacks(execute=True):
+            Post.objects.create(title="Second", content="content", author=self.user)
+        self.assertEqual(sorted(self.get_titles()), ["Changed", "Second"])
+
+    def test_invalidated_on_commit(self: Self) -> None:
+        """Test the generation is bumped once the writing transaction commits, not before"""
+        generation: int = get_posts_generation()
+        with self.captureOnCommitCallbacks() as callbacks:
+            self.post.title = "Changed"
+            self.post.save()
+        # A list read before the commit is cached under the current generation
+        self.assertEqual(get_posts_generation(), generation)
+        for callback in callbacks:
+            callback()
+        self.assertNotEqual(get_posts_generation(), generation)
+
+    def test_delete_invalidates(self: Self) -> None:
+        """Test deleting a post through the API invalidates cached lists"""
+        self.get_titles()
+        self.client.force_authenticate(self.user)
+        with self.captureOnCommitCallbacks(execute=True):
+            response: HttpResponse = self.client.delete(reverse("update-delete-post", args=[self.post.id]))
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertEqual(self.get_titles(), [])
+
+    def test_cascade_invalidates(self: Self) -> None:
+        """Test deleting the author invalidates cached lists through the cascade"""
+        self.get_titles()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.delete()
+        self.assertEqual(self.get_titles(), [])
+
+    def test_author_change_invalidates(self: Self) -> None:
+        """Test changing the author details invalidates cached lists"""
+        self.get_titles()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.first_name = "Joseph"
+            self.user.save()
+        response: HttpResponse = self.client.get(reverse(self.API))
+        self.assertEqual(json.loads(response.content)[0]["author"]["first_name"], "Joseph")
+
+
+class PostModificationTests(APITestCase):
+    """Test Class for updating & deleting posts"""
+    # String that represents name of API for reverse
+    API: str = "update-delete-post"
+
+    def setUp(self: Self) -> None:
+        """Set Up a post with its author authenticated"""
+        self.user: User = User.objects.create_user(username="joe", email="joe@example.com", password="1234!Example.")
+        self.other: User = User.objects.create_user(username="jane", email="jane@example.com", password="1234!Example.")
+        self.post: Post = Post.objects.create(title="Hello World", content="content", author=self.user)
+        self.url: str = reverse(self.API, args=[self.post.id])
+        self.client.force_authenticate(self.user)
+
+    def put_data(self: Self, **changes) -> dict:
+        """Method used to build the body of a PUT request"""
+        data: dict = {
+            "id": str(self.post.id),
+            "title": "Changed",
+            "content": "changed content",
+            "author": {"email": self.user.email},
+        }
+        data.update(changes)
+        return data
+
+    def test_update_query_budget(self: Self) -> None:
+        """Test an authorized PUT loads the post once and updates it"""
+        # SELECT post, UPDATE post
+        with self.assertNumQueries(2):
+            response: HttpResponse = self.client.put(self.url, self.put_data(), format="json")
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.title, "Changed")
+        self.assertEqual(self.post.slug, "changed")
+
+    def test_update_unchanged(self: Self) -> None:
+        """Test a PUT that changes nothing skips the UPDATE"""
+        # SELECT post
+        with self.assertNumQueries(1):
+            response: HttpResponse = self.client.put(
+                self.url, self.put_data(title="Hello World", content="content"), format="json"
+            )
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+
+    def test_update_deleted_meanwhile(self: Self) -> None:
+        """Test a PUT on a post deleted after it has been loaded answers 404"""
+        validate = PostModificationSerializer.validate
+
+        def validate_then_delete(serializer: PostModificationSerializer, attr: dict) -> dict:
+            attr = validate(serializer, attr)
+            Post.objects.filter(id=self.post.id).delete()
+            return attr
+
+        with mock.patch.object(PostModificationSerializer, "validate", validate_then_delete):
+            response: HttpResponse = self.client.put(self.url, self.put_data(), format="json")
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_patch_single_query(self: Self) -> None:
+        """Test a PATCH writes the supplied fields with a single UPDATE"""
+        cache.clear()
+        self.assertEqual(json.loads(self.client.get(reverse("list-posts")).content)[0]["title"], "Hello World")
+        with self.captureOnCommitCallbacks(execute=True), CaptureQueriesContext(connection) as queries:
+            response: HttpResponse = self.client.patch(self.url, {"title": "Fixed Typo"}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        self.assertEqual(len(queries.captured_queries), 1)
+        sql: str = queries.captured_queries[0]["sql"]
+        self.assertTrue(sql.startswith("UPDATE"))
+        self.assertNotIn('"content"', sql)
+        post: Post = Post.objects.get(id=self.post.id)
+        self.assertEqual((post.title, post.slug, post.content), ("Fixed Typo", "fixed-typo", "content"))
+        self.assertGreater(post.updated_at, self.post.updated_at)
+        # Cached lists are invalidated
+        self.assertEqual(json.loads(self.client.get(reverse("list-posts")).content)[0]["title"], "Fixed Typo")
+        # The summary follows the content
+        self.assertEqual(
+            self.client.patch(self.url, {"content": "new content"}, format="json").status_code,
+            status.HTTP_202_ACCEPTED,
+        )
+        post = Post.objects.get(id=self.post.id)
+        self.assertEqual((post.excerpt, post.word_count), ("new content", 2))
+
+    def test_patch_errors(self: Self) -> None:
+        """Test PATCH validation, missing post & someone else's post"""
+        for data in ({}, {"title": "123"}, {"content": ""}):
+            with self.assertNumQueries(0):
+                response: HttpResponse = self.client.patch(self.url, data, format="json")
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST, data)
+        response = self.client.patch(reverse(self.API, args=[uuid.uuid4()]), {"title": "Title"}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.client.force_authenticate(self.other)
+        response = self.client.patch(self.url, {"content": "stolen"}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertEqual(Post.objects.get(id=self.post.id).content, "content")
+
+    def test_delete_query_budget(self: Self) -> None:
+        """Test an authorized DELETE loads the post once and deletes it"""
+        # SELECT post, DELETE post
+        with self.assertNumQueries(2):
+            response: HttpResponse = self.client.delete(self.url)
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertFalse(Post.objects.filter(id=self.post.id).exists())
+
+    def test_not_author(self: Self) -> None:
+        """Test a user that is not the author is forbidden"""
+        self.client.force_authenticate(self.other)
+        for response in (
+            self.client.put(self.url, self.put_data(author={"email": self.other.email}), format="json"),
+            self.client.delete(self.url),
+        ):
+            self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertTrue(Post.objects.filter(id=self.post.id).exists())
+
+    def test_id_mismatch(self: Self) -> None:
+        """Test a body id that does not match the url is detected"""
+        other: Post = Post.objects.create(title="Other", content="content", author=self.user)
+        response: HttpResponse = self.client.put(self.url, self.put_data(id=str(other.id)), format="json")
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+
+class AsyncPostViewsTests(TestCase):
+    """Test Class for the async post views"""
+
+    def setUp(self: Self) -> None:
+        """Set Up a user with a post & an access token"""
+        cache.clear()
+        self.user: User = User.objects.create_user(
+            username="test_user", email="test@example.com", password="1234!Example."
+        )
+        self.post: Post = Post.objects.create(title="First", content="content", author=self.user)
+        self.headers: dict[str, str] = {
+            "HTTP_AUTHORIZATION": f"Bearer {get_tokens_for_user(self.user)['access']}"
+        }
+
+    async def test_list(self: Self) -> None:
+        """Test the async list answers like the sync list, paginated or not"""
+        response: HttpResponse = await self.async_client.get(reverse("async-list-posts"))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        posts: list[dict] = json.loads(response.content)
+        self.assertEqual([post["title"] for post in posts], ["First"])
+        self.assertEqual(posts[0]["author"]["username"], "test_user")
+        response = await self.async_client.get(reverse("async-list-posts"), {"page_size": 1})
+        self.assertEqual(json.loads(response.content)["results"][0]["id"], str(self.post.id))
+        response = await self.async_client.get(reverse("async-list-posts"), {"cursor": "broken"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    async def test_list_cache(self: Self) -> None:
+        """Test the async list reads & fills the post list cache with the async cache API"""
+        with mock.patch("blog.views.get_cached_posts_list") as get_cached_posts_list:
+            await self.async_client.get(reverse("async-list-posts"))
+            response: HttpResponse = await self.async_client.get(reverse("async-list-posts"))
+        get_cached_posts_list.assert_not_called()
+        self.assertEqual(json.loads(response.content)[0]["title"], "First")
+        self.assertEqual(get_posts_list_cache_stats(), {"hits": 1, "misses": 1})
+
+    def test_list_matches_sync_view(self: Self) -> None:
+        """Test the async list returns the same body as PostsListView"""
+        sync_response: HttpResponse = self.client.get(reverse("list-posts"), {"author": "test_user"})
+        cache.clear()
+        async_response: HttpResponse = self.client.get(reverse("async-list-posts"), {"author": "test_user"})
+        self.assertEqual(json.loads(sync_response.content), json.loads(async_response.content))
+
+    def test_create(self: Self) -> None:
+        """Test creating a post through the async view"""
+        url: str = reverse("async-create-post")
+        # Not authenticated
+        response: HttpResponse = self.client.post(url, {"title": "Second", "content": "content"})
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+        # Invalid data
+        response = self.client.post(url, {"title": "123", "content": "content"}, **self.headers)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        # Success
+        response = self.client.post(url, {"title": "Second", "content": "content"}, **self.headers)
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(Post.objects.get(title="Second").slug, "second")
+
+    def test_update_and_delete(self: Self) -> None:
+        """Test updating & deleting a post through the async view"""
+        url: str = reverse("async-update-delete-post", kwargs={"pk": self.post.id})
+        data: dict = {
+            "id": str(self.post.id), "title": "Updated", "content": "new content",
+            "author": {"email": self.user.email},
+        }
+        response: HttpResponse = self.client.put(url, data, content_type="application/json", **self.headers)
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        self.post.refresh_from_db()
+        self.assertEqual((self.post.title, self.post.slug), ("Updated", "updated"))
+        # Someone else's post
+        other: User = User.objects.create_user(username="other", email="other@example.com", password="x")
+        headers: dict[str, str] = {"HTTP_AUTHORIZATION": f"Bearer {get_tokens_for_user(other)['access']}"}
+        response = self.client.delete(url, **headers)
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        # Delete
+        response = self.client.delete(url, **self.headers)
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertFalse(Post.objects.filter(id=self.post.id).exists())
+
+    def test_update_deleted_meanwhile(self: Self) -> None:
+        """Test the async PUT answers 404 like the sync view for a post deleted after it has been loaded"""
+        url: str = reverse("async-update-delete-post", kwargs={"pk": self.post.id})
+        data: dict = {
+            "id": str(self.post.id), "title": "Updated", "content": "new content",
+            "author": {"email": self.user.email},
+        }
+        validate = PostModificationSerializer.validate
+
+        def validate_then_delete(serializer: PostModificationSerializer, attr: dict) -> dict:
+            attr = validate(serializer, attr)
+            Post.objects.filter(id=self.post.id).delete()
+            return attr
+
+        with mock.patch.object(PostModificationSerializer, "validate", validate_then_delete):
+            response: HttpResponse = self.client.put(url, data, content_type="application/json", **self.headers)
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertEqual(json.loads(response.content), "Post does not exist")
+
+
+class PostBulkCreationTests(APITestCase):
+    """Test Class for bulk creation of posts"""
+    # String that represents name of API for reverse
+    API: str = "bulk-posts"
+
+    def setUp(self: Self) -> None:
+        """Set Up an authenticated user"""
+        cache.clear()
+        self.user: User = User.objects.create_user(
+            username="test_user", email="test@example.com", password="1234!Example."
+        )
+        self.client.force_authenticate(self.user)
+
+    def test_bulk_create(self: Self) -> None:
+        """Test valid items are inserted in batches & invalid ones are reported by index"""
+        items: list = [{"title": f"Post {number}", "content": "content"} for number in range(5)]
+        items.insert(2, {"title": "123", "content": "content"})
+        items.append("not a post")
+        with mock.patch("blog.views.PostBulkView.batch_size", 2), CaptureQueriesContext(connection) as queries:
+            response: HttpResponse = self.client.post(reverse(self.API), items, format="json")
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        data: dict = json.loads(response.content)
+        self.assertEqual(len(data["created"]), 5)
+        self.assertEqual([error["index"] for error in data["errors"]], [2, 6])
+        self.assertIn("title", data["errors"][0]["errors"])
+        # 5 posts in batches of 2
+        inserts: list[str] = [query["sql"] for query in queries.captured_queries if query["sql"].startswith("INSERT")]
+        self.assertEqual(len(inserts), 3)
+        # Slugs are generated like Post.save
+        post: Post = Post.objects.get(id=data["created"][0])
+        self.assertEqual((post.title, post.slug, post.author_id), ("Post 0", "post-0", self.user.pk))
+        self.assertEqual((post.excerpt, post.word_count, post.reading_time), ("content", 1, 1))
+        self.assertIsNotNone(post.created_at)
+
+    def test_bulk_create_invalidates_lists(self: Self) -> None:
+        """Test cached lists are invalidated although bulk_create sends no signals"""
+        self.assertEqual(json.loads(self.client.get(reverse("list-posts")).content), [])
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(reverse(self.API), [{"title": "Post", "content": "content"}], format="json")
+        self.assertEqual(len(json.loads(self.client.get(reverse("list-posts")).content)), 1)
+
+    def test_bulk_create_invalid(self: Self) -> None:
+        """Test a body without any valid post"""
+        response: HttpResponse = self.client.post(reverse(self.API), {"title": "Post"}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        response = self.client.post(reverse(self.API), [{"title": "Post"}], format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(json.loads(response.content)["errors"][0]["index"], 0)
+        self.assertFalse(Post.objects.exists())
+
+
+class PostBulkDeletionTests(APITestCase):
+    """Test Class for bulk deletion of posts"""
+    # String that represents name of API for reverse
+    API: str = "bulk-posts"
+
+    def setUp(self: Self) -> None:
+        """Set Up 5 posts of the authenticated user & 1 post of another user"""
+        cache.clear()
+        self.user: User = User.objects.create_user(
+            username="test_user", email="test@example.com", password="1234!Example."
+        )
+        self.other: User = User.objects.create_user(
+            username="other_user", email="other@example.com", password="1234!Example."
+        )
+        self.posts: list[Post] = [
+            Post.objects.create(title=f"Post {number}", content="content", author=self.user) for number in range(5)
+        ]
+        self.other_post: Post = Post.objects.create(title="Other", content="content", author=self.other)
+        self.client.force_authenticate(self.user)
+
+    def test_delete_ids(self: Self) -> None:
+        """Test deleting posts by id"""
+        ids: list[str] = [str(post.id) for post in self.posts[:2]]
+        response: HttpResponse = self.client.delete(reverse(self.API), {"ids": ids}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(json.loads(response.content), {"deleted": 2})
+        self.assertEqual(Post.objects.filter(author=self.user).count(), 3)
+
+    def test_delete_ids_not_owned(self: Self) -> None:
+        """Test nothing is deleted in case one of the posts belongs to someone else"""
+        ids: list[str] = [str(self.posts[0].id), str(self.other_post.id)]
+        response: HttpResponse = self.client.delete(reverse(self.API), {"ids": ids}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertEqual(json.loads(response.content)["ids"], [str(self.other_post.id)])
+        self.assertEqual(Post.objects.count(), 6)
+
+    def test_delete_range_in_batches(self: Self) -> None:
+        """Test deleting the posts of a date range in bounded batches"""
+        Post.objects.filter(id=self.posts[0].id).update(created_at=timezone.now() - timezone.timedelta(days=10))
+        data: dict = {"created_after": (timezone.now() - timezone.timedelta(days=1)).isoformat()}
+        with mock.patch("blog.views.PostBulkView.batch_size", 2), CaptureQueriesContext(connection) as queries:
+            response: HttpResponse = self.client.delete(reverse(self.API), data, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(json.loads(response.content), {"deleted": 4})
+        # Only the old post of the user & the post of the other user are left
+        self.assertEqual(set(Post.objects.values_list("id", flat=True)), {self.posts[0].id, self.other_post.id})
+        deletes: list[str] = [query["sql"] for query in queries.captured_queries if query["sql"].startswith("DELETE")]
+        self.assertEqual(len(deletes), 2)
+        # Post content is never loaded
+        self.assertFalse(any('"content"' in query["sql"] for query in queries.captured_queries))
+
+    def test_delete_bumps_once_per_batch(self: Self) -> None:
+        """Test the cached lists are invalidated once per batch instead of once per deleted post"""
+        self.client.get(reverse("list-posts"))
+        with mock.patch("blog.views.PostBulkView.batch_size", 2), \
+                mock.patch("blog.cache.bump_posts_generation", wraps=bump_posts_generation) as bump, \
+                self.captureOnCommitCallbacks(execute=True):
+            response: HttpResponse = self.client.delete(
+                reverse(self.API), {"created_after": "2000-01-01"}, format="json"
+            )
+        self.assertEqual(json.loads(response.content), {"deleted": 5})
+        # 3 batches
+        self.assertEqual(bump.call_count, 3)
+        posts: list[dict] = json.loads(self.client.get(reverse("list-posts")).content)
+        self.assertEqual([post["title"] for post in posts], ["Other"])
+
+    def test_delete_invalid(self: Self) -> None:
+        """Test the posts must be selected either by ids or by a date range"""
+        for data in ({}, {"ids": []}, {"ids": ["x"]}, {"ids": [str(self.posts[0].id)], "created_before": "2020-01-01"}):
+            response: HttpResponse = self.client.delete(reverse(self.API), data, format="json")
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST, data)
+        self.assertEqual(Post.objects.count(), 6)
+
+
+@unittest.skipUnless(connection.vendor == "sqlite", "Full-text search uses SQLite FTS5.")
+class PostSearchTests(APITestCase):
+    """Test Class for full-text search over posts"""
+    # String that represents name of API for reverse
+    API: str = "search-posts"
+
+    def setUp(self: Self) -> None:
+        """Set Up posts mentioning django in the title or in the content"""
+        self.user: User = User.objects.create_user(
+            username="test_user", email="test@example.com", password="1234!Example."
+        )
+        self.in_content: Post = Post.objects.create(
+            title="Web frameworks", content="A long story about Django and other things.", author=self.user
+        )
+        self.in_title: Post = Post.objects.create(
+            title="Django tips", content="Tips for writing views.", author=self.user
+        )
+        self.unrelated: Post = Post.objects.create(title="Cooking", content="Pasta recipes.", author=self.user)
+
+    def search(self: Self, **params) -> dict:
+        """Method used to search & return the decoded content"""
+        response: HttpResponse = self.client.get(reverse(self.API), params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return json.loads(response.content)
+
+    def test_ranking_and_highlights(self: Self) -> None:
+        """Test title matches rank first & matched words are highlighted"""
+        results: list[dict] = self.search(q="django")["results"]
+        self.assertEqual([result["id"] for result in results], [str(self.in_title.id), str(self.in_content.id)])
+        self.assertEqual(results[0]["highlighted_title"], "<mark>Django</mark> tips")
+        self.assertIn("<mark>Django</mark>", results[1]["snippet"])
+        self.assertEqual(results[0]["author"]["username"], "test_user")
+        self.assertNotIn("content", results[0])
+
+    def test_highlights_are_escaped(self: Self) -> None:
+        """Test markup stored in posts is escaped, only the <mark> tags are markup"""
+        Post.objects.create(
+            title="<img src=x onerror=alert(1)> django",
+            content="<script>alert(1)</script> about django & more",
+            author=self.user,
+        )
+        results: list[dict] = self.search(q="alert")["results"]
+        self.assertEqual(len(results), 1)
+        self.assertEqual(results[0]["highlighted_title"], "&lt;img src=x onerror=<mark>alert</mark>(1)&gt; django")
+        self.assertNotIn("<script>", results[0]["snippet"])
+        self.assertIn("&lt;script&gt;<mark>alert</mark>(1)&lt;/script&gt;", results[0]["snippet"])
+        self.assertIn("&amp; more", results[0]["snippet"])
+        # The plain title stays unescaped JSON data
+        self.assertEqual(results[0]["title"], "<img src=x onerror=alert(1)> django")
+
+    def test_cursor_pagination(self: Self) -> None:
+        """Test walking the results one page at a time"""
+        first: dict = self.search(q="django", page_size=1)
+        self.assertEqual(first["results"][0]["id"], str(self.in_title.id))
+        second: dict = self.search(q="django", page_size=1, cursor=first["next"])
+        self.assertEqual(second["results"][0]["id"], str(self.in_content.id))
+        self.assertIsNone(second["next"])
+
+    def test_index_follows_writes(self: Self) -> None:
+        """Test updates, deletes & bulk inserts are searchable right away"""
+        self.unrelated.title = "Django pasta"
+        self.unrelated.save()
+        self.in_content.delete()
+        Post.objects.bulk_create([Post(title="Bulk", slug="bulk", content="django in bulk", author=self.user)])
+        titles: list[str] = [result["title"] for result in self.search(q="django")["results"]]
+        self.assertEqual(sorted(titles), ["Bulk", "Django pasta", "Django tips"])
+
+    def test_query_is_sanitized(self: Self) -> None:
+        """Test FTS5 operators & punctuation in the input are searched as words"""
+        self.assertEqual(len(self.search(q='django" (*')["results"]), 2)
+        # Every word must match, OR is a word
+        self.assertEqual(self.search(q="django OR cooking")["results"], [])
+        response: HttpResponse = self.client.get(reverse(self.API), {"q": "  ?! "})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        response = self.client.get(reverse(self.API), {"q": "django", "cursor": "broken"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_rebuild_command(self: Self) -> None:
+        """Test rebuilding the index out of the posts table"""
+        with connection.cursor() as cursor:
+            cursor.execute("DELETE FROM post_fts")
+        self.assertEqual(self.search(q="django")["results"], [])
+        output: StringIO = StringIO()
+        call_command("rebuild_post_search", stdout=output)
+        self.assertIn("Indexed 3 posts", output.getvalue())
+        self.assertEqual(len(self.search(q="django")["results"]), 2)
+
+
+class CompiledSerializerTests(APITestCase):
+    """Test Class for the compiled serializers"""
+
+    def setUp(self: Self) -> None:
+        """Set Up 2 authors with 3 posts"""
+        cache.clear()
+        self.users: list[User] = [
+            User.objects.create_user(
+                username=f"user_{number}", email=f"user{number}@example.com", password="1234!Example.",
+                first_name="Joe", last_name="Doe",
+            )
+            for number in range(2)
+        ]
+        for number in range(3):
+            Post.objects.create(title=f"Post {number}", content="Ünïcode content", author=self.users[number % 2])
+
+    def test_parity(self: Self) -> None:
+        """Test compiled serializers return the same data as DRF"""
+        posts = PostSerializer.setup_queryset(Post.objects.order_by("-created_at", "-id"))
+        self.assertEqual(
+            compile_serializer(PostSerializer).serialize(posts),
+            PostSerializer(posts, many=True).data,
+        )
+        users = User.objects.order_by("username")
+        self.assertEqual(
+            compile_serializer(UserSerializer).serialize(users),
+            UserSerializer(users, many=True).data,
+        )
+        # Active timezone is honoured like DRF does
+        with timezone.override("Asia/Tokyo"):
+            post: dict = compile_serializer(PostSerializer).serialize(posts)[0]
+            self.assertEqual(post["created_at"], PostSerializer(posts.first()).data["created_at"])
+            self.assertTrue(post["created_at"].endswith("+09:00"))
+
+    def test_single_query(self: Self) -> None:
+        """Test the rows & their authors are read in a single query"""
+        with CaptureQueriesContext(connection) as queries:
+            compile_serializer(PostSerializer).serialize(Post.objects.all())
+        self.assertEqual(len(queries), 1)
+
+    def test_not_compilable(self: Self) -> None:
+        """Test serializers with method fields are refused"""
+        with self.assertRaises(TypeError):
+            compile_serializer(PostSearchSerializer)
+
+    def test_views(self: Self) -> None:
+        """Test the list & streaming responses are unchanged with compiled serializers"""
+        for params in ({}, {"stream": "true"}, {"author": "user_1"}):
+            cache.clear()
+            expected: list = json.loads(self.client.get(reverse("list-posts"), params).getvalue())
+            cache.clear()
+            with override_settings(BLOG_COMPILED_SERIALIZERS=True):
+                response: HttpResponse = self.client.get(reverse("list-posts"), params)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertEqual(json.loads(response.getvalue()), expected)
+
+
+class PostSparseFieldsetTests(APITestCase):
+    """Test Class for sparse fieldsets on the post list"""
+    API: str = "list-posts"
+
+    def setUp(self: Self) -> None:
+        """Set Up 3 posts with a large content"""
+        cache.clear()
+        self.user: User = User.objects.create_user(
+            username="test_user", email="test@example.com", password="1234!Example.",
+            first_name="Joe", last_name="Doe",
+        )
+        for number in range(3):
+            Post.objects.create(title=f"Post {number}", content="large content " * 1000, author=self.user)
+
+    def get_posts(self: Self, url: str, params: dict) -> tuple[object, list[str]]:
+        """Method used to list posts & return the decoded content with the SQL of the post queries"""
+        with CaptureQueriesContext(connection) as queries:
+            response: HttpResponse = self.client.get(url, params)
+            content: bytes = response.getvalue()
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return json.loads(content), [query["sql"] for query in queries if "blog_post" in query["sql"]]
+
+    def test_fields(self: Self) -> None:
+        """Test only the requested fields are serialized & read, content & author are never loaded"""
+        for params in ({"fields": "title,slug"}, {"fields": "title,slug", "stream": "true"}):
+            posts, queries = self.get_posts(reverse(self.API), params)
+            self.assertEqual(len(posts), 3)
+            self.assertTrue(all(set(post) == {"title", "slug"} for post in posts))
+            self.assertEqual(len(queries), 1)
+            self.assertNotIn('"content"', queries[0])
+            self.assertNotIn("user_authentication_user", queries[0])
+
+    def test_fields_with_author(self: Self) -> None:
+        """Test the author is joined when requested & the page cursors still work"""
+        page, queries = self.get_posts(reverse(self.API), {"fields": "title,author", "page_size": 2})
+        self.assertEqual(page["results"][0]["author"]["username"], "test_user")
+        self.assertEqual(set(page["results"][0]), {"title", "author"})
+        self.assertEqual(len(queries), 1)
+        self.assertNotIn('"content"', queries[0])
+        page, _ = self.get_posts(reverse(self.API), {"fields": "title,author", "cursor": page["next"]})
+        self.assertEqual(len(page["results"]), 1)
+
+    def test_compiled_and_async(self: Self) -> None:
+        """Test the compiled & async lists return the same sparse fieldset"""
+        params: dict = {"fields": "id,title,created_at,author"}
+        expected, _ = self.get_posts(reverse(self.API), params)
+        cache.clear()
+        with override_settings(BLOG_COMPILED_SERIALIZERS=True):
+            posts, queries = self.get_posts(reverse(self.API), params)
+        self.assertEqual(posts, expected)
+        self.assertNotIn('"content"', queries[0])
+        cache.clear()
+        posts, _ = self.get_posts(reverse("async-list-posts"), params)
+        self.assertEqual(posts, expected)
+
+    def test_card_fieldset(self: Self) -> None:
+        """Test cards list the summary without reading the content"""
+        posts, queries = self.get_posts(reverse(self.API), {"fields": "card"})
+        self.assertEqual(
+            set(posts[0]), {"id", "title", "slug", "author", "created_at", "excerpt", "word_count", "reading_time"}
+        )
+        self.assertEqual((posts[0]["word_count"], posts[0]["reading_time"]), (2000, 10))
+        self.assertTrue(posts[0]["excerpt"].startswith("large content"))
+        self.assertNotIn('"content"', queries[0])
+
+    def test_backfill(self: Self) -> None:
+        """Test the backfill command fills posts saved without a summary"""
+        Post.objects.update(excerpt="", word_count=0, reading_time=0)
+        Post.objects.filter(title="Post 0").update(word_count=7)
+        output: StringIO = StringIO()
+        call_command("backfill_post_summaries", "--batch-size", "1", stdout=output)
+        self.assertIn("Updated 2 posts", output.getvalue())
+        self.assertEqual(Post.objects.filter(word_count=2000).count(), 2)
+        call_command("backfill_post_summaries", "--all", stdout=output)
+        self.assertEqual(Post.objects.filter(word_count=2000, reading_time=10).count(), 3)
+        # The search index still finds the posts
+        if connection.vendor == "sqlite":
+            response: HttpResponse = self.client.get(reverse("search-posts"), {"q": "large"})
+            self.assertEqual(len(json.loads(response.content)["results"]), 3)
+
+    def test_unknown_field(self: Self) -> None:
+        """Test unknown fields are refused"""
+        for url in (reverse(self.API), reverse("async-list-posts")):
+            response: HttpResponse = self.client.get(url, {"fields": "title,password"})
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+            self.assertIn("password", json.loads(response.content)["fields"])
+
+    def test_field_order(self: Self) -> None:
+        """Test every ordering of the same fields is read in declared order & compiled once"""
+        orderings: list[str] = ["title,slug,id", "slug,id,title", "id,title,slug,title"]
+        self.assertEqual({PostSerializer.parse_fields(value) for value in orderings}, {("id", "title", "slug")})
+        compile_serializer.cache_clear()
+        for value in orderings:
+            compile_serializer(PostSerializer, PostSerializer.parse_fields(value))
+        self.assertEqual(compile_serializer.cache_info().currsize, 1)
+        self.assertIsNotNone(compile_serializer.cache_info().maxsize)
@@ -1,15 +1,34 @@
 from django.urls import path
 from .views import (
     PostCreationView,
+    PostBulkView,
     PostModificationView,
     PostsListView,
+    PostsExportView,
+    PostSlugDetailView,
+    PostSearchView,
+    AsyncPostsListView,
+    AsyncPostCreationView,
+    AsyncPostModificationView,
 )
 
 urlpatterns = [
     # View to list all posts.
     path("", PostsListView.as_view(), name="list-posts"),
+    # View to export all posts as a streamed JSON file.
+    path("export", PostsExportView.as_view(), name="export-posts"),
     # View to create a post.
     path("create", PostCreationView.as_view(), name="create-post-view"),
-    # View to Update or delete an existing post.
+    # View to create posts in bulk.
+    path("bulk", PostBulkView.as_view(), name="bulk-posts"),
+    # View to search posts.
+    path("search", PostSearchView.as_view(), name="search-posts"),
+    # View to read a post by slug.
+    path("slug/<slug:slug>", PostSlugDetailView.as_view(), name="post-slug-detail"),
+    # Async views served natively under ASGI.
+    path("async", AsyncPostsListView.as_view(), name="async-list-posts"),
+    path("async/create", AsyncPostCreationView.as_view(), name="async-create-post"),
+    path("async/<uuid:pk>", AsyncPostModificationView.as_view(), name="async-update-delete-post"),
+    # View to Read, Update or delete an existing post.
     path("<uuid:pk>", PostModificationView.as_view(), name="update-delete-post"),
 ]
\ No newline at end of file
@@ -1,15 +1,36 @@
 """
 This File contains API View classes & functions:-
     - PostCreationView (APIView): Class API for creating posts.
-    - PostModificationView (APIView): Class API updating & deleting posts.
-    - PostListView (APIView): Class API for Listing posts of an auther.
+    - PostBulkView (APIView): Class API for creating & deleting posts in bulk.
+    - PostModificationView (APIView): Class API reading, updating, partially updating & deleting posts.
+    - PostListView (APIView): Class API for Listing posts of an auther, paginated by cursor or streamed on demand.
+    - PostsExportView (APIView): Class API for exporting all posts as a streamed JSON file.
+    - PostSlugDetailView (APIView): Class API for reading a single post by its slug.
+    - PostSearchView (APIView): Class API for full-text search over posts ranked by relevance.
+    - authenticate_request (function): Authenticates a request of an async view.
+    - AsyncPostsListView (View): Async version of PostsListView.
+    - AsyncPostCreationView (View): Async version of PostCreationView.
+    - AsyncPostModificationView (View): Async version of PostModificationView for PUT & DELETE.
 
 Protected API Views:
     - PostView Protected by (IsAuthenticated, IsActiveUser) class Permissions.
+    - PostBulkView Protected by (IsAuthenticated, IsActiveUser) class Permissions.
     - PostModificationView Protected by (IsAuthenticated, IsActiveUser) class Permissions.
+    - AsyncPostCreationView & AsyncPostModificationView Protected by the same checks through authenticate_request.
 
 Unprotected API Views:
     - PostListView
+    - PostModificationView GET method.
+    - PostsExportView
+    - PostSlugDetailView
+    - PostSearchView
+    - AsyncPostsListView
+
+Notes:
+    - Async views run natively under project_blog/asgi.py, reads use the async ORM (aget, afirst,\
+        async iteration) and authentication trusts the token snapshot, so a list request never leaves\
+        the event loop for a thread except for the database driver itself.
+    - Django 4.1 has no Model.asave, updating a post validates & saves it in a single sync_to_async call.
 """
 from rest_framework.response import Response
 from rest_framework.request import Request
@@ -22,8 +43,40 @@ from .serializer import (
     PostSerializer,
     PostModificationSerializer,
     PostCreateSerializer,
+    PostBulkDeleteSerializer,
+    PostSearchSerializer,
+    PostPatchSerializer,
 )
 from .permissions import IsAuthor
+from .loaders import get_request_post
+from .pagination import PostCursorPaginator, PostSearchPaginator
+from .search import is_search_available, build_match_query, search_posts
+from .streaming import streaming_json_response
+from .compiled import compile_serializer
+from .cache import (
+    get_post_detail,
+    post_etag,
+    get_cached_posts_list,
+    set_cached_posts_list,
+    aget_cached_posts_list,
+    aset_cached_posts_list,
+    bump_posts_generation_on_commit,
+    bulk_posts_write,
+)
+from django.conf import settings
+from django.db import transaction
+from django.http import HttpRequest, HttpResponseBase, JsonResponse, StreamingHttpResponse
+from django.utils.decorators import method_decorator
+from django.views import View
+from django.views.decorators.csrf import csrf_exempt
+from asgiref.sync import sync_to_async
+from rest_framework.exceptions import AuthenticationFailed, PermissionDenied, ValidationError
+from rest_framework_simplejwt.exceptions import InvalidToken
+from user_authentication.authentication import ClaimsJWTAuthentication
+from user_authentication.views import not_authenticated_response, parse_request_data
+from user_authentication.models import User
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
 from .models import Post
 from typing import Self
 import json
@@ -64,15 +117,177 @@ class PostCreationView(APIView):
         # Otherwise return error
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
+
+class PostBulkView(APIView):
+    """Class related to Creating & Deleting posts in bulk"""
+    # Serializer used for every item
+    serializer_class: PostCreateSerializer = PostCreateSerializer
+    # Serializer used to select posts to delete
+    delete_serializer_class: PostBulkDeleteSerializer = PostBulkDeleteSerializer
+    # Permissions
+    permission_classes: tuple[BasePermission] = (IsAuthenticated, IsActiveUser)
+    # Number of posts inserted per INSERT statement & deleted per transaction
+    batch_size: int = 500
+    # Maximum number of posts per request
+    max_items: int = 10_000
+
+    def post(self: Self, request: Request, *args, **kwargs) -> Response:
+        """
+        Post API view to create many posts at once.
+
+        Args:
+            - request (Request): Object that contains a list of posts, each with a title & content.
+
+        Returns:
+            - Response (Response): With the ids of the created posts & the errors of the rejected items\
+                by their index status code 201 created in case any post was created.\
+                Or Error Message status code 400 Bad request in case no post was valid.
+        """
+        items: object = request.data
+        # Check the body format
+        if not isinstance(items, list):
+            return Response("Expected a list of posts.", status=status.HTTP_400_BAD_REQUEST)
+        if len(items) > self.max_items:
+            return Response(
+                f"Can't create more than {self.max_items} posts at once.", status=status.HTTP_400_BAD_REQUEST
+            )
+        # Validate every item with the same rules as PostCreationView
+        context: dict = {"author": request.user}
+        posts: list[Post] = []
+        errors: list[dict] = []
+        for index, item in enumerate(items):
+            serializer: PostCreateSerializer = self.serializer_class(data=item, context=context)
+            if serializer.is_valid():
+                posts.append(serializer.build())
+            else:
+                errors.append({"index": index, "errors": serializer.errors})
+        data: dict = {"created": [str(post.id) for post in posts], "errors": errors}
+        if not posts:
+            return Response(data, status=status.HTTP_400_BAD_REQUEST)
+        # Insert every valid post in a single transaction
+        with transaction.atomic():
+            Post.objects.bulk_create(posts, batch_size=self.batch_size)
+        # bulk_create sends no signals
+        bump_posts_generation_on_commit()
+        return Response(data, status=status.HTTP_201_CREATED)
+
+    def delete(self: Self, request: Request, *args, **kwargs) -> Response:
+        """
+        Delete API view to delete many posts of the request user at once.
+
+        Args:
+            - request (Request): Object that contains either 'ids' a list of post ids,\
+                or 'created_after' and/or 'created_before' to delete the user posts created in that range.
+
+        Returns:
+            - Response (Response): With the number of deleted posts status code 200 OK.\
+                Or Error Message status code 400 Bad request.\
+                Or the ids that are not posts of the user status code 403 Forbidden, nothing is deleted.
+        """
+        serializer: PostBulkDeleteSerializer = self.delete_serializer_class(data=request.data)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+        ids: list[uuid.UUID] | None = serializer.validated_data.get("ids")
+        if ids is None:
+            posts: Post = serializer.get_queryset(request.user)
+        else:
+            # Check ownership of every post with a single query
+            requested: set[uuid.UUID] = set(ids)
+            owned: set[uuid.UUID] = set(
+                Post.objects.filter(id__in=requested, author=request.user).values_list("id", flat=True)
+            )
+            if owned != requested:
+                return Response(
+                    {"detail": "Unauthorized action detected.", "ids": sorted(str(pk) for pk in requested - owned)},
+                    status=status.HTTP_403_FORBIDDEN,
+                )
+            posts = Post.objects.filter(id__in=owned)
+        return Response({"deleted": self.delete_in_batches(posts)}, status=status.HTTP_200_OK)
+
+    def delete_in_batches(self: Self, posts: Post) -> int:
+        """
+        Method used to delete posts in bounded batches, each batch in its own transaction.
+
+        Args:
+            - posts (QuerySet): Posts to delete.
+
+        Returns:
+            - Number of deleted posts.
+        """
+        deleted: int = 0
+        while True:
+            with transaction.atomic():
+                batch: list[uuid.UUID] = list(posts.values_list("id", flat=True)[:self.batch_size])
+                if not batch:
+                    break
+                # Only ids are loaded for the post_delete signals, the generation is bumped once per batch
+                with bulk_posts_write():
+                    count, _ = Post.objects.filter(id__in=batch).only("id").delete()
+            deleted += count
+            if len(batch) < self.batch_size:
+                break
+        return deleted
+
     
 # Create your views here.
 class PostModificationView(APIView):
-    """Class related to Creating, Updating and Deleting a post"""
+    """Class related to Reading, Updating and Deleting a post"""
     # Serializer
     serializer_class: PostModificationSerializer = PostModificationSerializer
+    # Serializer used to read the post
+    detail_serializer_class: PostSerializer = PostSerializer
+    # Serializer used for partial updates
+    patch_serializer_class: PostPatchSerializer = PostPatchSerializer
     # Permissions
     permission_classes: tuple[BasePermission] = (IsAuthenticated, IsActiveUser, IsAuthor)
 
+    def get_permissions(self: Self) -> list[BasePermission]:
+        """
+        Method that makes reading a post public while modifications stay protected,\
+            PATCH checks the author within its UPDATE instead of IsAuthor.
+        """
+        if self.request.method in ("GET", "HEAD"):
+            return []
+        if self.request.method == "PATCH":
+            return [IsAuthenticated(), IsActiveUser()]
+        return super().get_permissions()
+
+    # API get method to read a post
+    def get(self: Self, request: Request, pk: uuid, *args, **kwargs) -> Response | HttpResponseBase:
+        """
+        Method used to act as GET API method to read a single post.
+
+        Args:
+            - request (Request): Object that may carry 'If-None-Match' or 'If-Modified-Since' headers.
+            - pk (uuid): is uuid of the requested post.
+
+        Returns:
+            - Response (Response): With the serialized post, ETag & Last-Modified headers status code 200 OK.\
+                 Or empty response status code 304 Not modified in case the client copy is fresh.
+                 Or Post does not exist status code 404 Not found.
+        """
+        # Read only the version of the post
+        updated_at = Post.objects.filter(id=pk).values_list("updated_at", flat=True).first()
+        # Check if post exists
+        if updated_at is None:
+            return Response("Post does not exist", status=status.HTTP_404_NOT_FOUND)
+        etag: str = post_etag(pk, updated_at)
+        last_modified: int = int(updated_at.timestamp())
+        # Answer conditional requests without serializing the post
+        not_modified: HttpResponseBase | None = get_conditional_response(
+            request, etag=etag, last_modified=last_modified
+        )
+        if not_modified is not None:
+            return not_modified
+        # Serialized post from the cache
+        data: dict | None = get_post_detail(pk, updated_at, self.detail_serializer_class)
+        if data is None:
+            return Response("Post does not exist", status=status.HTTP_404_NOT_FOUND)
+        response: Response = Response(data, status=status.HTTP_200_OK)
+        response["ETag"] = etag
+        response["Last-Modified"] = http_date(last_modified)
+        return response
+
     # API post method to update new post
     def put(self: Self, request: Request, pk: uuid, *args, **kwargs) -> Response:
         """
@@ -86,9 +301,10 @@ class PostModificationView(APIView):
             -  Response (Response): With message of Successfully updated post status code 200 OK.\
                  Or Error Message status code 400 Bad request.
                  Or error message status 403 Forbidden for unauthorized actions.
+                 Or Post does not exist status code 404 Not found in case it is deleted meanwhile.
         """
-        # Save context in a variable
-        context: dict = {"author": request.user, "post_id": pk}
+        # Save context in a variable, the post has been loaded by IsAuthor
+        context: dict = {"author": request.user, "post_id": pk, "post": get_request_post(request, pk)}
         # Serializer
         serializer: PostModificationSerializer = self.serializer_class(
             data= request.data, context= context
@@ -96,7 +312,10 @@ class PostModificationView(APIView):
         # Validate data
         if serializer.is_valid():
             # Update the existing post with validated data
-            serializer.save()
+            try:
+                serializer.save()
+            except Post.DoesNotExist:
+                return Response("Post does not exist", status=status.HTTP_404_NOT_FOUND)
             return Response("Post Updated successfully", status=status.HTTP_202_ACCEPTED)
         # in case of Unauthurized action
         if "Unauthorized action detected." in json.dumps(serializer.errors):
@@ -104,6 +323,35 @@ class PostModificationView(APIView):
         # Error
         return Response(serializer.errors, status= status.HTTP_400_BAD_REQUEST)
 
+    # API patch method to update some fields of a post
+    def patch(self: Self, request: Request, pk: uuid, *args, **kwargs) -> Response:
+        """
+        Method used to act as PATCH API method to update some fields of a post with a single UPDATE.
+
+        Args:
+            - request (Request): Object that contains 'title' and/or 'content'.
+            - pk (uuid): is uuid of the post requested to apply modifications to.
+
+        Returns:
+            - Response (Response): With message of Successfully updated post status code 202 Accepted.\
+                 Or Error Message status code 400 Bad request.
+                 Or Post does not exist status code 404 Not found.
+                 Or error message status 403 Forbidden in case the post belongs to someone else.
+        """
+        serializer: PostPatchSerializer = self.patch_serializer_class(data=request.data)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+        # Update the post only if the request user is its author
+        updated: int = Post.objects.filter(id=pk, author_id=request.user.pk).update(**serializer.get_update_values())
+        if not updated:
+            # Nothing matched, tell a missing post from someone else's post
+            if not Post.objects.filter(id=pk).exists():
+                return Response("Post does not exist", status=status.HTTP_404_NOT_FOUND)
+            return Response("Unauthorized action detected.", status=status.HTTP_403_FORBIDDEN)
+        # QuerySet.update sends no signals
+        bump_posts_generation_on_commit()
+        return Response("Post Updated successfully", status=status.HTTP_202_ACCEPTED)
+
     # API  Method to delete the existing post
     def delete(self: Self, request: Request, pk: uuid, *args, **kwargs) -> Response:
         """
@@ -118,13 +366,13 @@ class PostModificationView(APIView):
                     Post does not exists 404 status code or\
                     Unauthorized action detected status code 403 Forbidden.
         """
-        # Get the instance of the object based on primary key
-        post: Post = Post.objects.filter(id=pk).first()
+        # Get the instance of the object based on primary key, loaded once per request
+        post: Post = get_request_post(request, pk)
         # Check if post exists
         if not post:
             return Response("Post does not exist", status=status.HTTP_404_NOT_FOUND)
         # Check the post owner to the request user
-        if request.user != post.author:
+        if request.user.pk != post.author_id:
             # Can black list user or block
             return Response("Unauthorized action detected.", status=status.HTTP_403_FORBIDDEN)
         # Delete the object from database
@@ -135,11 +383,362 @@ class PostsListView(APIView):
     """Class to list posts"""
     # Serializer
     serializer_class: PostSerializer = PostSerializer
+    # Paginator
+    pagination_class: PostCursorPaginator = PostCursorPaginator
+    # Number of rows read per database round trip in streaming mode
+    chunk_size: int = 2000
 
-    def get(self: Self, request: Request, *args, **kwargs) -> Response:
-        """Get  Method for List of all the posts"""
-        # Grab all posts
-        posts: Post = Post.objects.all()
+    def get(self: Self, request: Request, *args, **kwargs) -> Response | StreamingHttpResponse:
+        """
+        Get  Method for List of all the posts
+
+        Args:
+            - request (Request): Request that may carry 'cursor' & 'page_size' query parameters\
+                to ask for a single page of posts, or 'stream=true' to stream all posts.\
+                'author' query parameter filters posts by the username of their author.\
+                'fields' query parameter e.g. 'title,slug,author' serializes & reads only these fields,\
+                'fields=card' lists title, excerpt, word count & reading time without the content.\
+                Lists & pages are served from a cache that is invalidated on every post write.
+
+        Returns:
+            - Response (Response): With all posts or with a page of posts and next/previous cursors\
+                status code 200 OK. Or error message status code 400 Bad request for an invalid cursor\
+                or an unknown field.
+            - StreamingHttpResponse: With all posts as a JSON array in streaming mode.
+        """
+        # Requested fields
+        fields: tuple[str] | None = self.serializer_class.parse_fields(request.query_params.get("fields"))
+        # Grab all posts with their authors, only the columns of the requested fields are read
+        posts: Post = self.serializer_class.setup_queryset(Post.objects.all(), fields)
+        # Filter by author
+        author: str | None = request.query_params.get("author")
+        if author:
+            posts = posts.filter(author__username=author)
+        # Streaming mode
+        if request.query_params.get("stream") == "true":
+            return streaming_json_response(
+                posts.order_by("-created_at", "-id"), self.serializer_class, self.chunk_size,
+                compiled=settings.BLOG_COMPILED_SERIALIZERS, fields=fields,
+            )
+        # Serve the list from the cache
+        data, generation = get_cached_posts_list(request.query_params)
+        if data is None:
+            data = self.get_data(request, posts, fields)
+            set_cached_posts_list(request.query_params, generation, data)
+        return Response(data, status=status.HTTP_200_OK)
+
+    def get_data(self: Self, request: Request, posts: Post, fields: tuple[str] | None = None) -> list | dict:
+        """
+        Method used to serialize the list or a single page of it.
+
+        Args:
+            - request (Request): Request that may carry pagination query parameters.
+            - posts (QuerySet): Posts to list.
+            - fields (tuple): Names of the fields to serialize, all fields if None.
+
+        Returns:
+            - List of serialized posts or a dictionary of a page with next/previous cursors.
+        """
+        # Paginated mode
+        if self.pagination_class.is_requested(request):
+            paginator: PostCursorPaginator = self.pagination_class(request)
+            page: list[Post] = paginator.paginate_queryset(posts)
+            serializer: PostSerializer = self.serializer_class(page, many=True, fields=fields)
+            return paginator.get_paginated_data(serializer.data)
+        # Serialize the rows with the generated function
+        if settings.BLOG_COMPILED_SERIALIZERS:
+            return compile_serializer(self.serializer_class, fields).serialize(posts)
         # Serialize the queryset
-        serializer: PostSerializer = PostSerializer(posts, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
\ No newline at end of file
+        serializer: PostSerializer = self.serializer_class(posts, many=True, fields=fields)
+        return serializer.data
+
+
+class PostsExportView(APIView):
+    """Class to export all posts"""
+    # Serializer
+    serializer_class: PostSerializer = PostSerializer
+    # Number of rows read per database round trip
+    chunk_size: int = 2000
+
+    def get(self: Self, request: Request, *args, **kwargs) -> StreamingHttpResponse:
+        """
+        Get Method that streams every post as a JSON array attachment.
+
+        Args:
+            - request (Request): Object that contains details related to API Request.
+
+        Returns:
+            - StreamingHttpResponse: JSON array of all posts status code 200 OK.
+        """
+        # Grab all posts with their authors
+        posts: Post = self.serializer_class.setup_queryset(Post.objects.order_by("-created_at", "-id"))
+        # Stream posts
+        return streaming_json_response(
+            posts, self.serializer_class, self.chunk_size, filename="posts.json",
+            compiled=settings.BLOG_COMPILED_SERIALIZERS,
+        )
+
+
+class PostSlugDetailView(APIView):
+    """Class to read a post by slug"""
+    # Serializer
+    serializer_class: PostSerializer = PostSerializer
+
+    def get(self: Self, request: Request, slug: str, *args, **kwargs) -> Response:
+        """
+        Get Method for a single post by its slug.
+
+        Args:
+            - request (Request): Object that contains details related to API Request.
+            - slug (str): Slug of the post, when many posts share a slug the newest one is returned.
+
+        Returns:
+            - Response (Response): With the serialized post status code 200 OK\
+                or Post does not exist status code 404 Not found.
+        """
+        # Get the newest post with this slug
+        post: Post = self.serializer_class.setup_queryset(
+            Post.objects.filter(slug=slug)
+        ).order_by("-created_at").first()
+        # Check if post exists
+        if not post:
+            return Response("Post does not exist", status=status.HTTP_404_NOT_FOUND)
+        # Serialize the post
+        serializer: PostSerializer = self.serializer_class(post)
+        return Response(serializer.data, status=status.HTTP_200_OK)
+
+
+class PostSearchView(APIView):
+    """Class to search posts"""
+    # Serializer
+    serializer_class: PostSearchSerializer = PostSearchSerializer
+    # Paginator
+    pagination_class: PostSearchPaginator = PostSearchPaginator
+
+    def get(self: Self, request: Request, *args, **kwargs) -> Response:
+        """
+        Get Method for a page of posts matching a search.
+
+        Args:
+            - request (Request): Request with 'q' the words to search for in titles & contents,\
+                and the optional 'cursor' & 'page_size' query parameters.
+
+        Returns:
+            - Response (Response): With a page of results best match first, each with a highlighted title,\
+                a snippet of the content & its rank, and the next cursor status code 200 OK.\
+                Or error message status code 400 Bad request for a missing query or an invalid cursor.\
+                Or error message status code 501 Not implemented in case the database has no search index.
+        """
+        if not is_search_available():
+            return Response("Search is not available.", status=status.HTTP_501_NOT_IMPLEMENTED)
+        query: str = build_match_query(request.query_params.get("q", ""))
+        if not query:
+            return Response({"q": "Search query must contain at least one word."}, status=status.HTTP_400_BAD_REQUEST)
+        paginator: PostSearchPaginator = self.pagination_class(request)
+        results: list[dict] = paginator.build_results_page(
+            search_posts(query, paginator.page_size + 1, paginator.cursor)
+        )
+        # Load the posts of the page with their authors in one query
+        matches: dict[str, dict] = {result["post_id"]: result for result in results}
+        posts: dict = self.serializer_class.setup_queryset(Post.objects.all()).in_bulk(
+            [uuid.UUID(post_id) for post_id in matches]
+        )
+        # Posts deleted since the search are skipped
+        page: list[Post] = [
+            posts[uuid.UUID(result["post_id"])] for result in results if uuid.UUID(result["post_id"]) in posts
+        ]
+        serializer: PostSearchSerializer = self.serializer_class(page, many=True, context={"matches": matches})
+        return Response(paginator.get_paginated_data(serializer.data), status=status.HTTP_200_OK)
+
+
+async def authenticate_request(request: HttpRequest) -> User | JsonResponse:
+    """
+    Function used to authenticate a request of an async view, same checks as (IsAuthenticated, IsActiveUser).
+
+    Args:
+        - request (HttpRequest): Request with a Bearer access token.
+
+    Returns:
+        - Authenticated active user or the 401 response Django Rest Framework would return.
+    """
+    try:
+        authenticated: tuple | None = await ClaimsJWTAuthentication().aauthenticate(request)
+    except (AuthenticationFailed, InvalidToken) as exception:
+        detail = exception.detail if isinstance(exception.detail, dict) else {"detail": exception.detail}
+        response: JsonResponse = JsonResponse(detail, status=exception.status_code)
+        response["WWW-Authenticate"] = 'Bearer realm="api"'
+        return response
+    if authenticated is None:
+        return not_authenticated_response()
+    return authenticated[0]
+
+
+class AsyncPostsListView(View):
+    """
+    Async version of PostsListView, streaming is only served by PostsListView.
+    """
+    # Serializer
+    serializer_class: PostSerializer = PostSerializer
+    # Paginator
+    pagination_class: PostCursorPaginator = PostCursorPaginator
+
+    async def get(self: Self, request: HttpRequest, *args, **kwargs) -> JsonResponse:
+        """
+        Get Method for List of all the posts.
+
+        Args:
+            - request (HttpRequest): Request with the same query parameters as PostsListView except 'stream'.
+
+        Returns:
+            - Same responses as PostsListView.
+        """
+        # Requested fields
+        try:
+            fields: tuple[str] | None = self.serializer_class.parse_fields(request.GET.get("fields"))
+        except ValidationError as exception:
+            return JsonResponse(exception.detail, status=status.HTTP_400_BAD_REQUEST)
+        # Grab all posts with their authors, only the columns of the requested fields are read
+        posts: Post = self.serializer_class.setup_queryset(Post.objects.all(), fields)
+        # Filter by author
+        author: str | None = request.GET.get("author")
+        if author:
+            posts = posts.filter(author__username=author)
+        # Serve the list from the cache
+        data, generation = await aget_cached_posts_list(request.GET)
+        if data is None:
+            try:
+                data = await self.get_data(request, posts, fields)
+            except ValidationError as exception:
+                return JsonResponse(exception.detail, status=status.HTTP_400_BAD_REQUEST)
+            await aset_cached_posts_list(request.GET, generation, data)
+        return JsonResponse(data, status=status.HTTP_200_OK, safe=False)
+
+    async def get_data(self: Self, request: HttpRequest, posts: Post, fields: tuple[str] | None = None) -> list | dict:
+        """Method used to serialize the list or a single page of it, see PostsListView.get_data"""
+        # Paginated mode
+        if self.pagination_class.is_requested(request):
+            paginator: PostCursorPaginator = self.pagination_class(request)
+            page: list[Post] = await paginator.apaginate_queryset(posts)
+            serializer: PostSerializer = self.serializer_class(page, many=True, fields=fields)
+            return paginator.get_paginated_data(serializer.data)
+        # Serialize the rows with the generated function
+        if settings.BLOG_COMPILED_SERIALIZERS:
+            return await compile_serializer(self.serializer_class, fields).aserialize(posts)
+        # Serialize the posts, authors have been loaded with them
+        serializer: PostSerializer = self.serializer_class(
+            [post async for post in posts], many=True, fields=fields
+        )
+        return serializer.data
+
+
+@method_decorator(csrf_exempt, name="dispatch")
+class AsyncPostCreationView(View):
+    """
+    Async version of PostCreationView.
+    """
+    # Serializer
+    serializer_class: PostCreateSerializer = PostCreateSerializer
+
+    async def post(self: Self, request: HttpRequest, *args, **kwargs) -> JsonResponse:
+        """
+        Post API view to create new Posts
+
+        Args:
+            - request (HttpRequest): Object the contains request details needed to create new Post
+
+        Returns:
+            - Same responses as PostCreationView.
+        """
+        user: User | JsonResponse = await authenticate_request(request)
+        if isinstance(user, JsonResponse):
+            return user
+        # Validation does not touch the database
+        serializer: PostCreateSerializer = self.serializer_class(
+            data=parse_request_data(request), context={"author": user}
+        )
+        if not serializer.is_valid():
+            return JsonResponse(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+        # Create a new Post using validated Data
+        await Post.objects.acreate(**serializer.validated_data, author=user)
+        return JsonResponse("Post has been successfully created", status=status.HTTP_201_CREATED, safe=False)
+
+
+@method_decorator(csrf_exempt, name="dispatch")
+class AsyncPostModificationView(View):
+    """
+    Async version of PostModificationView for updating & deleting a post.
+    """
+    # Serializer
+    serializer_class: PostModificationSerializer = PostModificationSerializer
+
+    async def get_own_post(self: Self, request: HttpRequest, pk: uuid) -> tuple[User | None, Post | JsonResponse]:
+        """
+        Method used to authenticate the request & load the post of the user, same checks as IsAuthor.
+
+        Returns:
+            - Tuple of the user & the post, or of None & the error response.
+        """
+        user: User | JsonResponse = await authenticate_request(request)
+        if isinstance(user, JsonResponse):
+            return None, user
+        post: Post | None = await Post.objects.filter(id=pk).afirst()
+        # Check the post owner to the request user
+        if post is None or post.author_id != user.pk:
+            return None, JsonResponse({"detail": PermissionDenied.default_detail}, status=status.HTTP_403_FORBIDDEN)
+        return user, post
+
+    async def put(self: Self, request: HttpRequest, pk: uuid, *args, **kwargs) -> JsonResponse:
+        """
+        Method used to act as PUT API method to update post
+
+        Args:
+            - request (HttpRequest): Object that contain details related to API Request.
+            - pk (uuid): is uuid of the post requested to apply modifications to.
+
+        Returns:
+            - Same responses as PostModificationView.put.
+        """
+        user, post = await self.get_own_post(request, pk)
+        if user is None:
+            return post
+        context: dict = {"author": user, "post_id": pk, "post": post}
+        serializer: PostModificationSerializer = self.serializer_class(data=parse_request_data(request), context=context)
+        # Validate & save in one thread hop, validation may load another post & Django 4.1 has no asave
+        try:
+            saved: bool = await sync_to_async(self.save)(serializer)
+        except Post.DoesNotExist:
+            # Deleted after it has been loaded
+            return JsonResponse("Post does not exist", status=status.HTTP_404_NOT_FOUND, safe=False)
+        if saved:
+            return JsonResponse("Post Updated successfully", status=status.HTTP_202_ACCEPTED, safe=False)
+        # in case of Unauthurized action
+        if "Unauthorized action detected." in json.dumps(serializer.errors):
+            return JsonResponse(serializer.errors, status=status.HTTP_403_FORBIDDEN)
+        # Error
+        return JsonResponse(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+    @staticmethod
+    def save(serializer: PostModificationSerializer) -> bool:
+        """Method that validates & saves the serializer, returns False in case the data is invalid"""
+        if not serializer.is_valid():
+            return False
+        serializer.save()
+        return True
+
+    async def delete(self: Self, request: HttpRequest, pk: uuid, *args, **kwargs) -> JsonResponse:
+        """
+        Method used to delete existing posts.
+
+        Args:
+            - request (HttpRequest): Object that include user needed to verify for deletion process.
+            - pk (uuid): UUID used to delete the post
+
+        Returns:
+            - Same responses as PostModificationView.delete.
+        """
+        user, post = await self.get_own_post(request, pk)
+        if user is None:
+            return post
+        # Delete the object from database, the queryset sends post_delete like Model.delete
+        await Post.objects.filter(id=post.id).adelete()
+        return JsonResponse("Post deleted successfully", status=status.HTTP_204_NO_CONTENT, safe=False)
@@ -2,6 +2,7 @@
 ASGI config for project_blog project.
 
 It exposes the ASGI callable as a module-level variable named ``application``.
+Async views such as ``user/async``, ``user/async/register`` & ``post/async`` run natively on the event loop.
 
 For more information on this file, see
 https://docs.djangoproject.com/en/5.0/howto/deployment/asgi/
@@ -14,3 +15,7 @@ from django.core.asgi import get_asgi_application
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "project_blog.settings")
 
 application = get_asgi_application()
+
+# Prune expired tokens in the background of the server process, only when TOKEN_PRUNING_INTERVAL is set
+from user_authentication.pruning import start_scheduler
+start_scheduler()
@@ -88,7 +88,7 @@ AUTH_USER_MODEL = "user_authentication.User"
 # Authentication classes
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": (
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        "user_authentication.authentication.ClaimsJWTAuthentication",
     )
 }
 
@@ -139,6 +139,61 @@ DATABASES = {
 }
 
 
+# Cache
+# https://docs.djangoproject.com/en/5.0/topics/cache/
+
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    }
+}
+
+# Seconds a serialized post is kept in the cache.
+BLOG_POST_CACHE_TIMEOUT = 60 * 60
+# Seconds a post list or page is kept in the cache.
+BLOG_POSTS_LIST_CACHE_TIMEOUT = 5 * 60
+# Serialize full post lists & streams with generated functions over values_list rows
+# instead of the DRF field machinery, see blog.compiled.
+BLOG_COMPILED_SERIALIZERS = env.bool("BLOG_COMPILED_SERIALIZERS", default=False)
+
+
+# In-process cache of users for tokens without a user snapshot.
+USER_CACHE_MAX_SIZE = 10_000
+USER_CACHE_TTL = 60
+
+# Number of threads hashing passwords for the async login & registration views.
+PASSWORD_HASHING_POOL_SIZE = env.int("PASSWORD_HASHING_POOL_SIZE", default=4)
+
+
+# Login throttling, token buckets keyed by email & by client IP.
+LOGIN_THROTTLE_BACKEND = "user_authentication.throttling.LocalTokenBucketBackend"
+# Login attempts are counted per client IP read from REMOTE_ADDR, behind reverse proxies set
+# REST_FRAMEWORK["NUM_PROXIES"] so the address is read from the right X-Forwarded-For hop.
+LOGIN_THROTTLE_RATES = {
+    # (bucket capacity, seconds to refill the whole bucket)
+    "email": (5, 60),
+    "ip": (30, 60),
+}
+
+# Seconds a "not blacklisted" answer for a refresh token id is cached,
+# blacklisting a token replaces the answer right away.
+TOKEN_BLACKLIST_NEGATIVE_TTL = 5 * 60
+# Revoked access tokens are kept in the cache, it must be shared by the worker processes
+# (e.g. Redis or Memcached) for a logout to be honoured by all of them.
+# Number of live revoked tokens, across every process, the in-memory bloom filters are sized for.
+ACCESS_TOKEN_REVOCATION_CAPACITY = 100_000
+# Seconds between two reads of the revocations made by the other processes, a token
+# revoked by another process is refused after at most this delay.
+ACCESS_TOKEN_REVOCATION_SYNC_INTERVAL = 1.0
+
+# Seconds between background runs pruning expired tokens inside the WSGI/ASGI server
+# process (every worker runs its own), None to prune only with
+# `python manage.py prune_token_blacklist [--every SECONDS]` (e.g. from cron).
+TOKEN_PRUNING_INTERVAL = env.int("TOKEN_PRUNING_INTERVAL", default=None)
+# Outstanding tokens deleted per transaction by the background runs.
+TOKEN_PRUNING_BATCH_SIZE = 1000
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.0/ref/settings/#auth-password-validators
 
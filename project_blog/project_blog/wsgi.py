@@ -14,3 +14,7 @@ from django.core.wsgi import get_wsgi_application
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "project_blog.settings")
 
 application = get_wsgi_application()
+
+# Prune expired tokens in the background of the server process, only when TOKEN_PRUNING_INTERVAL is set
+from user_authentication.pruning import start_scheduler
+start_scheduler()
@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class UserAuthenticationConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "user_authentication"
+
+    def ready(self) -> None:
+        # Connect signal receivers
+        from . import signals
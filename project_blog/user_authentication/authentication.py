@@ -0,0 +1,158 @@
+"""
+File that contains Authentication classes for the API:-
+    - ClaimsJWTAuthentication (JWTAuthentication): Is a class that builds request.user out of the signed\
+            claims of the access token instead of loading the user row.
+
+Notes:
+    - get_tokens_for_user embeds a snapshot of the user (see USER_SNAPSHOT_CLAIMS) in every token,\
+        the snapshot is trusted until the token expires, e.g. a deactivated user keeps access until then.
+    - Tokens without a snapshot fall back to the in-process user cache, then to the database.
+    - Access tokens revoked by LogoutView are refused (see user_authentication.revocation).
+    - aauthenticate serves async views, it only reaches the database for tokens without a snapshot\
+        and reads the revocation list with the async cache API.
+"""
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import Token
+from django.db import router
+from django.http import HttpRequest
+from .cache import user_cache
+from .revocation import revocation_list
+from .models import User
+from typing import Self
+
+# User fields embedded in tokens by get_tokens_for_user
+USER_SNAPSHOT_CLAIMS: tuple[str] = ("email", "username", "is_active")
+
+
+def user_from_claims(validated_token: Token) -> User | None:
+    """
+    Function used to build a user out of the snapshot claims of a token.
+
+    Args:
+        - validated_token (Token): Token with verified signature.
+
+    Returns:
+        - User instance where the snapshot fields are loaded and the other fields are deferred,\
+            so reading them loads them lazily and saving it only writes the snapshot fields.\
+            None in case the token has no snapshot.
+    """
+    if not all(claim in validated_token for claim in USER_SNAPSHOT_CLAIMS):
+        return None
+    claims: dict = {claim: validated_token[claim] for claim in USER_SNAPSHOT_CLAIMS}
+    claims[api_settings.USER_ID_FIELD] = validated_token[api_settings.USER_ID_CLAIM]
+    # from_db expects values in the order of the model fields
+    field_names: list[str] = [field.attname for field in User._meta.concrete_fields if field.attname in claims]
+    values: list = [claims[name] for name in field_names]
+    return User.from_db(router.db_for_read(User), field_names, values)
+
+
+class ClaimsJWTAuthentication(JWTAuthentication):
+    """
+    Class used to authenticate requests with a JWT without loading the user row.
+    """
+    def get_validated_token(self: Self, raw_token: bytes) -> Token:
+        """
+        Method used to validate a token & check it has not been revoked.
+
+        Raises:
+            - InvalidToken: In case the token is invalid or has been revoked.
+
+        Returns:
+            - Validated token.
+        """
+        validated_token: Token = super().get_validated_token(raw_token)
+        jti: str | None = validated_token.get(api_settings.JTI_CLAIM)
+        if jti is not None and revocation_list.is_revoked(jti):
+            raise InvalidToken("Token has been revoked")
+        return validated_token
+
+    async def aget_validated_token(self: Self, raw_token: bytes) -> Token:
+        """Method used to validate a token from async code, see get_validated_token"""
+        # Signature & claims checks only use the CPU
+        validated_token: Token = super().get_validated_token(raw_token)
+        jti: str | None = validated_token.get(api_settings.JTI_CLAIM)
+        if jti is not None and await revocation_list.ais_revoked(jti):
+            raise InvalidToken("Token has been revoked")
+        return validated_token
+
+    def get_known_user(self: Self, validated_token: Token) -> User | None:
+        """
+        Method used to get the user of a token without reaching the database, shared by get_user & aget_user.
+
+        Args:
+            - validated_token (Token): Token with verified signature.
+
+        Raises:
+            - InvalidToken: In case the token has no user id.
+
+        Returns:
+            - User instance out of the snapshot or the user cache, None in case it has to be fetched.
+        """
+        if api_settings.USER_ID_CLAIM not in validated_token:
+            raise InvalidToken("Token contained no recognizable user identification")
+        # Trust the signed snapshot, older tokens use the user cache
+        user: User | None = user_from_claims(validated_token)
+        if user is None:
+            user = user_cache.get(validated_token[api_settings.USER_ID_CLAIM])
+        return user
+
+    @staticmethod
+    def check_active(user: User) -> User:
+        """Method that returns the user, raises AuthenticationFailed in case it is inactive"""
+        if not user.is_active:
+            raise AuthenticationFailed("User is inactive", code="user_inactive")
+        return user
+
+    def get_user(self: Self, validated_token: Token) -> User:
+        """
+        Method used to get the user of a token.
+
+        Args:
+            - validated_token (Token): Token with verified signature.
+
+        Raises:
+            - InvalidToken: In case the token has no user id.
+            - AuthenticationFailed: In case the user does not exist or is inactive.
+
+        Returns:
+            - User instance.
+        """
+        user: User | None = self.get_known_user(validated_token)
+        if user is None:
+            user = super().get_user(validated_token)
+            user_cache.set(user)
+        return self.check_active(user)
+
+    async def aget_user(self: Self, validated_token: Token) -> User:
+        """Method used to get the user of a token from async code, see get_user"""
+        user: User | None = self.get_known_user(validated_token)
+        if user is None:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+            try:
+                user = await User.objects.aget(**{api_settings.USER_ID_FIELD: user_id})
+            except User.DoesNotExist:
+                raise AuthenticationFailed("User not found", code="user_not_found")
+            user_cache.set(user)
+        return self.check_active(user)
+
+    async def aauthenticate(self: Self, request: HttpRequest) -> tuple[User, Token] | None:
+        """
+        Method used to authenticate a plain Django request from async code.
+
+        Raises:
+            - InvalidToken: In case the token is invalid or has been revoked.
+            - AuthenticationFailed: In case the user does not exist or is inactive.
+
+        Returns:
+            - Tuple of the user & the validated token or None in case the request carries no token.
+        """
+        header: bytes | None = self.get_header(request)
+        if header is None:
+            return None
+        raw_token: bytes | None = self.get_raw_token(header)
+        if raw_token is None:
+            return None
+        validated_token: Token = await self.aget_validated_token(raw_token)
+        return await self.aget_user(validated_token), validated_token
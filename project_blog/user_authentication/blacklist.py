@@ -0,0 +1,91 @@
+"""
+File that contains Classes & Functions used to check the token blacklist through the cache:-
+    - is_jti_blacklisted (function): Checks if a token id is blacklisted, caching found & not found answers.
+    - remember_blacklisted_jti (function): Caches a token id as blacklisted until the token expires.
+    - forget_jti (function): Drops the cached answer for a token id.
+    - CachedRefreshToken (RefreshToken): Refresh token that checks the blacklist through the cache.
+
+Notes:
+    - Blacklisting a token (LogoutView, admin, rotation) saves a BlacklistedToken which caches the token id\
+        as blacklisted right away (see user_authentication.signals), so a cached "not blacklisted" answer\
+        is replaced on the spot within the same cache.
+    - With a per process cache, other processes may accept the token until their negative answer\
+        expires after TOKEN_BLACKLIST_NEGATIVE_TTL seconds.
+"""
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken
+from rest_framework_simplejwt.tokens import RefreshToken
+from datetime import datetime
+from typing import Self
+
+# Seconds a "not blacklisted" answer is cached.
+NEGATIVE_TTL: int = getattr(settings, "TOKEN_BLACKLIST_NEGATIVE_TTL", 5 * 60)
+
+
+def _key(jti: str) -> str:
+    """Function that returns the cache key of a token id"""
+    return f"token_blacklist:jti:{jti}"
+
+
+def remember_blacklisted_jti(jti: str, expires_at: datetime | None) -> None:
+    """
+    Function used to cache a token id as blacklisted.
+
+    Args:
+        - jti (str): ID of the token.
+        - expires_at (datetime): Expiry of the token, the answer is not needed after it.
+    """
+    timeout: int | None = None
+    if expires_at is not None:
+        timeout = max(int((expires_at - timezone.now()).total_seconds()), 1)
+    cache.set(_key(jti), True, timeout)
+
+
+def forget_jti(jti: str) -> None:
+    """Function used to drop the cached answer of a token id"""
+    cache.delete(_key(jti))
+
+
+def is_jti_blacklisted(jti: str) -> bool:
+    """
+    Function used to check if a token id is blacklisted.
+
+    Args:
+        - jti (str): ID of the token.
+
+    Returns:
+        - True in case the token is blacklisted, the answer is read from the database only once\
+            and kept until the token expires.
+    """
+    blacklisted: bool | None = cache.get(_key(jti))
+    if blacklisted is None:
+        # Expiry of the blacklisted token, read with the membership in a single query
+        found: list[datetime] = list(
+            BlacklistedToken.objects.filter(token__jti=jti).values_list("token__expires_at", flat=True)[:1]
+        )
+        blacklisted = bool(found)
+        if blacklisted:
+            remember_blacklisted_jti(jti, found[0])
+        else:
+            cache.set(_key(jti), False, NEGATIVE_TTL)
+    return blacklisted
+
+
+class CachedRefreshToken(RefreshToken):
+    """
+    Refresh token that checks the blacklist through the cache.
+    """
+    def check_blacklist(self: Self) -> None:
+        """
+        Method that checks if this token is blacklisted.
+
+        Raises:
+            - TokenError: Token is blacklisted.
+        """
+        if is_jti_blacklisted(self.payload[api_settings.JTI_CLAIM]):
+            raise TokenError(_("Token is blacklisted"))
@@ -0,0 +1,84 @@
+"""
+File that contains Classes used to cache users in process memory:-
+    - UserCache: Is a bounded LRU cache of user rows where every entry expires after a TTL.
+    - user_cache (UserCache): Shared cache sized by settings.USER_CACHE_MAX_SIZE & settings.USER_CACHE_TTL.
+
+Notes:
+    - Entries are dropped whenever the user is saved or deleted (see user_authentication.signals),\
+        the TTL bounds staleness of changes made by other processes.
+"""
+from collections import OrderedDict
+from django.conf import settings
+from .models import User
+from typing import Self
+import copy
+import threading
+import time
+
+
+class UserCache:
+    """
+    Class used to cache users by id.
+
+    Attributes:
+        - max_size (int): Maximum number of users, the least recently used user is dropped first.
+        - ttl (float): Seconds a user stays in the cache.
+    """
+    def __init__(self: Self, max_size: int, ttl: float) -> None:
+        """
+        Initiate class instance
+
+        Args:
+            - max_size (int): Maximum number of users.
+            - ttl (float): Seconds a user stays in the cache.
+        """
+        self.max_size: int = max_size
+        self.ttl: float = ttl
+        self._users: OrderedDict[object, tuple[User, float]] = OrderedDict()
+        self._lock: threading.Lock = threading.Lock()
+
+    def get(self: Self, user_id: object) -> User | None:
+        """
+        Method used to get a cached user.
+
+        Args:
+            - user_id (object): Primary key of the user.
+
+        Returns:
+            - A copy of the cached user, so callers can not change the shared instance, or None on a miss.
+        """
+        with self._lock:
+            entry: tuple[User, float] | None = self._users.get(user_id)
+            if entry is None:
+                return None
+            user, expires_at = entry
+            if expires_at <= time.monotonic():
+                del self._users[user_id]
+                return None
+            self._users.move_to_end(user_id)
+        return copy.copy(user)
+
+    def set(self: Self, user: User) -> None:
+        """Method used to cache a user"""
+        with self._lock:
+            self._users[user.pk] = (copy.copy(user), time.monotonic() + self.ttl)
+            self._users.move_to_end(user.pk)
+            while len(self._users) > self.max_size:
+                self._users.popitem(last=False)
+
+    def delete(self: Self, user_id: object) -> None:
+        """Method used to drop a cached user"""
+        with self._lock:
+            self._users.pop(user_id, None)
+
+    def clear(self: Self) -> None:
+        """Method used to drop every cached user"""
+        with self._lock:
+            self._users.clear()
+
+
+# Shared cache used by ClaimsJWTAuthentication
+user_cache: UserCache = UserCache(
+    getattr(settings, "USER_CACHE_MAX_SIZE", 10_000),
+    getattr(settings, "USER_CACHE_TTL", 60),
+)
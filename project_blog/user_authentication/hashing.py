@@ -0,0 +1,94 @@
+"""
+File that contains Classes used to hash passwords away from the request thread:-
+    - PasswordHashingPool: Is a class that runs password hashing in a bounded pool of worker threads\
+            and keeps queue depth metrics.
+    - hashing_pool (PasswordHashingPool): Shared pool sized by settings.PASSWORD_HASHING_POOL_SIZE.
+
+Notes:
+    - PBKDF2 runs inside hashlib which releases the GIL, so worker threads hash in parallel while\
+        the event loop keeps serving other requests.
+    - Only CPU work is sent to the pool, database access stays on the request side.
+"""
+from concurrent.futures import ThreadPoolExecutor
+from django.conf import settings
+from typing import Any, Callable, Self
+import asyncio
+import threading
+
+
+class PasswordHashingPool:
+    """
+    Class used to run password hashing in a bounded pool of threads.
+
+    Attributes:
+        - max_workers (int): Number of threads hashing at the same time.
+    """
+    def __init__(self: Self, max_workers: int) -> None:
+        """
+        Initiate class instance
+
+        Args:
+            - max_workers (int): Number of threads hashing at the same time.
+        """
+        self.max_workers: int = max_workers
+        self._executor: ThreadPoolExecutor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="password-hashing"
+        )
+        self._lock: threading.Lock = threading.Lock()
+        self._queued: int = 0
+        self._running: int = 0
+        self._completed: int = 0
+
+    def _call(self: Self, function: Callable, args: tuple, kwargs: dict) -> Any:
+        """Method that runs a job inside a worker thread and keeps the counters"""
+        with self._lock:
+            self._queued -= 1
+            self._running += 1
+        try:
+            return function(*args, **kwargs)
+        finally:
+            with self._lock:
+                self._running -= 1
+                self._completed += 1
+
+    async def run(self: Self, function: Callable, *args, **kwargs) -> Any:
+        """
+        Method used to run a function in the pool without blocking the event loop.
+
+        Args:
+            - function (Callable): CPU bound function such as make_password or check_password.
+
+        Returns:
+            - Value returned by the function.
+        """
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        with self._lock:
+            self._queued += 1
+        future = self._executor.submit(self._call, function, args, kwargs)
+        try:
+            return await asyncio.wrap_future(future, loop=loop)
+        except asyncio.CancelledError:
+            # A job cancelled before it started never leaves the queue by itself
+            if future.cancel():
+                with self._lock:
+                    self._queued -= 1
+            raise
+
+    def stats(self: Self) -> dict[str, int]:
+        """
+        Method that returns metrics of the pool.
+
+        Returns:
+            - Dictionary with number of workers, jobs waiting in the queue, jobs running and jobs completed.
+        """
+        with self._lock:
+            return {
+                "workers": self.max_workers,
+                "queued": self._queued,
+                "running": self._running,
+                "completed": self._completed,
+            }
+
+
+# Shared pool used by the async views
+hashing_pool: PasswordHashingPool = PasswordHashingPool(getattr(settings, "PASSWORD_HASHING_POOL_SIZE", 4))
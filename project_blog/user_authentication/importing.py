@@ -0,0 +1,214 @@
+"""
+File that contains Functions used to import user accounts in bulk:-
+    - read_rows (function): Streams rows out of a CSV or NDJSON file.
+    - validate_row (function): Validates a row with the same validators as RegisterationSerializer.
+    - hash_password (function): Hashes a password, runs inside the worker processes.
+    - import_users (function): Validates, hashes & inserts users batch by batch.
+
+Notes:
+    - Only one batch is held in memory at a time, the usernames & emails seen so far are kept\
+        to reject duplicates within the file.
+    - PBKDF2 is CPU bound, passwords of a batch are hashed across a process pool so the import\
+        scales with the number of cores.
+    - Taken usernames & emails are looked up once per batch, a batch that still hits a unique\
+        constraint (e.g. a concurrent registration) is inserted row by row to find the culprit.
+"""
+from concurrent.futures import Executor
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.validators import UnicodeUsernameValidator
+from django.core.exceptions import ValidationError
+from django.db import IntegrityError, transaction
+from django.db.models.functions import Lower
+from .models import User
+from .validators import EmailValidator, NameValidator, PasswordValidator
+from typing import Callable, IO, Iterator
+import csv
+import itertools
+import json
+import time
+
+# Columns every row must provide
+REQUIRED_FIELDS: tuple[str] = ("username", "email", "password", "first_name", "last_name")
+
+
+def read_rows(file: IO[str], file_format: str) -> Iterator[tuple[int, dict | None, str | None]]:
+    """
+    Generator used to read rows lazily.
+
+    Args:
+        - file (IO): Text file to read.
+        - file_format (str): "csv" with a header line or "ndjson" with one JSON object per line.
+
+    Yields:
+        - Tuple of the line number, the row or None, and an error in case the line can not be read.
+    """
+    if file_format == "csv":
+        reader: csv.DictReader = csv.DictReader(file)
+        for row in reader:
+            yield reader.line_num, row, None
+        return
+    for line_number, line in enumerate(file, start=1):
+        if not line.strip():
+            continue
+        try:
+            row: object = json.loads(line)
+        except ValueError:
+            yield line_number, None, "Invalid JSON."
+            continue
+        if not isinstance(row, dict):
+            yield line_number, None, "Expected a JSON object."
+            continue
+        yield line_number, row, None
+
+
+def validate_row(row: dict) -> dict:
+    """
+    Function used to validate a row.
+
+    Args:
+        - row (dict): Row read from the file.
+
+    Raises:
+        - ValueError: With the reason the row is rejected.
+
+    Returns:
+        - Dictionary of the fields of the user.
+    """
+    missing: list[str] = [field for field in REQUIRED_FIELDS if not row.get(field)]
+    if missing:
+        raise ValueError(f"Missing {', '.join(missing)}.")
+    fields: dict = {field: str(row[field]).strip() for field in REQUIRED_FIELDS}
+    fields["password"] = str(row["password"])
+    EmailValidator(fields["email"], ValueError).validate()
+    NameValidator(fields["first_name"], ValueError).validate()
+    NameValidator(fields["last_name"], ValueError).validate()
+    PasswordValidator(fields["password"], ValueError).validate()
+    if len(fields["username"]) > User._meta.get_field("username").max_length:
+        raise ValueError("Username is too long.")
+    try:
+        UnicodeUsernameValidator()(fields["username"])
+    except ValidationError as error:
+        raise ValueError(error.messages[0])
+    return fields
+
+
+def hash_password(password: str) -> str:
+    """Function that hashes a password, module level so it can be sent to worker processes"""
+    return make_password(password)
+
+
+def insert_batch(users: list[User], reject: Callable[[int, str], None], lines: list[int]) -> int:
+    """
+    Function used to insert a batch of users.
+
+    Args:
+        - users (list): Unsaved users.
+        - reject (Callable): Called with the line number & the reason of a rejected row.
+        - lines (list): Line number of each user.
+
+    Returns:
+        - Number of created users.
+    """
+    try:
+        with transaction.atomic():
+            User.objects.bulk_create(users)
+        return len(users)
+    except IntegrityError:
+        pass
+    # Someone took a username or an email meanwhile, insert row by row
+    created: int = 0
+    for line_number, user in zip(lines, users):
+        try:
+            with transaction.atomic():
+                user.save(force_insert=True)
+            created += 1
+        except IntegrityError:
+            reject(line_number, "Username or email already exists.")
+    return created
+
+
+def import_users(
+    rows: Iterator[tuple[int, dict | None, str | None]],
+    executor: Executor,
+    reject: Callable[[int, str], None],
+    batch_size: int = 500,
+    on_batch: Callable[[dict], None] | None = None,
+) -> dict:
+    """
+    Function used to import users batch by batch.
+
+    Args:
+        - rows (Iterator): Rows as yielded by read_rows.
+        - executor (Executor): Pool hashing the passwords, e.g. a ProcessPoolExecutor.
+        - reject (Callable): Called with the line number & the reason of every rejected row.
+        - batch_size (int): Number of rows validated, hashed & inserted together.
+        - on_batch (Callable): Called with the running report after every batch.
+
+    Returns:
+        - Dictionary with the number of rows read, users created, rows rejected, seconds spent\
+            & rows per second.
+    """
+    report: dict = {"read": 0, "created": 0, "rejected": 0, "seconds": 0.0, "rows_per_second": 0.0}
+    started_at: float = time.monotonic()
+    seen_usernames: set[str] = set()
+    seen_emails: set[str] = set()
+
+    def rejected(line_number: int, reason: str) -> None:
+        report["rejected"] += 1
+        reject(line_number, reason)
+
+    while True:
+        batch: list[tuple[int, dict | None, str | None]] = list(itertools.islice(rows, batch_size))
+        if not batch:
+            break
+        report["read"] += len(batch)
+        # Validate rows & reject duplicates within the file
+        valid: list[tuple[int, dict]] = []
+        for line_number, row, error in batch:
+            try:
+                if error:
+                    raise ValueError(error)
+                fields: dict = validate_row(row)
+                email: str = fields["email"].lower()
+                if fields["username"] in seen_usernames or email in seen_emails:
+                    raise ValueError("Duplicate username or email in the file.")
+            except ValueError as reason:
+                rejected(line_number, str(reason))
+                continue
+            seen_usernames.add(fields["username"])
+            seen_emails.add(email)
+            valid.append((line_number, fields))
+        # Reject usernames & emails that are already taken with one query each
+        usernames: set[str] = set(User.objects.filter(
+            username__in=[fields["username"] for _, fields in valid]
+        ).values_list("username", flat=True))
+        emails: set[str] = set(User.objects.annotate(email_lower=Lower("email")).filter(
+            email_lower__in=[fields["email"].lower() for _, fields in valid]
+        ).values_list("email_lower", flat=True))
+        accepted: list[tuple[int, dict]] = []
+        for line_number, fields in valid:
+            if fields["username"] in usernames or fields["email"].lower() in emails:
+                rejected(line_number, "Username or email already exists.")
+            else:
+                accepted.append((line_number, fields))
+        # Hash the passwords of the batch in parallel
+        hashes: list[str] = list(executor.map(hash_password, [fields["password"] for _, fields in accepted]))
+        users: list[User] = [
+            User(
+                username=User.normalize_username(fields["username"]),
+                email=User.objects.normalize_email(fields["email"]),
+                first_name=fields["first_name"],
+                last_name=fields["last_name"],
+                password=password_hash,
+            )
+            for (_, fields), password_hash in zip(accepted, hashes)
+        ]
+        if users:
+            report["created"] += insert_batch(users, rejected, [line_number for line_number, _ in accepted])
+        # Update the report
+        report["seconds"] = time.monotonic() - started_at
+        report["rows_per_second"] = report["read"] / max(report["seconds"], 1e-9)
+        if on_batch is not None:
+            on_batch(report)
+    report["seconds"] = time.monotonic() - started_at
+    return report
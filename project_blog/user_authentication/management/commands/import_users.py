@@ -0,0 +1,86 @@
+"""
+File that contains the import_users management command:-
+    - Command (BaseCommand): Imports users out of a CSV or NDJSON file in batches.
+
+Usage:
+    python manage.py import_users users.csv --batch-size 500 --workers 4 --rejects rejects.csv
+    python manage.py import_users users.ndjson -v 2
+
+Notes:
+    - Every row needs username, email, password, first_name & last_name, CSV files need a header line.
+    - Rejected rows are reported with their line number & reason, to stderr or to the --rejects file.
+"""
+from concurrent.futures import ProcessPoolExecutor
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from user_authentication.importing import import_users, read_rows
+from typing import Self, TextIO
+import csv
+import django
+import os
+
+# File formats by extension
+FORMATS: dict[str, str] = {".csv": "csv", ".ndjson": "ndjson", ".jsonl": "ndjson"}
+
+
+class Command(BaseCommand):
+    """Command used to import users in bulk"""
+    help = "Imports users out of a CSV or NDJSON file, passwords are hashed across a process pool."
+
+    def add_arguments(self: Self, parser: CommandParser) -> None:
+        """Method that adds the command arguments"""
+        parser.add_argument("path", help="CSV or NDJSON file to import.")
+        parser.add_argument("--format", choices=["csv", "ndjson"], default=None,
+                            help="File format, guessed from the extension by default.")
+        parser.add_argument("--batch-size", type=int, default=500, help="Rows validated & inserted per batch.")
+        parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                            help="Processes hashing passwords.")
+        parser.add_argument("--rejects", default=None, help="CSV file receiving the rejected rows.")
+
+    def report_batch(self: Self, report: dict) -> None:
+        """Method that prints the progress after a batch"""
+        if self.verbosity >= 2:
+            self.stdout.write(
+                f"{report['read']} rows read: {report['created']} created, {report['rejected']} rejected "
+                f"({report['rows_per_second']:.0f} rows/s)"
+            )
+
+    def handle(self: Self, *args, **options) -> None:
+        """Method that runs the command"""
+        self.verbosity: int = options["verbosity"]
+        if options["batch_size"] < 1 or options["workers"] < 1:
+            raise CommandError("--batch-size & --workers must be positive integers.")
+        file_format: str | None = options["format"] or FORMATS.get(os.path.splitext(options["path"])[1].lower())
+        if file_format is None:
+            raise CommandError("Unknown file format, pass --format csv or --format ndjson.")
+
+        rejects_file: TextIO | None = None
+        if options["rejects"]:
+            rejects_file = open(options["rejects"], "w", newline="", encoding="utf-8")
+            rejects_writer = csv.writer(rejects_file)
+            rejects_writer.writerow(["line", "reason"])
+
+        def reject(line_number: int, reason: str) -> None:
+            if rejects_file is not None:
+                rejects_writer.writerow([line_number, reason])
+            else:
+                self.stderr.write(f"Line {line_number}: {reason}")
+
+        try:
+            with open(options["path"], newline="", encoding="utf-8") as file, \
+                    ProcessPoolExecutor(max_workers=options["workers"], initializer=django.setup) as executor:
+                report: dict = import_users(
+                    read_rows(file, file_format),
+                    executor,
+                    reject,
+                    batch_size=options["batch_size"],
+                    on_batch=self.report_batch,
+                )
+        except OSError as error:
+            raise CommandError(str(error))
+        finally:
+            if rejects_file is not None:
+                rejects_file.close()
+        self.stdout.write(self.style.SUCCESS(
+            f"Imported {report['created']} of {report['read']} users, {report['rejected']} rejected, "
+            f"{report['seconds']:.2f}s ({report['rows_per_second']:.0f} rows/s)."
+        ))
@@ -0,0 +1,60 @@
+"""
+File that contains the prune_token_blacklist management command:-
+    - Command (BaseCommand): Deletes expired outstanding & blacklisted tokens in bounded batches.
+
+Usage:
+    python manage.py prune_token_blacklist --batch-size 1000 --pause 0.05
+    python manage.py prune_token_blacklist --every 3600 --max-batches 100
+"""
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from user_authentication.pruning import prune_expired_tokens, TokenPruningScheduler
+from typing import Self
+
+
+class Command(BaseCommand):
+    """Command used to prune expired tokens from the token blacklist tables"""
+    help = "Deletes expired outstanding & blacklisted tokens in small batches, one transaction per batch."
+
+    def add_arguments(self: Self, parser: CommandParser) -> None:
+        """Method that adds the command arguments"""
+        parser.add_argument("--batch-size", type=int, default=1000, help="Outstanding tokens deleted per batch.")
+        parser.add_argument("--max-batches", type=int, default=None, help="Stop after this many batches.")
+        parser.add_argument("--pause", type=float, default=0.0, help="Seconds to sleep between batches.")
+        parser.add_argument("--every", type=float, default=None,
+                            help="Keep running & prune again every this many seconds.")
+
+    def report_batch(self: Self, report: dict) -> None:
+        """Method that prints the progress after a batch"""
+        if self.verbosity >= 2:
+            self.stdout.write(
+                f"Batch {report['batches']}: {report['outstanding']} outstanding & "
+                f"{report['blacklisted']} blacklisted tokens deleted ({report['rows_per_second']:.0f} rows/s)"
+            )
+
+    def handle(self: Self, *args, **options) -> None:
+        """Method that runs the command"""
+        self.verbosity: int = options["verbosity"]
+        if options["batch_size"] < 1:
+            raise CommandError("--batch-size must be a positive integer.")
+        if options["every"] is not None and options["every"] <= 0:
+            raise CommandError("--every must be a positive number of seconds.")
+        report: dict = prune_expired_tokens(
+            batch_size=options["batch_size"],
+            max_batches=options["max_batches"],
+            pause=options["pause"],
+            on_batch=self.report_batch,
+        )
+        self.stdout.write(self.style.SUCCESS(
+            f"Deleted {report['outstanding']} outstanding & {report['blacklisted']} blacklisted tokens "
+            f"in {report['batches']} batches, {report['seconds']:.2f}s ({report['rows_per_second']:.0f} rows/s), "
+            f"{report['remaining']} expired tokens left."
+        ))
+        if options["every"]:
+            # Dedicated pruning process, runs until interrupted
+            scheduler: TokenPruningScheduler = TokenPruningScheduler(
+                options["every"], options["batch_size"], options["max_batches"]
+            )
+            try:
+                scheduler.run()
+            except KeyboardInterrupt:
+                pass
@@ -0,0 +1,25 @@
+# Generated by Django 4.1.13 on 2026-10-18 02:54
+
+from django.db import migrations, models
+import django.db.models.functions.text
+import user_authentication.models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('user_authentication', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AlterModelManagers(
+            name='user',
+            managers=[
+                ('objects', user_authentication.models.EmailUserManager()),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name='user',
+            constraint=models.UniqueConstraint(django.db.models.functions.text.Lower('email'), condition=models.Q(('email', ''), _negated=True), name='user_email_lower_unique'),
+        ),
+    ]
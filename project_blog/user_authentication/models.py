@@ -1,11 +1,72 @@
 """
 File that contains Model classes for the API:-
+    - EmailUserManager (UserManager): Manager Class that looks users up by their email.
     - User (AbstractUser): Custom made Authentication User class.
+
+Notes:
+    - Emails are unique regardless of their case through a unique index on Lower(email),\
+        blank emails are left out of the index since they are allowed for staff accounts.
 """
-from django.contrib.auth.models import AbstractUser
+from django.contrib.auth.models import AbstractUser, UserManager
+from django.db import models
+from django.db.models.functions import Lower
+
+# Allows filtering with email__lower=...
+models.EmailField.register_lookup(Lower)
+
+
+# Create Authentication User Manager
+class EmailUserManager(UserManager):
+    def get_by_email(self, email: str) -> "User | None":
+        """
+        Method used to get a user by email with a single probe of the Lower(email) index.
+
+        Args:
+            - email (str): Email of the user, case is ignored.
+
+        Returns:
+            - User instance or None in case the user does not exist.
+        """
+        # The excluded blank email matches the condition of the partial index
+        return self.exclude(email="").filter(email__lower=email.lower()).first()
+
+    async def aget_by_email(self, email: str) -> "User | None":
+        """Async version of get_by_email"""
+        return await self.exclude(email="").filter(email__lower=email.lower()).afirst()
+
+    def create_user_with_hash(self, username: str, email: str, password_hash: str, **extra_fields) -> "User":
+        """
+        Method used to create a user with a password hashed ahead of time, e.g. in the hashing pool.
+
+        Args:
+            - username (str): Username of the user.
+            - email (str): Email of the user.
+            - password_hash (str): Encoded password as returned by make_password.
+
+        Returns:
+            - Newly created user, saved with a single INSERT.
+        """
+        extra_fields.setdefault("is_staff", False)
+        extra_fields.setdefault("is_superuser", False)
+        user: User = self.model(
+            username=self.model.normalize_username(username),
+            email=self.normalize_email(email),
+            password=password_hash,
+            **extra_fields,
+        )
+        user.save(using=self._db)
+        return user
 
 
 # Create Authentication User Model
 class User(AbstractUser):
-    pass
+    objects: EmailUserManager = EmailUserManager()
 
+    class Meta(AbstractUser.Meta):
+        constraints: list[models.BaseConstraint] = [
+            models.UniqueConstraint(
+                Lower("email"),
+                condition=~models.Q(email=""),
+                name="user_email_lower_unique",
+            ),
+        ]
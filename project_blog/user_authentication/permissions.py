@@ -1,6 +1,7 @@
 """
 File that contains General Permission CLasses:-
-    - IsActiveUser (BasePermission): Is a class that validates if a user is active or not.
+    - IsActiveUser (BasePermission): Is a class that validates if a user is active or not.\
+            For anonymous requests the user loaded by email is kept as request.login_user.
 """
 from rest_framework.permissions import BasePermission
 from django.contrib.auth.models import AnonymousUser
@@ -12,22 +13,20 @@ class IsActiveUser(BasePermission):
     """
     Class to check if a user is active or not
     """
-    def validate_user(self: Self, email: str) -> bool:
+    def validate_user(self: Self, user: User | None) -> bool:
         """
-        Method to get the user by his email
+        Method to check the user loaded by email
 
         Args:
-            - email (str): Email of the user.
+            - user (User): User loaded by email or None if there is no such user.
         
         Returns:
             - False in case the user does not exists or \
                 returns user active status which can either be True or False.
         """
         # Check if user exists
-        if not User.objects.filter(email=email).exists():
+        if user is None:
             return False
-        # Grab User
-        user: User = User.objects.get(email=email)
         # Return user's active status.
         return user.is_active
 
@@ -35,9 +34,14 @@ class IsActiveUser(BasePermission):
         """Method to check user"""
         if isinstance(request.user, AnonymousUser):
             # Check if key email exists, if not just return False.
-            if not "email" in request.data:
+            if not isinstance(request.data, dict) or not "email" in request.data:
                 return False
+            # Refuse emails that are not strings, e.g. numbers or lists.
+            if not isinstance(request.data["email"], str):
+                return False
+            # Load user once and keep it on the request, LoginView passes it on to LoginSerializer.
+            request.login_user = User.objects.get_by_email(request.data["email"])
             # Check user is active or not
-            return self.validate_user(request.data["email"])
+            return self.validate_user(request.login_user)
         # Return user's active status.
         return request.user.is_active
@@ -0,0 +1,165 @@
+"""
+File that contains Classes & Functions used to prune expired tokens from the token blacklist tables:-
+    - count_expired_tokens (function): Returns the number of expired outstanding tokens left.
+    - prune_expired_tokens (function): Deletes expired outstanding & blacklisted tokens in bounded batches.
+    - TokenPruningScheduler: Is a class that prunes expired tokens from a background thread every interval.
+    - start_scheduler (function): Starts the shared scheduler in case settings.TOKEN_PRUNING_INTERVAL is set.
+
+Notes:
+    - Each batch runs in its own short transaction so logins & logouts writing to the same tables\
+        only ever wait for a single batch, unlike flushexpiredtokens that deletes every row at once.
+    - Expired tokens are the oldest ones, batches are picked in primary key order so the database\
+        stops reading as soon as a batch is full.
+    - The scheduler is never started on import or by AppConfig.ready, only by the prune_token_blacklist\
+        command with --every or by the WSGI/ASGI entry points, so migrate, shell & the test runner stay single threaded.
+"""
+from django.conf import settings
+from django.db import DatabaseError, close_old_connections, transaction
+from django.utils import timezone
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
+from datetime import datetime
+from typing import Callable, Self
+import logging
+import threading
+import time
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+def count_expired_tokens(now: datetime | None = None) -> int:
+    """Function that returns the number of expired outstanding tokens left"""
+    return OutstandingToken.objects.filter(expires_at__lte=now or timezone.now()).count()
+
+
+def prune_expired_tokens(
+    batch_size: int = 1000,
+    max_batches: int | None = None,
+    pause: float = 0.0,
+    on_batch: Callable[[dict], None] | None = None,
+) -> dict:
+    """
+    Function used to delete expired tokens in bounded batches.
+
+    Args:
+        - batch_size (int): Maximum number of outstanding tokens deleted per transaction.
+        - max_batches (int): Stop after this many batches, None to run until no expired token is left.
+        - pause (float): Seconds to sleep between batches to leave room for other writers.
+        - on_batch (Callable): Called with the running report after every batch.
+
+    Returns:
+        - Dictionary with the outstanding & blacklisted rows deleted, the number of batches,\
+            seconds spent, rows deleted per second and the expired rows left.
+    """
+    now: datetime = timezone.now()
+    started_at: float = time.monotonic()
+    report: dict = {"outstanding": 0, "blacklisted": 0, "batches": 0, "seconds": 0.0, "rows_per_second": 0.0}
+    while max_batches is None or report["batches"] < max_batches:
+        with transaction.atomic():
+            ids: list[int] = list(
+                OutstandingToken.objects.filter(expires_at__lte=now)
+                .order_by("id")
+                .values_list("id", flat=True)[:batch_size]
+            )
+            if not ids:
+                break
+            # Delete blacklist rows first so the cascade has nothing left to collect
+            blacklisted, _ = BlacklistedToken.objects.filter(token_id__in=ids).delete()
+            outstanding, _ = OutstandingToken.objects.filter(id__in=ids).delete()
+        # Update the report
+        report["outstanding"] += outstanding
+        report["blacklisted"] += blacklisted
+        report["batches"] += 1
+        report["seconds"] = time.monotonic() - started_at
+        report["rows_per_second"] = (report["outstanding"] + report["blacklisted"]) / max(report["seconds"], 1e-9)
+        if on_batch is not None:
+            on_batch(report)
+        if len(ids) < batch_size:
+            break
+        if pause:
+            time.sleep(pause)
+    report["seconds"] = time.monotonic() - started_at
+    report["remaining"] = count_expired_tokens(now)
+    return report
+
+
+class TokenPruningScheduler:
+    """
+    Class used to prune expired tokens from a background thread.
+
+    Attributes:
+        - interval (float): Seconds between two pruning runs.
+        - batch_size (int): Maximum number of outstanding tokens deleted per transaction.
+        - max_batches (int): Maximum number of batches per run, the rest is left for the next run.
+    """
+    def __init__(self: Self, interval: float, batch_size: int = 1000, max_batches: int | None = 100) -> None:
+        """Initiate class instance"""
+        self.interval: float = interval
+        self.batch_size: int = batch_size
+        self.max_batches: int | None = max_batches
+        self.last_report: dict | None = None
+        self._stop: threading.Event = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def run_once(self: Self) -> dict | None:
+        """
+        Method used to run a single pruning run.
+
+        Returns:
+            - Report of the run or None in case the database could not be reached.
+        """
+        try:
+            self.last_report = prune_expired_tokens(self.batch_size, self.max_batches)
+        except DatabaseError:
+            # e.g. tables not migrated yet, try again on the next run
+            logger.exception("Pruning expired tokens failed")
+            return None
+        finally:
+            # No request cycle closes the connection of this thread, drop it once broken or past CONN_MAX_AGE
+            close_old_connections()
+        logger.info(
+            "Pruned %(outstanding)d outstanding & %(blacklisted)d blacklisted tokens "
+            "(%(rows_per_second).0f rows/s), %(remaining)d expired tokens left",
+            self.last_report,
+        )
+        return self.last_report
+
+    def run(self: Self) -> None:
+        """Method that runs a pruning run every interval until stop is called, blocks the calling thread"""
+        while not self._stop.wait(self.interval):
+            self.run_once()
+
+    def start(self: Self) -> None:
+        """Method used to start the background thread, does nothing in case it is already running"""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self.run, name="token-pruning", daemon=True)
+        self._thread.start()
+
+    def stop(self: Self) -> None:
+        """Method used to stop the background thread"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+
+# Shared scheduler, only started by start_scheduler
+scheduler: TokenPruningScheduler | None = None
+
+
+def start_scheduler() -> TokenPruningScheduler | None:
+    """
+    Function used to start the shared scheduler, called from the server entry points only.
+
+    Returns:
+        - Running scheduler or None in case settings.TOKEN_PRUNING_INTERVAL is not set.
+    """
+    global scheduler
+    interval: float | None = getattr(settings, "TOKEN_PRUNING_INTERVAL", None)
+    if not interval:
+        return None
+    if scheduler is None:
+        scheduler = TokenPruningScheduler(interval, getattr(settings, "TOKEN_PRUNING_BATCH_SIZE", 1000))
+    scheduler.start()
+    return scheduler
@@ -2,10 +2,16 @@
 File that contains Classes & Functions Related to Refresh Token:-
     - get_token_for_user (function): A function used to generate access & refresh token for a user.
     - IsRefreshToken (BasePermission): Is a class used to validate a refresh token and acts a Permission Class.
+
+Notes:
+    - Validating a refresh token costs at most one user query, the blacklist is checked through\
+        the cache (see user_authentication.blacklist).
 """
 from rest_framework_simplejwt.tokens import RefreshToken
 from rest_framework.permissions import BasePermission
 from .models import User
+from .authentication import USER_SNAPSHOT_CLAIMS
+from .blacklist import CachedRefreshToken
 from typing import Self
 
 # Create token Function
@@ -17,9 +23,13 @@ def get_tokens_for_user(user: User) -> dict[str, str]:
         - user (User): User object to create JWT for.
     
     Returns:
-        - Dictionary that contains both Access & Refresh Tokens.
+        - Dictionary that contains both Access & Refresh Tokens, both carry a snapshot of\
+            the user fields listed in USER_SNAPSHOT_CLAIMS.
     """
     refresh = RefreshToken.for_user(user)
+    # Embed a snapshot of the user, the access token copies it, see ClaimsJWTAuthentication.
+    for claim in USER_SNAPSHOT_CLAIMS:
+        refresh[claim] = getattr(user, claim)
 
     return {
         "refresh": str(refresh),
@@ -33,21 +43,18 @@ class IsRefreshToken(BasePermission):
         To be well informed as well that the class assigns user to the request
         incase the user is valid and the refresh token is valid.
     """
-    def is_valid_user(self: Self, data: dict) -> bool:
-        """Method used to check user validation"""
+    def get_user(self: Self, data: dict) -> User | None:
+        """Method used to fetch the user of the token with a single query"""
         # Check if user_id key exists within the decoded token
         if not ("user_id" in data):
-            return False
-        # Check if the user already exists in our user database.
-        if not User.objects.filter(id=data["user_id"]).exists():
-            return False
-        # pass tests
-        return True
+            return None
+        # Fetch the user, None in case it does not exist anymore.
+        return User.objects.filter(id=data["user_id"]).first()
 
     def is_refresh_token_valid(self: Self, refresh_token: str) -> bool:
         """Method used to check the token validation"""
         try:
-            decoded_token = RefreshToken(refresh_token)
+            decoded_token = CachedRefreshToken(refresh_token)
             return decoded_token
         except Exception as e:
             return False
@@ -66,11 +73,10 @@ class IsRefreshToken(BasePermission):
         # If Token was None just return False
         if not decoded_token:
             return False
-        # Validate user.
-        if not self.is_valid_user(decoded_token):
+        # Grab & validate the user.
+        user: User | None = self.get_user(decoded_token)
+        if user is None:
             return False
-        # Grab the user
-        user: User = User.objects.get(id=decoded_token["user_id"])
         # Assign Request.user to the User
         request.user = user
         return True
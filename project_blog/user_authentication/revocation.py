@@ -0,0 +1,247 @@
+"""
+File that contains Classes used to revoke access tokens before they expire:-
+    - BloomFilter: Is a fixed size probabilistic set, it may answer "maybe" for an id it never saw\
+            but never answers "no" for an id it saw.
+    - RevocationList: Is a class that keeps revoked token ids in the cache until the tokens expire,\
+            fronted by in-memory bloom filters of the revocations made by every process.
+    - revocation_list (RevocationList): Shared list sized by settings.ACCESS_TOKEN_REVOCATION_CAPACITY.
+
+Notes:
+    - The exact deny-set lives in the cache under "revoked:<jti>" keys that expire with their token,\
+        the cache must be shared by the worker processes (Redis, Memcached, database).
+    - Every revocation is also logged under "revoked:log:<number>", each process reads the new log entries\
+        at most every settings.ACCESS_TOKEN_REVOCATION_SYNC_INTERVAL seconds into its bloom filters.
+    - A token missing from the bloom filters is accepted without any cache read, only bloom hits\
+        (revoked tokens & rare false positives) fall through to the exact check in the cache.
+    - A token revoked by another process is refused once the next sync has run, i.e. within the sync\
+        interval, the process that revoked it refuses it right away.
+    - Bloom filters are kept per expiry window & dropped once every token of the window has expired,\
+        an expired token is refused by its signature check anyway.
+"""
+from django.conf import settings
+from django.core.cache import cache
+from typing import Self
+import hashlib
+import math
+import threading
+import time
+
+
+class BloomFilter:
+    """
+    Class used as a probabilistic set of strings.
+
+    Attributes:
+        - size (int): Number of bits.
+        - hashes (int): Number of bits set per item.
+    """
+    def __init__(self: Self, capacity: int, error_rate: float = 0.01) -> None:
+        """
+        Initiate class instance
+
+        Args:
+            - capacity (int): Number of items expected in the filter.
+            - error_rate (float): Rate of false "maybe" answers once capacity items are stored.
+        """
+        self.size: int = max(int(-capacity * math.log(error_rate) / math.log(2) ** 2), 8)
+        self.hashes: int = max(round(self.size / capacity * math.log(2)), 1)
+        self._bits: bytearray = bytearray((self.size + 7) // 8)
+
+    def positions(self: Self, item: str) -> list[int]:
+        """Method that returns the bit positions of an item using double hashing"""
+        digest: bytes = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        first: int = int.from_bytes(digest[:8], "little")
+        second: int = int.from_bytes(digest[8:], "little") | 1
+        return [(first + index * second) % self.size for index in range(self.hashes)]
+
+    def add(self: Self, item: str) -> None:
+        """Method used to add an item to the filter"""
+        for position in self.positions(item):
+            self._bits[position >> 3] |= 1 << (position & 7)
+
+    def contains_positions(self: Self, positions: list[int]) -> bool:
+        """Method that returns False in case one of the bit positions of an item is not set"""
+        return all(self._bits[position >> 3] & (1 << (position & 7)) for position in positions)
+
+    def __contains__(self: Self, item: str) -> bool:
+        """Method that returns False in case the item has never been added"""
+        return self.contains_positions(self.positions(item))
+
+
+# Cache key of the revocation counter, every revocation is logged under the next number.
+SEQUENCE_KEY: str = "revoked:sequence"
+
+
+def _key(jti: str) -> str:
+    """Function that returns the cache key of a revoked token id"""
+    return f"revoked:{jti}"
+
+
+def _log_key(number: int) -> str:
+    """Function that returns the cache key of a revocation log entry"""
+    return f"revoked:log:{number}"
+
+
+class RevocationList:
+    """
+    Class used to keep revoked token ids until the tokens expire.
+
+    Attributes:
+        - capacity (int): Number of live revoked tokens, across every process, each bloom filter is sized for.
+        - sync_interval (float): Seconds between two reads of the revocation log.
+        - window (float): Seconds of token expiry covered by each bloom filter.
+        - sync_overlap (int): Log entries read again on every sync, entries of revocations that were\
+            still being written during the previous sync are picked up this way.
+        - sync_batch_size (int): Log entries read per cache round trip.
+    """
+    window: float = 300.0
+    sync_overlap: int = 100
+    sync_batch_size: int = 1000
+
+    def __init__(self: Self, capacity: int, sync_interval: float = 1.0) -> None:
+        """
+        Initiate class instance
+
+        Args:
+            - capacity (int): Number of live revoked tokens each bloom filter is sized for.
+            - sync_interval (float): Seconds between two reads of the revocation log.
+        """
+        self.capacity: int = capacity
+        self.sync_interval: float = sync_interval
+        # Maps expiry window to the bloom filter of the tokens expiring within it,
+        # replaced as a whole on change so lock free readers never see it change size
+        self._blooms: dict[int, BloomFilter] = {}
+        self._lock: threading.Lock = threading.Lock()
+        # Last log entry read & time of the next sync
+        self._synced: int = 0
+        self._next_sync: float = 0.0
+
+    def _add(self: Self, jti: str, expires_at: float, now: float) -> None:
+        """Method that adds a token to the filter of its expiry window & drops expired windows, lock must be held"""
+        if expires_at <= now:
+            return
+        window: int = int(expires_at // self.window)
+        if window not in self._blooms or any((key + 1) * self.window <= now for key in self._blooms):
+            blooms: dict[int, BloomFilter] = {
+                key: bloom for key, bloom in self._blooms.items() if (key + 1) * self.window > now
+            }
+            blooms.setdefault(window, BloomFilter(self.capacity))
+            self._blooms = blooms
+        self._blooms[window].add(jti)
+
+    def revoke(self: Self, jti: str, expires_at: float) -> None:
+        """
+        Method used to revoke a token.
+
+        Args:
+            - jti (str): ID of the token.
+            - expires_at (float): Expiry of the token as a unix timestamp ("exp" claim).
+        """
+        now: float = time.time()
+        if expires_at <= now:
+            return
+        # Number the revocation for the log read by the other processes
+        cache.add(SEQUENCE_KEY, 0, None)
+        try:
+            number: int = cache.incr(SEQUENCE_KEY)
+        except ValueError:
+            number = 1
+            cache.set(SEQUENCE_KEY, number, None)
+        # Shared deny-set & log entry, kept until the token expires
+        cache.set_many({_key(jti): True, _log_key(number): (jti, expires_at)}, math.ceil(expires_at - now))
+        with self._lock:
+            self._add(jti, expires_at, now)
+
+    def _start_sync(self: Self, now: float) -> bool:
+        """Method that returns True in case a sync is due, only one thread gets True per interval"""
+        with self._lock:
+            if now < self._next_sync:
+                return False
+            self._next_sync = now + self.sync_interval
+            return True
+
+    def _log_batches(self: Self, sequence: int) -> list[list[str]]:
+        """Method that returns the keys of the log entries to read, in batches, for the current sequence"""
+        if sequence < self._synced:
+            # The counter has been lost, e.g. the cache has been flushed
+            self._synced = 0
+        # Entries older than the last capacity revocations belong to expired tokens
+        first: int = max(self._synced - self.sync_overlap, sequence - self.capacity, 0) + 1
+        self._synced = sequence
+        return [
+            [_log_key(number) for number in range(start, min(start + self.sync_batch_size, sequence + 1))]
+            for start in range(first, sequence + 1, self.sync_batch_size)
+        ]
+
+    def _add_entries(self: Self, entries: dict, now: float) -> None:
+        """Method that adds log entries read from the cache to the bloom filters"""
+        with self._lock:
+            for jti, expires_at in entries.values():
+                self._add(jti, expires_at, now)
+
+    def read_log(self: Self, now: float | None = None) -> None:
+        """Method used to read the revocations logged by every process since the last sync"""
+        now = time.time() if now is None else now
+        if not self._start_sync(now):
+            return
+        for keys in self._log_batches(cache.get(SEQUENCE_KEY, 0)):
+            self._add_entries(cache.get_many(keys), now)
+
+    async def aread_log(self: Self, now: float | None = None) -> None:
+        """Method used to read the revocation log from async code, see read_log"""
+        now = time.time() if now is None else now
+        if not self._start_sync(now):
+            return
+        for keys in self._log_batches(await cache.aget(SEQUENCE_KEY, 0)):
+            self._add_entries(await cache.aget_many(keys), now)
+
+    def might_be_revoked(self: Self, jti: str, now: float) -> bool:
+        """Method that returns False in case the token is missing from every live bloom filter"""
+        positions: list[int] | None = None
+        for window, bloom in self._blooms.items():
+            if (window + 1) * self.window <= now:
+                continue
+            # Every filter has the same size, hash the id once
+            positions = positions or bloom.positions(jti)
+            if bloom.contains_positions(positions):
+                return True
+        return False
+
+    def is_revoked(self: Self, jti: str) -> bool:
+        """
+        Method used to check if a token has been revoked.
+
+        Args:
+            - jti (str): ID of the token.
+
+        Returns:
+            - True in case the token has been revoked and has not expired yet.
+        """
+        now: float = time.time()
+        self.read_log(now)
+        if not self.might_be_revoked(jti, now):
+            return False
+        # Bloom hit, exact check in the shared deny-set
+        return cache.get(_key(jti)) is not None
+
+    async def ais_revoked(self: Self, jti: str) -> bool:
+        """Method used to check if a token has been revoked from async code, see is_revoked"""
+        now: float = time.time()
+        await self.aread_log(now)
+        if not self.might_be_revoked(jti, now):
+            return False
+        return await cache.aget(_key(jti)) is not None
+
+    def clear(self: Self) -> None:
+        """Method used to drop the bloom filters, they are rebuilt out of the log on the next check"""
+        with self._lock:
+            self._blooms = {}
+            self._synced = 0
+            self._next_sync = 0.0
+
+
+# Shared list used by LogoutView & ClaimsJWTAuthentication
+revocation_list: RevocationList = RevocationList(
+    getattr(settings, "ACCESS_TOKEN_REVOCATION_CAPACITY", 100_000),
+    getattr(settings, "ACCESS_TOKEN_REVOCATION_SYNC_INTERVAL", 1.0),
+)
@@ -2,7 +2,10 @@
 File Contains Serialization Classes:-
     - UserSerializer (serializers.ModelSerializer) - Does not return user data with token.
     - LoginSerializer (serializers.ModelSerializer) - For login API & Gets user data with Token.
+            Reuses the user passed as context["user"] so login loads the user only once.
     - RegisterationSerializer (serializers.Serializer) - for Registeration API.
+            Creates the user with a single INSERT, taken usernames & emails are reported from the\
+            unique constraints (see RegisterationSerializer.create).
     - LogoutSerializer (serializers.Serializer) - for user logout.
 
 Notes:
@@ -12,9 +15,11 @@ Notes:
 
     Practicall a serializer takes a class and returns the __dict__ of the class.
 """
-from rest_framework_simplejwt.tokens import RefreshToken
+from .blacklist import CachedRefreshToken
 from rest_framework_simplejwt.exceptions import TokenError
 from rest_framework import serializers
+from django.contrib.auth.validators import UnicodeUsernameValidator
+from django.db import IntegrityError, transaction
 from .models import User
 from .refresh_token import get_tokens_for_user
 from .validators import (
@@ -22,6 +27,7 @@ from .validators import (
     NameValidator,
     PasswordValidator,
 )
+from contextlib import nullcontext
 from typing import Self
 
 
@@ -64,37 +70,34 @@ class LoginSerializer(serializers.ModelSerializer):
         Returns:
             - object incase user is valid.
         """
+        # Grab user loaded by the view or load it once
+        user: User | None = self.context.get("user") or User.objects.get_by_email(attr["email"])
         # Check Email
-        if not User.objects.filter(email=attr["email"]).exists():
+        if user is None:
             raise serializers.ValidationError("User Does not exist.")
-        # Grab user
-        user: User = User.objects.get(email=attr['email'])
         # Check Password
         if not user.check_password(attr['password']):
             raise serializers.ValidationError("User 'email' or 'password' is incorrect.")
+        # assign user to self.instance for the representation
+        self.instance: User = user
         # Return object
         return attr
 
     # Using to_representation allow us to control serialization process.
-    def to_representation(self: Self, instance: object) -> dict:
+    def to_representation(self: Self, instance: User) -> dict:
         """
         Method that allows us to control the serialization of user object.
 
         Args:
-            - instance (object): User instance data.
+            - instance (User): User instance loaded during validation.
         
         Returns:
             - Serialized data of user instance in form of python dictionary
         """
-        data = super().to_representation(instance)
-        # Get the email
-        email: str = data.pop("email")
-        # Get user object
-        user: User = User.objects.get(email=email)
-        # Get Serialized data
-        data: dict = UserSerializer(user).data
+        # Get Serialized data of the user loaded during validation
+        data: dict = UserSerializer(instance).data
         # add Token Field
-        data["token"] = get_tokens_for_user(user)
+        data["token"] = get_tokens_for_user(instance)
         # Return Serialized Data
         return data
 
@@ -108,8 +111,12 @@ class RegisterationSerializer(serializers.ModelSerializer):
             "email": {"required": True},
             "first_name": {"required": True},
             "last_name": {"required": True},
-            "username": {"required": True},
+            # Uniqueness is enforced by the INSERT itself, no UniqueValidator query.
+            "username": {"required": True, "validators": [UnicodeUsernameValidator()]},
         }
+    # Errors reported when a unique constraint rejects the INSERT
+    username_taken_error: str = "Username already exists."
+    email_taken_error: str = "Patient account with this email already exists"
     # Validators.
     def validate_first_name(self: Self, value: str) -> str:
         """Method to Validate first name"""
@@ -142,21 +149,25 @@ class RegisterationSerializer(serializers.ModelSerializer):
         # Check if username is empty or not.
         if not value:
             raise serializers.ValidationError("Username can not be an empty!")
-        # Check if username exists
-        if User.objects.filter(username=value).exists():
-            raise serializers.ValidationError("Username already exists.")
-        # Return the value
+        # Return the value, a taken username is reported by create
         return value
 
-    def validate(self: Self, attrs: dict) -> dict:
-        """Method used to validate registeration of a new patient account"""
-        # Need to check if there is not another user already with same email
-        if User.objects.filter(email=attrs["email"]).exists():
-            # Raise account already exists
-            raise serializers.ValidationError(
-                "Patient account with this email already exists"
-            )
-        return attrs
+    def unique_error(self: Self, error: IntegrityError) -> serializers.ValidationError:
+        """
+        Method used to turn a unique constraint violation into the matching validation error.
+
+        Raises:
+            - IntegrityError: In case the violation is not about the username or the email.
+
+        Returns:
+            - Validation error with the same messages as the former existence checks.
+        """
+        message: str = str(error)
+        if "user_email_lower_unique" in message:
+            return serializers.ValidationError({"non_field_errors": [self.email_taken_error]})
+        if "username" in message:
+            return serializers.ValidationError({"username": [self.username_taken_error]})
+        raise error
 
     # Create new instance.
     # Use .create() method for post request, Triggers if an object does not exist.
@@ -167,15 +178,29 @@ class RegisterationSerializer(serializers.ModelSerializer):
         Args:
             - validated_data (dict): Dictionary that contains validated data required to create new user.
 
+        Raises:
+            - ValidationError: In case the username or the email is already taken.
+
         Returns:
             - New created user as a User Model Instance.
         """
+        # Password hashed ahead of time, AsyncRegisterView passes it through .save(password_hash=...)
+        password_hash: str | None = validated_data.pop("password_hash", None)
+        # Inside a transaction the failed INSERT must not break it, run it in a savepoint.
+        savepoint = transaction.atomic() if transaction.get_connection().in_atomic_block else nullcontext()
+        try:
+            with savepoint:
+                return self.insert_user(validated_data, password_hash)
+        except IntegrityError as error:
+            raise self.unique_error(error)
+
+    def insert_user(self: Self, validated_data: dict, password_hash: str | None) -> User:
+        """Method used to create the user with a single INSERT"""
+        if password_hash is not None:
+            validated_data.pop("password")
+            return User.objects.create_user_with_hash(password_hash=password_hash, **validated_data)
         # Using create_user method will actually handle the password hashing for us.
-        user = User.objects.create_user(**validated_data)
-        # Add a functionality that creates a unique user name to avoid errors
-        user.save()
-        # Return User Object
-        return user
+        return User.objects.create_user(**validated_data)
 
 class LogoutSerializer(serializers.Serializer):
     refresh_token = serializers.CharField(required=True)
@@ -184,7 +209,7 @@ class LogoutSerializer(serializers.Serializer):
     def validate_refresh_token(self: Self, token: str) -> str:
         """Validate JWT Token"""
         try: 
-            RefreshToken(token)
+            CachedRefreshToken(token)
             return token
         except TokenError as e:
             # Other wise raise Token validation error for token.
@@ -0,0 +1,36 @@
+"""
+File that contains Signal receivers for the API:-
+    - drop_cached_user (function): Drops a user from the in-process user cache when it is saved or deleted.
+    - cache_blacklisted_token (function): Caches the id of a token as blacklisted once it is blacklisted.
+    - forget_blacklisted_token (function): Drops the cached answer of a token removed from the blacklist.
+"""
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken
+from .models import User
+from .cache import user_cache
+from .blacklist import remember_blacklisted_jti, forget_jti
+
+
+@receiver(post_save, sender=User, dispatch_uid="user_cache_saved")
+@receiver(post_delete, sender=User, dispatch_uid="user_cache_deleted")
+def drop_cached_user(sender: type[User], instance: User, **kwargs) -> None:
+    """Receiver that drops a changed user from the user cache"""
+    user_cache.delete(instance.pk)
+
+
+@receiver(post_save, sender=BlacklistedToken, dispatch_uid="blacklist_cache_saved")
+def cache_blacklisted_token(sender: type[BlacklistedToken], instance: BlacklistedToken, **kwargs) -> None:
+    """Receiver that caches a token id as blacklisted"""
+    remember_blacklisted_jti(instance.token.jti, instance.token.expires_at)
+
+
+@receiver(post_delete, sender=BlacklistedToken, dispatch_uid="blacklist_cache_deleted")
+def forget_blacklisted_token(sender: type[BlacklistedToken], instance: BlacklistedToken, **kwargs) -> None:
+    """
+    Receiver that drops the cached answer of a token removed from the blacklist.
+    Rows deleted in bulk without their token loaded (see user_authentication.pruning) belong to expired tokens,
+    their cached answer has expired with them, so no query is spent per row.
+    """
+    if BlacklistedToken.token.is_cached(instance):
+        forget_jti(instance.token.jti)
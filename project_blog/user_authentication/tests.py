@@ -4,6 +4,14 @@ File contains Test Classess:-
     - LoginTests (APITestCase): Class to test LoginView.
     - LogoutTests (APITestCase): Class to test LogoutView.
     - RefreshTokenTests (APITestCase): Class to test refresh_token_view.
+    - UserEmailIndexTests (TestCase): Class to test the case insensitive unique email index.
+    - AsyncAuthenticationTests (TestCase): Class to test AsyncLoginView & AsyncRegisterView.
+    - PasswordHashingPoolTests (SimpleTestCase): Class to test the bounded hashing pool.
+    - LoginThrottleTests (APITestCase): Class to test throttling of login attempts.
+    - ClaimsAuthenticationTests (APITestCase): Class to test ClaimsJWTAuthentication & the user cache.
+    - RevocationListTests (SimpleTestCase): Class to test the revocation list cache backed revocation list its bloom filters.
+    - TokenPruningTests (TestCase): Class to test batched pruning of expired tokens.
+    - UserImportTests (TestCase): Class to test the import_users command.
 """
 from rest_framework.test import APITestCase
 from rest_framework_simplejwt.exceptions import TokenError
@@ -11,9 +19,39 @@ from rest_framework_simplejwt.tokens import RefreshToken
 from rest_framework import status
 from django.http import HttpResponse
 from django.urls import reverse
+from django.test import TestCase, SimpleTestCase
+from django.test.utils import CaptureQueriesContext, override_settings
+from django.db import connection, IntegrityError
 from .models import User
+from .hashing import PasswordHashingPool
+from .blacklist import is_jti_blacklisted, NEGATIVE_TTL
+from .revocation import BloomFilter, RevocationList
+from .pruning import prune_expired_tokens, TokenPruningScheduler
+from .importing import insert_batch
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.core.cache import cache
+from django.utils import timezone
+from datetime import timedelta
+from io import StringIO
+from .cache import user_cache
+from .authentication import ClaimsJWTAuthentication
+from .refresh_token import get_tokens_for_user
+from .throttling import (
+    CacheTokenBucketBackend,
+    LoginRateThrottle,
+    login_throttle_backend,
+)
 from typing import Self
+import asyncio
 import json
+import os
+import tempfile
+import threading
+import time
+import unittest
+from unittest import mock
 
 # Create your tests here.
 class RegisterTests(APITestCase):
@@ -84,6 +122,40 @@ class RegisterTests(APITestCase):
             # Check Error Message Field Should Be Presented
             self.assertIn(field,json.loads(response.content).keys())
     
+    def test_taken_username_and_email(self: Self) -> None:
+        """
+        Test Case for registering a taken username or email with a single INSERT & no lookup.
+        """
+        url: str = reverse(self.API)
+        self.client.post(url, self.data)
+        cases: list[tuple[dict, str, str]] = [
+            ({"email": "other@example.com"}, "username", "Username already exists."),
+            ({"username": "other_user", "email": "TEST@example.com"}, "non_field_errors",
+             "Patient account with this email already exists"),
+        ]
+        for changes, field, message in cases:
+            with CaptureQueriesContext(connection) as queries:
+                response: HttpResponse = self.client.post(url, {**self.data, **changes})
+            self.assertEqual(response.status_code, 403)
+            self.assertEqual(json.loads(response.content)[field], [message])
+            # Savepoints come from the transaction of the test case
+            statements: list[str] = [
+                query["sql"].split()[0] for query in queries.captured_queries if "SAVEPOINT" not in query["sql"]
+            ]
+            self.assertEqual(statements, ["INSERT"])
+        self.assertEqual(User.objects.count(), 1)
+
+    def test_async_taken_username(self: Self) -> None:
+        """
+        Test Case for the async registration of a taken username.
+        """
+        self.client.post(reverse(self.API), self.data)
+        response: HttpResponse = self.client.post(
+            reverse("async-register-view"), {**self.data, "email": "other@example.com"}
+        )
+        self.assertEqual(response.status_code, 403)
+        self.assertEqual(json.loads(response.content)["username"], ["Username already exists."])
+
     # Need to create more tests for input validators...
             # invalid email address
             # invalid password
@@ -143,6 +215,31 @@ class LoginTests(APITestCase):
             if "token" != key:
                 self.assertTrue(value == self.data[key])
 
+    def test_non_string_email(self: Self) -> None:
+        """Test emails that are not strings are refused like unknown emails instead of failing"""
+        for email in (123, ["a"], {"email": "test@example.com"}, None):
+            response: HttpResponse = self.client.post(
+                reverse(self.API), {"email": email, "password": "x"}, format="json"
+            )
+            self.assertEqual(response.status_code, 401)
+
+    def test_login_query_budget(self: Self) -> None:
+        """
+        Test login loads the user once, the other query stores the outstanding refresh token.
+        """
+        with self.assertNumQueries(2):
+            response: HttpResponse = self.client.post(reverse(self.API), self.data)
+        self.assertEqual(response.status_code, 201)
+
+    def test_email_case_is_ignored(self: Self) -> None:
+        """
+        Test login with the email in a different case.
+        """
+        data: dict[str, str] = {'email': 'TEST@Example.com', 'password': '1234!Example.'}
+        response: HttpResponse = self.client.post(reverse(self.API), data)
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(json.loads(response.content)["email"], "test@example.com")
+
     def test_invalid_email(self: Self) -> None:
         """
         Test Login Failure when email address is invalid
@@ -271,7 +368,9 @@ class LogoutTests(APITestCase):
         # Check if the expected error message is raised
         self.assertEqual(str(context.exception), "Token is blacklisted")
 
-        # call api again and see response
+        # call api again with a new access token, the old one has been revoked
+        self.client.credentials()
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {self.login()['access']}")
         second_response: HttpResponse = self.client.post(
             url,
             {"refresh_token": token['refresh']}
@@ -283,6 +382,21 @@ class LogoutTests(APITestCase):
             json.loads(second_response.content)['refresh_token'][0],
             'Token is blacklisted'
         )
+
+    def test_access_token_revoked(self: Self) -> None:
+        """Test Case to validate that the access token is refused after logout"""
+        token: dict[str, str] = self.login()
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {token['access']}")
+        response: HttpResponse = self.client.post(reverse(self.API), {"refresh_token": token['refresh']})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        # Access token is refused
+        response = self.client.post(reverse(self.API), {"refresh_token": token['refresh']})
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+        # Other sessions of the user are not affected
+        self.client.credentials()
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {self.login()['access']}")
+        response = self.client.post(reverse(self.API), {"refresh_token": token['refresh']})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
         
 
 # Create your tests here.
@@ -366,6 +480,9 @@ class RefreshTokenTests(APITestCase):
             reverse("logout-view"),
             {"refresh_token": tokens['refresh']}
         )
+        # Swap the revoked access token for a new one
+        self.client.credentials()
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {self.login()['access']}")
 
         # Grab response
         response: HttpResponse = self.client.post(
@@ -376,6 +493,585 @@ class RefreshTokenTests(APITestCase):
         # Assert  Status Code Unauthorized
         self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
 
-        
-    
+    def test_refresh_queries(self: Self) -> None:
+        """
+        Test refreshing fetches the user once and checks the blacklist through the cache.
+        """
+        url: str = reverse(self.API)
+        tokens: dict[str, str] = self.login()
+        # Blacklist lookup, user & outstanding refresh token
+        with self.assertNumQueries(3):
+            response: HttpResponse = self.client.post(url, {"refresh_token": tokens['refresh']})
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        # The blacklist answer is cached now
+        with self.assertNumQueries(2):
+            response = self.client.post(url, {"refresh_token": tokens['refresh']})
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
 
+    def test_cached_answer_replaced_on_logout(self: Self) -> None:
+        """
+        Test a cached "not blacklisted" answer does not outlive the logout.
+        """
+        url: str = reverse(self.API)
+        tokens: dict[str, str] = self.login()
+        # Cache the negative answer
+        response: HttpResponse = self.client.post(url, {"refresh_token": tokens['refresh']})
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        # Logout
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {tokens['access']}")
+        self.client.post(reverse("logout-view"), {"refresh_token": tokens['refresh']})
+        self.client.credentials()
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {self.login()['access']}")
+        # Refresh is refused without asking the database about the blacklist
+        with self.assertNumQueries(0):
+            response = self.client.post(url, {"refresh_token": tokens['refresh']})
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+
+    def test_blacklisted_answer_expires_with_token(self: Self) -> None:
+        """
+        Test a "blacklisted" answer read from the database is kept until the token expires, not forever.
+        """
+        token: OutstandingToken = OutstandingToken.objects.create(
+            jti="blacklisted-jti", token="token", expires_at=timezone.now() + timedelta(hours=1)
+        )
+        BlacklistedToken.objects.create(token=token)
+        cache.delete("token_blacklist:jti:blacklisted-jti")
+        with mock.patch("user_authentication.blacklist.cache") as shared_cache:
+            shared_cache.get.return_value = None
+            with self.assertNumQueries(1):
+                self.assertTrue(is_jti_blacklisted("blacklisted-jti"))
+        key, value, timeout = shared_cache.set.call_args.args
+        self.assertEqual((key, value), ("token_blacklist:jti:blacklisted-jti", True))
+        self.assertTrue(3500 < timeout <= 3600)
+        # Unknown ids are cached for the negative TTL
+        with mock.patch("user_authentication.blacklist.cache") as shared_cache:
+            shared_cache.get.return_value = None
+            self.assertFalse(is_jti_blacklisted("unknown-jti"))
+        shared_cache.set.assert_called_once_with("token_blacklist:jti:unknown-jti", False, NEGATIVE_TTL)
+
+
+class UserEmailIndexTests(TestCase):
+    """Test Class for the unique Lower(email) index"""
+
+    def test_email_unique_regardless_of_case(self: Self) -> None:
+        """Test two accounts can not share an email in different cases"""
+        User.objects.create_user(username="joe", email="joe@example.com", password="1234!Example.")
+        with self.assertRaises(IntegrityError):
+            User.objects.create_user(username="joe2", email="JOE@example.com", password="1234!Example.")
+
+    def test_blank_emails_allowed(self: Self) -> None:
+        """Test accounts without email are left out of the index"""
+        User.objects.create_user(username="staff1", password="1234!Example.")
+        User.objects.create_user(username="staff2", password="1234!Example.")
+        self.assertEqual(User.objects.filter(email="").count(), 2)
+
+    def test_get_by_email(self: Self) -> None:
+        """Test looking a user up by email ignores case"""
+        user: User = User.objects.create_user(username="joe", email="Joe@Example.com", password="1234!Example.")
+        self.assertEqual(User.objects.get_by_email("joe@example.COM"), user)
+        self.assertIsNone(User.objects.get_by_email("jane@example.com"))
+
+    @unittest.skipUnless(connection.vendor == "sqlite", "EXPLAIN QUERY PLAN output is SQLite specific.")
+    def test_lookup_uses_index(self: Self) -> None:
+        """Test the email lookup is an indexed probe"""
+        plan: str = User.objects.exclude(email="").filter(email__lower="joe@example.com").explain()
+        self.assertIn("USING INDEX user_email_lower_unique", plan)
+
+
+class AsyncAuthenticationTests(TestCase):
+    """Test Class for async login & registration"""
+    data: dict[str, str] = {
+        'username': 'test_user',
+        'email': 'test@example.com',
+        'password': '1234!Example.',
+        "first_name": "Joe",
+        'last_name': "Doe",
+    }
+
+    def test_register_then_login(self: Self) -> None:
+        """Test registering and logging in through the async views"""
+        response: HttpResponse = self.client.post(reverse("async-register-view"), self.data)
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(json.loads(response.content), 'User account was successfully created.!')
+        user: User = User.objects.get(username="test_user")
+        self.assertTrue(user.check_password(self.data["password"]))
+        # Login using JSON body
+        response = self.client.post(
+            reverse("async-login-view"),
+            {"email": self.data["email"], "password": self.data["password"]},
+            content_type="application/json",
+        )
+        self.assertEqual(response.status_code, 201)
+        response_data: dict = json.loads(response.content)
+        self.assertEqual(response_data["username"], "test_user")
+        self.assertIn("access", response_data["token"])
+
+    def test_register_invalid(self: Self) -> None:
+        """Test async registration returns the serializer errors"""
+        data: dict[str, str] = self.data.copy()
+        del data["email"]
+        response: HttpResponse = self.client.post(reverse("async-register-view"), data)
+        self.assertEqual(response.status_code, 403)
+        self.assertIn("email", json.loads(response.content))
+
+    def test_login_failures(self: Self) -> None:
+        """Test async login answers like LoginView"""
+        User.objects.create_user(**self.data)
+        # Unknown user
+        response: HttpResponse = self.client.post(
+            reverse("async-login-view"), {"email": "nobody@example.com", "password": "x"}
+        )
+        self.assertEqual(response.status_code, 401)
+        # Wrong password
+        response = self.client.post(
+            reverse("async-login-view"), {"email": self.data["email"], "password": "12312412"}
+        )
+        self.assertEqual(response.status_code, 404)
+        self.assertIn(
+            "User 'email' or 'password' is incorrect.",
+            json.loads(response.content)["non_field_errors"],
+        )
+
+
+class PasswordHashingPoolTests(SimpleTestCase):
+    """Test Class for the hashing pool"""
+
+    def test_pool_is_bounded(self: Self) -> None:
+        """Test no more jobs than workers run at once and the metrics add up"""
+        pool: PasswordHashingPool = PasswordHashingPool(2)
+        lock: threading.Lock = threading.Lock()
+        running: list[int] = [0, 0]
+        seen_stats: list[dict] = []
+
+        def job() -> None:
+            with lock:
+                running[0] += 1
+                running[1] = max(running)
+            seen_stats.append(pool.stats())
+            time.sleep(0.02)
+            with lock:
+                running[0] -= 1
+
+        async def main() -> None:
+            await asyncio.gather(*(pool.run(job) for _ in range(6)))
+
+        asyncio.run(main())
+        self.assertEqual(running[1], 2)
+        # Jobs waited in the queue while the two workers were busy
+        self.assertTrue(any(stats["queued"] > 0 for stats in seen_stats))
+        self.assertEqual(pool.stats(), {"workers": 2, "queued": 0, "running": 0, "completed": 6})
+
+    def test_event_loop_not_blocked(self: Self) -> None:
+        """Test the event loop keeps running while a job is hashing"""
+        pool: PasswordHashingPool = PasswordHashingPool(1)
+
+        async def main() -> int:
+            ticks: int = 0
+            job = asyncio.ensure_future(pool.run(time.sleep, 0.1))
+            while not job.done():
+                ticks += 1
+                await asyncio.sleep(0.01)
+            return ticks
+
+        self.assertGreater(asyncio.run(main()), 3)
+
+
+@mock.patch.object(LoginRateThrottle, "rates", {"email": (3, 60), "ip": (5, 60)})
+class LoginThrottleTests(APITestCase):
+    """Test Class for login throttling"""
+    # String that represents name of API for reverse
+    API: str = "login-reset-view"
+    data: dict[str, str] = {
+        'username': 'throttled_user',
+        'email': 'throttled@example.com',
+        'password': '1234!Example.',
+    }
+
+    def setUp(self: Self) -> None:
+        """Set Up a user and empty buckets"""
+        login_throttle_backend.reset()
+        self.user: User = User.objects.create_user(**self.data)
+
+    def tearDown(self: Self) -> None:
+        """Drop buckets filled by the test"""
+        login_throttle_backend.reset()
+
+    def attempt(self: Self, email: str = "throttled@example.com", password: str = "wrong-password1",
+                ip: str = "10.0.0.1", api: str | None = None) -> HttpResponse:
+        """Method used to send a login attempt"""
+        return self.client.post(
+            reverse(api or self.API), {"email": email, "password": password}, REMOTE_ADDR=ip
+        )
+
+    def test_email_bucket(self: Self) -> None:
+        """Test failed attempts on an email are throttled before any query or hash"""
+        for _ in range(3):
+            self.assertEqual(self.attempt().status_code, 404)
+        with mock.patch.object(User, "check_password") as check_password:
+            with self.assertNumQueries(0):
+                response: HttpResponse = self.attempt(password=self.data["password"])
+            check_password.assert_not_called()
+        self.assertEqual(response.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+        self.assertGreaterEqual(int(response["Retry-After"]), 1)
+        # Another address is throttled on the email too
+        self.assertEqual(self.attempt(ip="10.0.0.2").status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+
+    def test_ip_bucket(self: Self) -> None:
+        """Test failed attempts from an address on many emails are throttled"""
+        for number in range(5):
+            self.assertEqual(self.attempt(email=f"user{number}@example.com").status_code, 401)
+        self.assertEqual(self.attempt().status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+        # Other addresses are not affected
+        self.assertEqual(self.attempt(ip="10.0.0.2").status_code, 404)
+
+    def test_forwarded_for_spoofing(self: Self) -> None:
+        """Test a new X-Forwarded-For per attempt does not give a new address bucket"""
+        for api in (self.API, "async-login-view"):
+            login_throttle_backend.reset()
+            for number in range(5):
+                response: HttpResponse = self.client.post(
+                    reverse(api), {"email": f"user{number}@example.com", "password": "wrong-password1"},
+                    REMOTE_ADDR="10.0.0.1", HTTP_X_FORWARDED_FOR=f"192.0.2.{number}",
+                )
+                self.assertEqual(response.status_code, 401)
+            response = self.client.post(
+                reverse(api), {"email": "user9@example.com", "password": "wrong-password1"},
+                REMOTE_ADDR="10.0.0.1", HTTP_X_FORWARDED_FOR="192.0.2.9",
+            )
+            self.assertEqual(response.status_code, status.HTTP_429_TOO_MANY_REQUESTS, api)
+
+    @override_settings(REST_FRAMEWORK={"NUM_PROXIES": 1})
+    def test_trusted_proxy(self: Self) -> None:
+        """Test the forwarded address is used once NUM_PROXIES is set"""
+        request = mock.Mock(META={"REMOTE_ADDR": "10.0.0.1", "HTTP_X_FORWARDED_FOR": "192.0.2.1, 10.0.0.1"})
+        self.assertEqual(LoginRateThrottle().get_ident(request), "10.0.0.1")
+        request.META["HTTP_X_FORWARDED_FOR"] = "192.0.2.1"
+        self.assertEqual(LoginRateThrottle().get_ident(request), "192.0.2.1")
+
+    def test_email_rejections_keep_ip_budget(self: Self) -> None:
+        """Test attempts refused by the email bucket do not use the budget of the address"""
+        # 3 attempts pass the email bucket, 7 are refused by it
+        for _ in range(10):
+            self.attempt()
+        # The address used 3 of its 5 tokens
+        for number in range(2):
+            self.assertEqual(self.attempt(email=f"user{number}@example.com").status_code, 401)
+        self.assertEqual(self.attempt(email="other@example.com").status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+
+    def test_malformed_body(self: Self) -> None:
+        """Test bodies that are not objects are refused instead of failing"""
+        for body in ([1, 2], "text", 3):
+            response: HttpResponse = self.client.post(reverse(self.API), body, format="json")
+            self.assertEqual(response.status_code, 401)
+
+    def test_success_not_counted(self: Self) -> None:
+        """Test successful logins give their tokens back"""
+        for _ in range(6):
+            self.assertEqual(self.attempt(password=self.data["password"]).status_code, 201)
+
+    def test_async_login_throttled(self: Self) -> None:
+        """Test the async login view shares the buckets"""
+        for _ in range(3):
+            self.assertEqual(self.attempt(api="async-login-view").status_code, 404)
+        response: HttpResponse = self.attempt(api="async-login-view")
+        self.assertEqual(response.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+        self.assertIn("Retry-After", response)
+        self.assertEqual(self.attempt().status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+
+    def test_cache_backend(self: Self) -> None:
+        """Test buckets kept in the cache refill over time"""
+        backend: CacheTokenBucketBackend = CacheTokenBucketBackend()
+        with mock.patch("user_authentication.throttling.time.time", return_value=1000.0):
+            self.assertEqual([backend.consume("cache-test", 2, 60) for _ in range(2)], [0.0, 0.0])
+            self.assertAlmostEqual(backend.consume("cache-test", 2, 60), 30.0)
+        # Half the period later one token is back
+        with mock.patch("user_authentication.throttling.time.time", return_value=1030.0):
+            self.assertEqual(backend.consume("cache-test", 2, 60), 0.0)
+            self.assertGreater(backend.consume("cache-test", 2, 60), 0)
+
+
+class ClaimsAuthenticationTests(APITestCase):
+    """Test Class for authenticated requests without loading the user"""
+    # String that represents name of API for reverse
+    API: str = "create-post-view"
+    post: dict[str, str] = {"title": "Hello World", "content": "content"}
+
+    def setUp(self: Self) -> None:
+        """Set Up a user and an empty user cache"""
+        user_cache.clear()
+        self.user: User = User.objects.create_user(
+            username="joe", email="joe@example.com", password="1234!Example."
+        )
+
+    def create_post(self: Self, access: str) -> HttpResponse:
+        """Method used to create a post with an access token"""
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {access}")
+        return self.client.post(reverse(self.API), self.post)
+
+    def test_snapshot_skips_user_query(self: Self) -> None:
+        """Test a token with the user snapshot creates a post with the INSERT only"""
+        access: str = get_tokens_for_user(self.user)["access"]
+        with self.assertNumQueries(1):
+            response: HttpResponse = self.create_post(access)
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(self.user.posts.get().title, "Hello World")
+
+    def test_inactive_snapshot(self: Self) -> None:
+        """Test a token issued for an inactive user is refused"""
+        self.user.is_active = False
+        access: str = get_tokens_for_user(self.user)["access"]
+        self.assertEqual(self.create_post(access).status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_token_without_snapshot_uses_cache(self: Self) -> None:
+        """Test tokens without snapshot load the user once then use the cache until the user is saved"""
+        access: str = str(RefreshToken.for_user(self.user).access_token)
+        with self.assertNumQueries(2):
+            self.assertEqual(self.create_post(access).status_code, status.HTTP_201_CREATED)
+        with self.assertNumQueries(1):
+            self.assertEqual(self.create_post(access).status_code, status.HTTP_201_CREATED)
+        # Saving the user drops it from the cache
+        self.user.is_active = False
+        self.user.save()
+        self.assertEqual(self.create_post(access).status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_snapshot_user_is_partial(self: Self) -> None:
+        """Test fields outside the snapshot are deferred and load lazily"""
+        self.user.first_name = "Joe"
+        self.user.save()
+        authentication: ClaimsJWTAuthentication = ClaimsJWTAuthentication()
+        token = authentication.get_validated_token(get_tokens_for_user(self.user)["access"].encode())
+        user: User = authentication.get_user(token)
+        self.assertEqual((user.pk, user.email, user.is_active), (self.user.pk, "joe@example.com", True))
+        self.assertEqual(user.get_deferred_fields(), {
+            field.attname for field in User._meta.concrete_fields
+        } - {"id", "email", "username", "is_active"})
+        self.assertEqual(user.first_name, "Joe")
+
+
+class RevocationListTests(SimpleTestCase):
+    """Test Class for the access token revocation list"""
+
+    def setUp(self: Self) -> None:
+        """Start every test with an empty deny-set & log"""
+        cache.clear()
+
+    def test_bloom_filter(self: Self) -> None:
+        """Test the bloom filter never misses an added item and rarely answers maybe for others"""
+        bloom: BloomFilter = BloomFilter(1000, error_rate=0.01)
+        for index in range(1000):
+            bloom.add(f"added-{index}")
+        self.assertTrue(all(f"added-{index}" in bloom for index in range(1000)))
+        false_positives: int = sum(f"other-{index}" in bloom for index in range(10_000))
+        self.assertLess(false_positives, 300)
+
+    def test_revoke(self: Self) -> None:
+        """Test revoked ids are reported until they expire"""
+        revocations: RevocationList = RevocationList(100)
+        revocations.revoke("live", time.time() + 60)
+        revocations.revoke("expired", time.time() - 1)
+        self.assertTrue(revocations.is_revoked("live"))
+        self.assertFalse(revocations.is_revoked("expired"))
+        self.assertFalse(revocations.is_revoked("unknown"))
+        with mock.patch("user_authentication.revocation.time.time", return_value=time.time() + 120):
+            self.assertFalse(revocations.is_revoked("live"))
+
+    def test_shared_between_processes(self: Self) -> None:
+        """Test a token revoked by one process is refused by another one once it has synced"""
+        revocations: RevocationList = RevocationList(100, sync_interval=60)
+        other_process: RevocationList = RevocationList(100, sync_interval=60)
+        self.assertFalse(other_process.is_revoked("shared"))
+        revocations.revoke("shared", time.time() + 600)
+        self.assertTrue(revocations.is_revoked("shared"))
+        # Read on the next sync
+        self.assertFalse(other_process.is_revoked("shared"))
+        other_process.read_log(time.time() + 60)
+        self.assertTrue(other_process.is_revoked("shared"))
+        # A restart rebuilds the bloom filters out of the log
+        revocations.clear()
+        self.assertTrue(revocations.is_revoked("shared"))
+
+    def test_miss_reads_no_cache(self: Self) -> None:
+        """Test only bloom hits reach the cache once the log has been read"""
+        revocations: RevocationList = RevocationList(100, sync_interval=60)
+        revocations.revoke("revoked", time.time() + 60)
+        revocations.read_log()
+        with mock.patch("user_authentication.revocation.cache") as shared_cache:
+            shared_cache.get.return_value = True
+            self.assertFalse(revocations.is_revoked("unknown"))
+            shared_cache.get.assert_not_called()
+            self.assertTrue(revocations.is_revoked("revoked"))
+            shared_cache.get.assert_called_once_with("revoked:revoked")
+
+    def test_async(self: Self) -> None:
+        """Test the async check reads the log & the deny-set with the async cache API only"""
+        revocations: RevocationList = RevocationList(100, sync_interval=60)
+        entries: dict = {"revoked:sequence": 1, "revoked:revoked": True}
+        with mock.patch("user_authentication.revocation.cache") as shared_cache:
+            shared_cache.aget = mock.AsyncMock(side_effect=lambda key, default=None: entries.get(key, default))
+            shared_cache.aget_many = mock.AsyncMock(return_value={"revoked:log:1": ("revoked", time.time() + 60)})
+            self.assertTrue(asyncio.run(revocations.ais_revoked("revoked")))
+            self.assertFalse(asyncio.run(revocations.ais_revoked("unknown")))
+        shared_cache.get.assert_not_called()
+        shared_cache.get_many.assert_not_called()
+        shared_cache.aget_many.assert_awaited_once_with(["revoked:log:1"])
+
+    def test_log_overlap(self: Self) -> None:
+        """Test a log entry written after a sync read the counter is picked up by the next sync"""
+        revocations: RevocationList = RevocationList(100, sync_interval=60)
+        revocations.revoke("first", time.time() + 600)
+        other_process: RevocationList = RevocationList(100, sync_interval=60)
+        # The counter is read before the entry of "first" exists
+        cache.delete("revoked:log:1")
+        other_process.read_log()
+        cache.set("revoked:log:1", ("first", time.time() + 600))
+        self.assertFalse(other_process.is_revoked("first"))
+        other_process.read_log(time.time() + 60)
+        self.assertTrue(other_process.is_revoked("first"))
+
+    def test_expired_windows(self: Self) -> None:
+        """Test bloom filters are dropped once every token of their window has expired"""
+        revocations: RevocationList = RevocationList(100, sync_interval=60)
+        revocations.revoke("short", time.time() + 1)
+        self.assertEqual(len(revocations._blooms), 1)
+        later: float = time.time() + revocations.window * 2
+        with mock.patch("user_authentication.revocation.time.time", return_value=later):
+            revocations.revoke("long", later + 60)
+            self.assertEqual(len(revocations._blooms), 1)
+            self.assertTrue(revocations.is_revoked("long"))
+            self.assertFalse(revocations.is_revoked("short"))
+
+
+class TokenPruningTests(TestCase):
+    """Test Class for pruning expired tokens"""
+
+    def setUp(self: Self) -> None:
+        """Create 5 expired & 2 live tokens, one of each blacklisted"""
+        now = timezone.now()
+        for index in range(7):
+            expires_at = now - timedelta(hours=1) if index < 5 else now + timedelta(hours=1)
+            token: OutstandingToken = OutstandingToken.objects.create(
+                jti=f"jti-{index}", token="token", expires_at=expires_at
+            )
+            if index in (0, 5):
+                BlacklistedToken.objects.create(token=token)
+
+    def test_prune_in_batches(self: Self) -> None:
+        """Test expired tokens are deleted in bounded batches & live tokens are kept"""
+        batches: list[int] = []
+        report: dict = prune_expired_tokens(batch_size=2, on_batch=lambda report: batches.append(report["outstanding"]))
+        self.assertEqual(batches, [2, 4, 5])
+        self.assertEqual(report["outstanding"], 5)
+        self.assertEqual(report["blacklisted"], 1)
+        self.assertEqual(report["remaining"], 0)
+        self.assertEqual(set(OutstandingToken.objects.values_list("jti", flat=True)), {"jti-5", "jti-6"})
+        self.assertEqual(BlacklistedToken.objects.get().token.jti, "jti-5")
+
+    def test_max_batches(self: Self) -> None:
+        """Test the backlog left by a bounded run is reported"""
+        report: dict = prune_expired_tokens(batch_size=2, max_batches=1)
+        self.assertEqual(report["batches"], 1)
+        self.assertEqual(report["remaining"], 3)
+        # The scheduler finishes the work & hands its connection back
+        with mock.patch("user_authentication.pruning.close_old_connections") as close_old_connections:
+            self.assertEqual(TokenPruningScheduler(60, batch_size=2).run_once()["remaining"], 0)
+        close_old_connections.assert_called_once_with()
+
+    def test_command(self: Self) -> None:
+        """Test the management command reports its work"""
+        output: StringIO = StringIO()
+        call_command("prune_token_blacklist", "--batch-size", "3", stdout=output)
+        self.assertIn("Deleted 5 outstanding & 1 blacklisted tokens in 2 batches", output.getvalue())
+        self.assertIn("0 expired tokens left", output.getvalue())
+
+    def test_command_invalid(self: Self) -> None:
+        """Test invalid options fail the command instead of exiting successfully"""
+        for args in (["--batch-size", "0"], ["--every", "0"]):
+            with self.assertRaises(CommandError):
+                call_command("prune_token_blacklist", *args, stdout=StringIO())
+        self.assertEqual(OutstandingToken.objects.count(), 7)
+
+    def test_command_every(self: Self) -> None:
+        """Test the command keeps pruning in the foreground with --every"""
+        with mock.patch.object(TokenPruningScheduler, "run", autospec=True) as run:
+            call_command("prune_token_blacklist", "--every", "60", "--max-batches", "5", stdout=StringIO())
+        scheduler: TokenPruningScheduler = run.call_args.args[0]
+        self.assertEqual((scheduler.interval, scheduler.max_batches), (60, 5))
+        self.assertEqual(OutstandingToken.objects.count(), 2)
+
+
+class UserImportTests(TestCase):
+    """Test Class for importing users in bulk"""
+
+    def setUp(self: Self) -> None:
+        """Create an existing user & a directory for the files"""
+        User.objects.create_user(username="taken", email="taken@example.com", password="1234!Example.")
+        self.directory: tempfile.TemporaryDirectory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    def write(self: Self, name: str, content: str) -> str:
+        """Method that writes a file to import & returns its path"""
+        path: str = os.path.join(self.directory.name, name)
+        with open(path, "w", encoding="utf-8") as file:
+            file.write(content)
+        return path
+
+    def test_import_csv(self: Self) -> None:
+        """Test valid rows are imported & every other row is rejected with its line & reason"""
+        path: str = self.write("users.csv", "\n".join([
+            "username,email,password,first_name,last_name",
+            "alice,alice@example.com,1234!Example.,Alice,Smith",
+            "bob,not-an-email,1234!Example.,Bob,Smith",
+            "alice,other@example.com,1234!Example.,Alice,Jones",
+            "carol,TAKEN@example.com,1234!Example.,Carol,Smith",
+            "dave,dave@example.com,short1,Dave,Smith",
+            "erin,erin@example.com,1234!Example.,Erin,Smith",
+        ]))
+        rejects: str = os.path.join(self.directory.name, "rejects.csv")
+        output: StringIO = StringIO()
+        call_command(
+            "import_users", path, "--batch-size", "2", "--workers", "1", "--rejects", rejects, stdout=output
+        )
+        self.assertIn("Imported 2 of 6 users, 4 rejected", output.getvalue())
+        self.assertEqual(set(User.objects.values_list("username", flat=True)), {"taken", "alice", "erin"})
+        self.assertTrue(User.objects.get(username="erin").check_password("1234!Example."))
+        with open(rejects, encoding="utf-8") as file:
+            lines: list[str] = file.read().splitlines()
+        self.assertEqual([line.split(",")[0] for line in lines], ["line", "3", "4", "5", "6"])
+        self.assertIn("Invalid email address.", lines[1])
+        self.assertIn("Duplicate username or email in the file.", lines[2])
+        self.assertIn("Username or email already exists.", lines[3])
+
+    def test_import_ndjson(self: Self) -> None:
+        """Test NDJSON files are read line by line & unreadable lines are rejected"""
+        path: str = self.write("users.ndjson", "\n".join([
+            json.dumps({
+                "username": "alice", "email": "alice@example.com", "password": "1234!Example.",
+                "first_name": "Alice", "last_name": "Smith",
+            }),
+            "{not json",
+            "",
+            json.dumps({"username": "bob", "email": "bob@example.com"}),
+        ]))
+        output: StringIO = StringIO()
+        errors: StringIO = StringIO()
+        call_command("import_users", path, "--workers", "1", stdout=output, stderr=errors)
+        self.assertIn("Imported 1 of 3 users, 2 rejected", output.getvalue())
+        self.assertIn("Line 2: Invalid JSON.", errors.getvalue())
+        self.assertIn("Line 4: Missing password, first_name, last_name.", errors.getvalue())
+        self.assertTrue(User.objects.filter(username="alice").exists())
+
+    def test_insert_batch_conflict(self: Self) -> None:
+        """Test a batch hitting a unique constraint falls back to row by row inserts"""
+        rejected: list[tuple[int, str]] = []
+        created: int = insert_batch(
+            [
+                User(username="new", email="new@example.com", password="hash"),
+                User(username="taken", email="other@example.com", password="hash"),
+            ],
+            lambda line_number, reason: rejected.append((line_number, reason)),
+            [1, 2],
+        )
+        self.assertEqual(created, 1)
+        self.assertEqual(rejected, [(2, "Username or email already exists.")])
+        self.assertTrue(User.objects.filter(username="new").exists())
@@ -0,0 +1,225 @@
+"""
+File that contains Throttling classes for login:-
+    - TokenBucketBackend (ABC): An Abstract Class for token bucket storage.
+    - LocalTokenBucketBackend (TokenBucketBackend): Keeps buckets in process memory, bounded in size.
+    - CacheTokenBucketBackend (TokenBucketBackend): Keeps buckets in Django's cache to share them between processes.
+    - LoginRateThrottle (BaseThrottle): Is a class that throttles login attempts by email and by client IP.
+
+Notes:
+    - A bucket holds up to `capacity` tokens and refills `capacity` tokens every `period` seconds,\
+        every attempt takes one token and an empty bucket means the attempt is rejected with 429.
+    - Throttling runs before any database query or password hash, so a flood of attempts costs\
+        next to no CPU once the buckets are empty.
+    - Successful logins give their tokens back, so only failed attempts drain the buckets.
+    - The IP bucket is keyed on REMOTE_ADDR, X-Forwarded-For is only read when REST_FRAMEWORK["NUM_PROXIES"]\
+        is set, otherwise a client could pick a new address for every attempt.
+"""
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.module_loading import import_string
+from rest_framework.throttling import BaseThrottle
+from rest_framework.request import Request
+from rest_framework.settings import api_settings
+from typing import Self
+import threading
+import time
+
+
+def refill(state: tuple[float, float] | None, capacity: int, period: float, now: float) -> float:
+    """
+    Function used to compute the tokens of a bucket at a given time.
+
+    Args:
+        - state (tuple): Tokens and the time they were counted at, None for a new bucket.
+        - capacity (int): Maximum number of tokens.
+        - period (float): Seconds needed to refill the full bucket.
+        - now (float): Current time.
+
+    Returns:
+        - Number of tokens in the bucket.
+    """
+    if state is None:
+        return float(capacity)
+    tokens, updated_at = state
+    return min(float(capacity), tokens + (now - updated_at) * capacity / period)
+
+
+class TokenBucketBackend(ABC):
+    """Class used to store token buckets"""
+
+    @abstractmethod
+    def consume(self: Self, key: str, capacity: int, period: float) -> float:
+        """
+        Method used to take a token from a bucket.
+
+        Returns:
+            - 0 in case a token was taken otherwise the seconds to wait for the next token.
+        """
+        pass
+
+    @abstractmethod
+    def refund(self: Self, key: str, capacity: int, period: float) -> None:
+        """Method used to give a token back to a bucket"""
+        pass
+
+    @abstractmethod
+    def reset(self: Self) -> None:
+        """Method used to drop every bucket"""
+        pass
+
+    @staticmethod
+    def take(tokens: float, capacity: int, period: float) -> tuple[float, float]:
+        """
+        Method used to take a token out of a number of tokens.
+
+        Returns:
+            - Tuple of the tokens left and the seconds to wait, 0 in case the token was taken.
+        """
+        if tokens >= 1:
+            return tokens - 1, 0.0
+        return tokens, (1 - tokens) * period / capacity
+
+
+class LocalTokenBucketBackend(TokenBucketBackend):
+    """
+    Class that keeps token buckets in memory of the current process.
+
+    Attributes:
+        - max_keys (int): Maximum number of buckets, the least recently used bucket is dropped first.
+    """
+    max_keys: int = 100_000
+
+    def __init__(self: Self) -> None:
+        """Initiate class instance"""
+        self._buckets: OrderedDict[str, tuple[float, float]] = OrderedDict()
+        self._lock: threading.Lock = threading.Lock()
+
+    def consume(self: Self, key: str, capacity: int, period: float) -> float:
+        """Method used to take a token from a bucket"""
+        now: float = time.monotonic()
+        with self._lock:
+            tokens: float = refill(self._buckets.get(key), capacity, period, now)
+            tokens, wait = self.take(tokens, capacity, period)
+            self._buckets[key] = (tokens, now)
+            self._buckets.move_to_end(key)
+            # Keep memory bounded
+            while len(self._buckets) > self.max_keys:
+                self._buckets.popitem(last=False)
+        return wait
+
+    def refund(self: Self, key: str, capacity: int, period: float) -> None:
+        """Method used to give a token back to a bucket"""
+        now: float = time.monotonic()
+        with self._lock:
+            if key in self._buckets:
+                tokens: float = refill(self._buckets[key], capacity, period, now)
+                self._buckets[key] = (min(float(capacity), tokens + 1), now)
+
+    def reset(self: Self) -> None:
+        """Method used to drop every bucket"""
+        with self._lock:
+            self._buckets.clear()
+
+
+class CacheTokenBucketBackend(TokenBucketBackend):
+    """
+    Class that keeps token buckets in Django's cache, shared by every process using the same cache.
+    Updates are read-modify-write, under heavy races a few extra attempts may slip through.
+    """
+    key_prefix: str = "throttle:login:"
+
+    def consume(self: Self, key: str, capacity: int, period: float) -> float:
+        """Method used to take a token from a bucket"""
+        now: float = time.time()
+        tokens: float = refill(cache.get(self.key_prefix + key), capacity, period, now)
+        tokens, wait = self.take(tokens, capacity, period)
+        # A bucket left alone for a whole period is full again, it can expire.
+        cache.set(self.key_prefix + key, (tokens, now), int(period) + 1)
+        return wait
+
+    def refund(self: Self, key: str, capacity: int, period: float) -> None:
+        """Method used to give a token back to a bucket"""
+        state: tuple[float, float] | None = cache.get(self.key_prefix + key)
+        if state is not None:
+            now: float = time.time()
+            tokens: float = refill(state, capacity, period, now)
+            cache.set(self.key_prefix + key, (min(float(capacity), tokens + 1), now), int(period) + 1)
+
+    def reset(self: Self) -> None:
+        """Method used to drop every bucket, buckets expire on their own in the cache"""
+        pass
+
+
+# Backend shared by every LoginRateThrottle
+login_throttle_backend: TokenBucketBackend = import_string(
+    getattr(settings, "LOGIN_THROTTLE_BACKEND", "user_authentication.throttling.LocalTokenBucketBackend")
+)()
+
+
+class LoginRateThrottle(BaseThrottle):
+    """
+    Class used to throttle login attempts by email and by client IP.
+
+    Attributes:
+        - rates (dict): Maps "email" and "ip" to (capacity, period in seconds).
+    """
+    rates: dict[str, tuple[int, float]] = getattr(
+        settings, "LOGIN_THROTTLE_RATES", {"email": (5, 60), "ip": (30, 60)}
+    )
+
+    def __init__(self: Self, backend: TokenBucketBackend | None = None) -> None:
+        """
+        Initiate class instance
+
+        Args:
+            - backend (TokenBucketBackend): Storage of the buckets (default: LOGIN_THROTTLE_BACKEND).
+        """
+        self.backend: TokenBucketBackend = backend or login_throttle_backend
+        self.keys: dict[str, str] = {}
+        self.wait_time: float = 0.0
+
+    def allow(self: Self, email: object, ident: str | None) -> bool:
+        """
+        Method used to take a token from the buckets of the email and of the client IP.
+
+        Args:
+            - email (object): Email sent by the client, may be missing, only strings have a bucket.
+            - ident (str): Client IP address.
+
+        Returns:
+            - True in case the attempt is allowed.
+        """
+        self.keys = {}
+        if isinstance(email, str) and email.strip():
+            self.keys["email"] = f"email:{email.strip().lower()}"
+        # The IP bucket is only charged once the email bucket accepted the attempt
+        self.keys["ip"] = f"ip:{ident}"
+        for scope, key in self.keys.items():
+            capacity, period = self.rates[scope]
+            self.wait_time = self.backend.consume(key, capacity, period)
+            if self.wait_time:
+                return False
+        return True
+
+    def get_ident(self: Self, request: Request) -> str | None:
+        """Method that returns the client IP, the forwarded address is only trusted behind NUM_PROXIES proxies"""
+        if api_settings.NUM_PROXIES is None:
+            return request.META.get("REMOTE_ADDR")
+        return super().get_ident(request)
+
+    def allow_request(self: Self, request: Request, view: object) -> bool:
+        """Method used to throttle a Django Rest Framework request"""
+        email: object = request.data.get("email") if isinstance(request.data, dict) else None
+        return self.allow(email, self.get_ident(request))
+
+    def refund(self: Self) -> None:
+        """Method used to give the tokens of a successful login back"""
+        for scope, key in self.keys.items():
+            capacity, period = self.rates[scope]
+            self.backend.refund(key, capacity, period)
+
+    def wait(self: Self) -> float:
+        """Method that returns the seconds to wait before the next attempt"""
+        return self.wait_time
@@ -4,6 +4,9 @@ from .views import (
     LogoutView,
     RegisterView,
     refresh_token_view,
+    AsyncLoginView,
+    AsyncRegisterView,
+    hashing_pool_metrics_view,
 )
 
 urlpatterns = [
@@ -11,4 +14,7 @@ urlpatterns = [
     path("logout", LogoutView.as_view(), name="logout-view"),
     path("register", RegisterView.as_view(), name="register-view"),
     path("refresh", refresh_token_view, name="refresh-token-view"),
+    path("async", AsyncLoginView.as_view(), name="async-login-view"),
+    path("async/register", AsyncRegisterView.as_view(), name="async-register-view"),
+    path("metrics/hashing", hashing_pool_metrics_view, name="hashing-metrics-view"),
 ]
@@ -1,19 +1,30 @@
 """
 This File contains API View classes & functions:-
     - LoginView (APIView): Is a class for Login/Password Reset.
-    - LogoutView (APIView): Is a class for Logout of an authenticated user.
+    - LogoutView (APIView): Is a class for Logout of an authenticated user, revokes both tokens.
     - RegisterView (APIView): Is a class view for account registeration.
     - RefreshTokenView (@api_view): Is an API view for  token refreshment.
+    - AsyncLoginView (View): Is an async version of LoginView that checks passwords in the hashing pool.
+    - AsyncRegisterView (View): Is an async version of RegisterView that hashes passwords in the hashing pool.
+    - hashing_pool_metrics_view (@api_view): Is an API view for the metrics of the hashing pool.
 
 Protected API Views:
     - LogoutView Protected by (IsAuthenticated) class Permissions.
-    - LoginView Protected by (IsActive) class Permissions.
+    - LoginView Protected by (IsActive) class Permissions & throttled by (LoginRateThrottle).
     - RefreshTokenView Protected by (IsRefreshToken) class Permissions.
+    - AsyncLoginView Protected by the same checks as IsActiveUser & throttled by (LoginRateThrottle).
+    - hashing_pool_metrics_view Protected by (IsAdminUser) class Permissions.
     
 Unprotected API Views:
     - Registeration View.
+    - AsyncRegisterView.
+
+Notes:
+    - Async views are served natively through project_blog/asgi.py, password hashing runs in\
+        user_authentication.hashing.hashing_pool so the event loop keeps serving cheap requests.
 """
 from rest_framework_simplejwt.tokens import RefreshToken
+from rest_framework_simplejwt.settings import api_settings
 from rest_framework.response import Response
 from rest_framework.request import Request
 from rest_framework import status
@@ -27,9 +38,21 @@ from .serializer import (
     LogoutSerializer,
 )
 from .refresh_token import IsRefreshToken, get_tokens_for_user
+from .blacklist import CachedRefreshToken
+from .revocation import revocation_list
 from .models import User
-from rest_framework.permissions import BasePermission
+from rest_framework.permissions import BasePermission, IsAdminUser
+from rest_framework.exceptions import Throttled, ValidationError
+from django.contrib.auth.hashers import make_password
+from django.http import HttpRequest, JsonResponse
+from django.utils.decorators import method_decorator
+from django.views import View
+from django.views.decorators.csrf import csrf_exempt
+from asgiref.sync import sync_to_async
+from .hashing import hashing_pool
+from .throttling import LoginRateThrottle
 from typing import Self
+import json
 
 
 # Protected View
@@ -44,6 +67,22 @@ class LoginView(APIView):
     serializer_class: LoginSerializer = LoginSerializer
     # Add class attribute  which specifies that this view is only accessible if the user is an active user or not.
     permission_classes: tuple[BasePermission] = (IsActiveUser,)
+    # Throttle checked ahead of authentication & permissions, None disables it.
+    login_throttle_class: LoginRateThrottle | None = LoginRateThrottle
+
+    def initial(self: Self, request: Request, *args, **kwargs) -> None:
+        """
+        Method that throttles login attempts before any database query or password hash runs.
+
+        Raises:
+            - Throttled: 429 Too many requests with a Retry-After header.
+        """
+        self.login_throttle: LoginRateThrottle | None = None
+        if self.login_throttle_class is not None:
+            self.login_throttle = self.login_throttle_class()
+            if not self.login_throttle.allow_request(request, self):
+                self.throttled(request, self.login_throttle.wait())
+        super().initial(request, *args, **kwargs)
 
     def post(self: Self, request: Request, *args, **kwargs) -> Response:
         """
@@ -56,10 +95,14 @@ class LoginView(APIView):
             - Incase user creditentials are valid will 201 created response with user data and a new token\
                 other wise will return an error code 404 not found as indication of user credientials failure.
         """
-        # Get User
-        user_serializer: LoginSerializer = self.serializer_class(data=request.data)
+        # Get User, already loaded by IsActiveUser
+        context: dict = {"user": getattr(request, "login_user", None)}
+        user_serializer: LoginSerializer = self.serializer_class(data=request.data, context=context)
         # Validate data
         if user_serializer.is_valid():
+            # Only failed attempts count against the throttle
+            if self.login_throttle is not None:
+                self.login_throttle.refund()
             # Return User data with authentication token.
             return Response(user_serializer.data, status=status.HTTP_201_CREATED)
         # Return Error
@@ -90,8 +133,11 @@ class LogoutView(APIView):
             # Grab the refresh_token
             token: str = serializer.validated_data['refresh_token']
             # Black list the token
-            refresh_token: RefreshToken = RefreshToken(token)
+            refresh_token: RefreshToken = CachedRefreshToken(token)
             refresh_token.blacklist()
+            # Revoke the access token used for this request as well
+            if request.auth is not None and api_settings.JTI_CLAIM in request.auth:
+                revocation_list.revoke(request.auth[api_settings.JTI_CLAIM], request.auth["exp"])
             return Response('User has been logged out.', status=status.HTTP_200_OK)
         # Return Error Response
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
@@ -117,7 +163,11 @@ class RegisterView(APIView):
         # Validate the data
         if serializer.is_valid():
             # Register user using .save() method that will trigger .create() if user instance does not exist.
-            user: User = serializer.save()
+            try:
+                user: User = serializer.save()
+            except ValidationError as error:
+                # Username or email already taken
+                return Response(error.detail, status=status.HTTP_403_FORBIDDEN)
             # Return Response User Creation was Successful
             return Response("User account was successfully created.!", status=status.HTTP_201_CREATED)
         # Incase of error
@@ -139,4 +189,132 @@ def refresh_token_view(request: Request, *args, **kwargs) -> Response:
     """
     # get new tokens for patient
     tokens: dict[str, str] = get_tokens_for_user(request.user)
-    return Response(tokens, status=status.HTTP_202_ACCEPTED)
\ No newline at end of file
+    return Response(tokens, status=status.HTTP_202_ACCEPTED)
+
+
+def parse_request_data(request: HttpRequest) -> dict:
+    """
+    Function used to read the body of a request outside of Django Rest Framework.
+
+    Args:
+        - request (HttpRequest): Request with a JSON, form or multipart body.
+
+    Returns:
+        - Dictionary of the request data, empty in case the body can not be read.
+    """
+    if request.content_type == "application/json":
+        try:
+            data = json.loads(request.body or b"{}")
+        except ValueError:
+            return {}
+        return data if isinstance(data, dict) else {}
+    return request.POST.dict()
+
+
+def not_authenticated_response() -> JsonResponse:
+    """Function that returns the same 401 response Django Rest Framework returns for LoginView"""
+    response: JsonResponse = JsonResponse(
+        {"detail": "Authentication credentials were not provided."},
+        status=status.HTTP_401_UNAUTHORIZED,
+    )
+    response["WWW-Authenticate"] = 'Bearer realm="api"'
+    return response
+
+
+def throttled_response(wait: float) -> JsonResponse:
+    """Function that returns the same 429 response Django Rest Framework returns for a throttled request"""
+    exception: Throttled = Throttled(wait)
+    response: JsonResponse = JsonResponse({"detail": exception.detail}, status=exception.status_code)
+    response["Retry-After"] = str(exception.wait)
+    return response
+
+
+# Protected View
+@method_decorator(csrf_exempt, name="dispatch")
+class AsyncLoginView(View):
+    """
+    Async version of LoginView, the password check runs in the hashing pool.
+    """
+    # Set a serializer for the API View
+    serializer_class: LoginSerializer = LoginSerializer
+
+    async def post(self: Self, request: HttpRequest, *args, **kwargs) -> JsonResponse:
+        """
+        Post API view that is concerned with user login to obtain a new Token in case of success.
+
+        Args:
+            - request (HttpRequest): Data obtain from the post request.
+
+        Returns:
+            - Same responses as LoginView.
+        """
+        data: dict = parse_request_data(request)
+        # Throttle before any database query or password hash runs
+        throttle: LoginRateThrottle = LoginRateThrottle()
+        if not throttle.allow(data.get("email"), throttle.get_ident(request)):
+            return throttled_response(throttle.wait())
+        # Same checks as IsActiveUser
+        if "email" not in data:
+            return not_authenticated_response()
+        user: User | None = await User.objects.aget_by_email(str(data["email"]))
+        if not IsActiveUser().validate_user(user):
+            return not_authenticated_response()
+        # Validation only checks the password of the loaded user, run it in the hashing pool.
+        user_serializer: LoginSerializer = self.serializer_class(data=data, context={"user": user})
+        if not await hashing_pool.run(user_serializer.is_valid):
+            return JsonResponse(user_serializer.errors, status=status.HTTP_404_NOT_FOUND)
+        # Only failed attempts count against the throttle
+        throttle.refund()
+        # Return User data with authentication token.
+        user_data: dict = await sync_to_async(lambda: user_serializer.data)()
+        return JsonResponse(user_data, status=status.HTTP_201_CREATED)
+
+
+@method_decorator(csrf_exempt, name="dispatch")
+class AsyncRegisterView(View):
+    """
+    Async version of RegisterView, the password is hashed in the hashing pool.
+    """
+    # Set a serializer for the API View
+    serializer_class: RegisterationSerializer = RegisterationSerializer
+
+    async def post(self: Self, request: HttpRequest, *args, **kwargs) -> JsonResponse:
+        """
+        Post method to register a new user account
+
+        Args:
+            - request (HttpRequest): Object that contains details require for registering a new account.
+
+        Returns:
+            - Same responses as RegisterView.
+        """
+        serializer: RegisterationSerializer = self.serializer_class(data=parse_request_data(request))
+        # Validate the data
+        if not await sync_to_async(serializer.is_valid)():
+            return JsonResponse(serializer.errors, status=status.HTTP_403_FORBIDDEN)
+        # Hash the password in the pool then create the user with it.
+        password_hash: str = await hashing_pool.run(make_password, serializer.validated_data["password"])
+        try:
+            await sync_to_async(serializer.save)(password_hash=password_hash)
+        except ValidationError as error:
+            # Username or email already taken
+            return JsonResponse(error.detail, status=status.HTTP_403_FORBIDDEN)
+        return JsonResponse(
+            "User account was successfully created.!", status=status.HTTP_201_CREATED, safe=False
+        )
+
+
+# Protected View
+@api_view(["GET"])
+@permission_classes([IsAdminUser])
+def hashing_pool_metrics_view(request: Request, *args, **kwargs) -> Response:
+    """
+    Function that returns the metrics of the password hashing pool.
+
+    Args:
+        - request (object): Request of an admin user.
+
+    Returns:
+        - Response containing workers, queued, running & completed jobs with status 200 ok.
+    """
+    return Response(hashing_pool.stats(), status=status.HTTP_200_OK)